@@ -0,0 +1,73 @@
+"""
+冷启动导入耗时。
+
+每个用例在新的解释器中用 ``-X importtime`` 执行一条导入语句，汇总该语句触发的全部导入的累计耗时，
+记入 extra_info['import_us']；超过预算时失败，预算可以用环境变量 DOCX_IMPORT_BUDGET_SCALE 整体放大。
+
+    python -m pytest benchmarks/bench_import.py --benchmark-json=import.json
+"""
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+SRC = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+_MARKER = '-- docx import --'
+_LINE_RE = re.compile(r'^import time:\s*(\d+) \|\s*(\d+) \| ( *)(\S+)$')
+
+# 导入语句 -> 累计耗时预算（微秒）
+BUDGETS = {
+    'import docx': 5_000,
+    'from docx import UniqueIDGenerator': 20_000,
+    'from docx import ParaIdGenerator': 80_000,
+    'from docx import Docx': 150_000,
+    'from docx import Template': 200_000,
+}
+
+# import docx 之后不应该出现的模块
+_LAZY_MODULES = ('docx.document', 'docx.xml_engine', 'docx.numbering', 'docx.styles', 'lxml')
+
+
+def _budget_scale() -> float:
+    return float(os.environ.get('DOCX_IMPORT_BUDGET_SCALE', '1'))
+
+
+def cold_import(statement: str) -> tuple[int, dict[str, int]]:
+    """在新的解释器中执行 statement，返回 (累计耗时, {顶层模块: 累计耗时})，单位微秒"""
+    code = 'import sys; sys.stderr.write(%r); %s' % (_MARKER + '\n', statement)
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', code],
+                            capture_output=True, text=True, env=env, check=True)
+    stderr = result.stderr
+    modules = {}
+    for line in stderr[stderr.index(_MARKER) + len(_MARKER):].splitlines():
+        m = _LINE_RE.match(line)
+        if m and not m.group(3):
+            modules[m.group(4)] = modules.get(m.group(4), 0) + int(m.group(2))
+    return sum(modules.values()), modules
+
+
+def loaded_modules(statement: str) -> set[str]:
+    code = '%s; import sys; print("\\n".join(sys.modules))' % statement
+    env = dict(os.environ, PYTHONPATH=SRC)
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, env=env, check=True)
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize('statement', list(BUDGETS))
+def bench_cold_import(benchmark, statement):
+    # 先执行一次，保证 .pyc 已生成，计时的是导入本身而不是编译
+    subprocess.run([sys.executable, '-c', statement], env=dict(os.environ, PYTHONPATH=SRC), check=True)
+    total, modules = benchmark(cold_import, statement)
+    benchmark.extra_info['import_us'] = total
+    benchmark.extra_info['modules_us'] = modules
+    budget = BUDGETS[statement] * _budget_scale()
+    assert total <= budget, '%s took %d us, budget %d us: %s' % (statement, total, budget, modules)
+
+
+def bench_package_is_lazy(benchmark):
+    modules = benchmark(loaded_modules, 'import docx')
+    assert not [name for name in _LAZY_MODULES if name in modules]
@@ -0,0 +1,23 @@
+"""ParaIdGenerator 启动（扫描全部部件）基准"""
+import io
+
+import pytest
+
+import synthetic
+from docx.para_id_generator import ParaIdGenerator
+
+
+@pytest.fixture(scope='module')
+def docx_path(tmp_path_factory, document_xml):
+    path = tmp_path_factory.mktemp('docx') / 'synthetic.docx'
+    path.write_bytes(synthetic.docx_bytes(document_xml))
+    return str(path)
+
+
+def bench_startup(measure, docx_path):
+    measure(ParaIdGenerator, docx_path)
+
+
+@pytest.mark.parametrize('workers', [2, 4])
+def bench_startup_threads(measure, docx_path, workers):
+    measure(ParaIdGenerator, docx_path, workers=workers)
@@ -0,0 +1,57 @@
+"""Run / Text 热路径基准"""
+import pytest
+
+import synthetic
+from docx import xml_engine
+from docx.run import Run
+from docx.text import Text
+
+
+@pytest.fixture(scope='module', params=[False, True], ids=['latin', 'cjk'])
+def run_xml(request):
+    text = '甲方应当在约定期限内付款' if request.param else 'the quick brown fox jumps over'
+    return synthetic.run_xml(text, cjk=request.param)
+
+
+def bench_run_from_xml_str(measure, run_xml):
+    measure(Run.from_xml_str, run_xml)
+
+
+def bench_run_text_setter(measure, run_xml):
+    run = Run.from_xml_str(run_xml)
+
+    def set_text():
+        run.text = '乙方承担违约责任'
+    measure(set_text)
+
+
+def bench_run_texts_setter(measure, run_xml):
+    run = Run.from_xml_str(run_xml)
+
+    def set_texts():
+        run.texts = [Text('甲方'), Text(' and ', preserve_space=True), Text('乙方')]
+    measure(set_texts)
+
+
+def bench_run_rpr_setter(measure, run_xml):
+    run = Run.from_xml_str(run_xml)
+    rpr = run.rpr.replace(bold=False, color='FF0000')
+
+    def set_rpr():
+        run.rpr = rpr
+    measure(set_rpr)
+
+
+def bench_text_construction(measure):
+    measure(Text, '合同条款 contract clause', True)
+
+
+def bench_document_runs(measure, document_xml):
+    """用当前的 XML 引擎解析整个 document.xml 并读取每个 Run 的文本和格式"""
+    def walk():
+        root = xml_engine.fromstring(document_xml)
+        for element in root.iter('{%s}r' % synthetic.W_NS):
+            run = Run.load_from_xml(element)
+            run.text
+            run.rpr
+    measure(walk)
@@ -0,0 +1,23 @@
+"""RunProperties 解析与序列化基准"""
+import pytest
+
+import synthetic
+from docx import xml_engine
+from docx.run_properties import RunProperties
+
+
+@pytest.fixture(scope='module', params=[False, True], ids=['latin', 'cjk'])
+def rpr_element(request):
+    return xml_engine.fromstring(synthetic.rpr_xml(cjk=request.param))
+
+
+def bench_load_from_xml(measure, rpr_element):
+    measure(RunProperties.load_from_xml, rpr_element)
+
+
+def bench_to_xml_element(measure, rpr_element):
+    measure(RunProperties.load_from_xml(rpr_element).to_xml_element)
+
+
+def bench_to_xml_bytes(measure, rpr_element):
+    measure(RunProperties.load_from_xml(rpr_element).to_xml_bytes)
@@ -0,0 +1,93 @@
+"""
+UniqueIDGenerator 分配吞吐量基准。
+
+    python benchmarks/bench_unique_id_generator.py
+    python -m pytest benchmarks/bench_unique_id_generator.py
+
+分别在已有 1k / 100k / 1M 个 ID 的情况下，测量构造、逐个分配、批量预留和批量登记的速度。
+"""
+import os
+import random
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from docx.utils.unique_id_generator import MAX_ID, UniqueIDGenerator  # noqa: E402
+
+EXISTING_SIZES = (1_000, 100_000, 1_000_000)
+ALLOCATIONS = 100_000
+
+
+def existing_ids(n: int, seed: int = 0) -> list[str]:
+    rng = random.Random(seed)
+    return ['%08X' % rng.randint(1, MAX_ID) for _ in range(n)]
+
+
+def bench(n: int) -> dict:
+    ids = existing_ids(n)
+
+    start = time.perf_counter()
+    generator = UniqueIDGenerator(ids)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(ALLOCATIONS):
+        generator.generate_unique_id()
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    generator.reserve(ALLOCATIONS)
+    bulk = time.perf_counter() - start
+
+    state = generator.to_bytes()
+    start = time.perf_counter()
+    UniqueIDGenerator.from_bytes(state)
+    restore = time.perf_counter() - start
+
+    return {
+        'existing': n,
+        'build_s': build,
+        'generate_per_s': ALLOCATIONS / single,
+        'reserve_per_s': ALLOCATIONS / bulk,
+        'state_bytes': len(state),
+        'restore_s': restore,
+    }
+
+
+@pytest.fixture(scope='module', params=EXISTING_SIZES, ids=lambda n: '%d-existing' % n)
+def ids(request):
+    return existing_ids(request.param)
+
+
+def bench_build(measure, ids):
+    measure(UniqueIDGenerator, ids)
+
+
+def bench_generate(measure, ids):
+    generator = UniqueIDGenerator(ids)
+    measure(generator.generate_unique_id)
+
+
+def bench_reserve_1000(measure, ids):
+    generator = UniqueIDGenerator(ids)
+    measure(generator.reserve, 1000)
+
+
+def bench_update_1000(measure, ids):
+    generator = UniqueIDGenerator(ids)
+    measure(generator.update, existing_ids(1000, seed=1))
+
+
+def main():
+    print(f"{'existing':>10} {'build':>9} {'generate/s':>12} {'reserve/s':>12} {'state':>10} {'restore':>9}")
+    for n in EXISTING_SIZES:
+        r = bench(n)
+        print(f"{r['existing']:>10} {r['build_s']:>8.3f}s {r['generate_per_s']:>12,.0f} "
+              f"{r['reserve_per_s']:>12,.0f} {r['state_bytes']:>10,} {r['restore_s']:>8.4f}s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,55 @@
+"""
+比较两份 --benchmark-json 结果，耗时或内存峰值回退超过阈值时以非零状态退出。
+
+    python benchmarks/compare.py baseline.json current.json --max-time=10% --max-memory=10%
+"""
+import argparse
+import json
+import sys
+
+
+def _threshold(value: str) -> float:
+    return float(value.rstrip('%')) / 100
+
+
+def _load(path: str) -> dict:
+    with open(path, encoding='utf-8') as fh:
+        data = json.load(fh)
+    return {bench['fullname']: bench for bench in data['benchmarks']}
+
+
+def compare(baseline: dict, current: dict, max_time: float, max_memory: float) -> list[str]:
+    regressions = []
+    for name, bench in sorted(current.items()):
+        base = baseline.get(name)
+        if base is None:
+            continue
+        old, new = base['stats']['median'], bench['stats']['median']
+        time_change = (new - old) / old if old else 0.0
+        old_mem = base.get('extra_info', {}).get('tracemalloc_peak_bytes')
+        new_mem = bench.get('extra_info', {}).get('tracemalloc_peak_bytes')
+        mem_change = (new_mem - old_mem) / old_mem if old_mem and new_mem is not None else 0.0
+        flag = ''
+        if time_change > max_time or mem_change > max_memory:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        print('%-80s time %+7.1f%%  memory %+7.1f%%%s' % (name, time_change * 100, mem_change * 100, flag))
+    return regressions
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('baseline')
+    parser.add_argument('current')
+    parser.add_argument('--max-time', type=_threshold, default=0.10)
+    parser.add_argument('--max-memory', type=_threshold, default=0.10)
+    args = parser.parse_args(argv)
+    regressions = compare(_load(args.baseline), _load(args.current), args.max_time, args.max_memory)
+    if regressions:
+        print('%d benchmark(s) regressed' % len(regressions), file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""
+性能基准（pytest-benchmark）。
+
+    python -m pytest benchmarks --benchmark-json=bench.json
+    python -m pytest benchmarks --bench-sizes=1,10,100 --benchmark-json=bench.json
+    DOCX_XML_ENGINE=stdlib python -m pytest benchmarks --benchmark-json=stdlib.json
+    python benchmarks/compare.py baseline.json bench.json --max-time=10% --max-memory=10%
+
+每个基准都会在 extra_info 中记录一次调用的 tracemalloc 峰值（tracemalloc_peak_bytes）
+和所用的 XML 引擎（xml_engine），随 --benchmark-json 一起写出，compare.py 同时比较耗时和内存。
+默认的文档大小覆盖多个数量级，便于看出耗时随大小的变化。
+"""
+import os
+import sys
+import tracemalloc
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import synthetic  # noqa: E402
+from docx import xml_engine  # noqa: E402
+
+
+def pytest_addoption(parser):
+    parser.addoption('--bench-sizes', default='0.25,1,4',
+                     help='comma separated document.xml sizes in MB (e.g. 1,10,100)')
+
+
+def pytest_generate_tests(metafunc):
+    if 'size_mb' in metafunc.fixturenames:
+        sizes = [float(s) for s in metafunc.config.getoption('--bench-sizes').split(',')]
+        metafunc.parametrize('size_mb', sizes, ids=['%gMB' % s for s in sizes], scope='session')
+
+
+@pytest.fixture(params=[False, True], ids=['latin', 'cjk'], scope='session')
+def cjk(request):
+    return request.param
+
+
+@pytest.fixture(params=[1, 16], ids=['low-runs', 'high-runs'], scope='session')
+def runs_per_paragraph(request):
+    return request.param
+
+
+_documents = {}
+
+
+@pytest.fixture(scope='session')
+def document_xml(size_mb, runs_per_paragraph, cjk):
+    key = (size_mb, runs_per_paragraph, cjk)
+    if key not in _documents:
+        _documents[key] = synthetic.document_xml(size_mb, runs_per_paragraph, cjk)
+    return _documents[key]
+
+
+@pytest.fixture
+def measure(benchmark):
+    """
+    先单独执行一次并用 tracemalloc 记录内存峰值，再交给 benchmark 计时。
+    """
+    def run(func, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            func(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info['tracemalloc_peak_bytes'] = peak
+        benchmark.extra_info['xml_engine'] = xml_engine.engine.name
+        return benchmark(func, *args, **kwargs)
+    return run
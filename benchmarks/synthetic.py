@@ -0,0 +1,94 @@
+"""
+基准测试用的合成文档生成器。
+
+文档大小按 document.xml 的字节数控制；每段的 Run 数量决定 Run 密度，
+cjk=True 时正文为中文并使用 eastAsia 字体。
+"""
+import io
+import random
+import zipfile
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W14_NS = 'http://schemas.microsoft.com/office/word/2010/wordml'
+
+_LATIN_WORDS = ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit')
+_CJK_WORDS = ('合同', '甲方', '乙方', '条款', '违约', '责任', '付款', '期限', '约定', '争议')
+
+_RPR = (
+    '<w:rPr><w:rFonts w:ascii="Times New Roman" w:hAnsi="Times New Roman" w:eastAsia="{east}" w:hint="eastAsia"/>'
+    '<w:b/><w:color w:val="1F3864"/><w:sz w:val="24"/><w:szCs w:val="24"/></w:rPr>'
+)
+
+
+def run_xml(text: str = 'lorem ipsum', cjk: bool = False, standalone: bool = True) -> str:
+    rpr = _RPR.format(east='宋体' if cjk else 'Calibri')
+    ns = ' xmlns:w="%s"' % W_NS if standalone else ''
+    return '<w:r%s>%s<w:t xml:space="preserve">%s</w:t></w:r>' % (ns, rpr, text)
+
+
+def rpr_xml(cjk: bool = False) -> str:
+    return _RPR.format(east='宋体' if cjk else 'Calibri').replace('<w:rPr>', '<w:rPr xmlns:w="%s">' % W_NS, 1)
+
+
+def paragraph_xml(index: int, runs: int, rng: random.Random, cjk: bool = False) -> str:
+    words = _CJK_WORDS if cjk else _LATIN_WORDS
+    sep = '' if cjk else ' '
+    body = ''.join(
+        run_xml(sep.join(rng.choice(words) for _ in range(6)) + sep, cjk, standalone=False)
+        for _ in range(runs)
+    )
+    return '<w:p w14:paraId="%08X" w14:textId="77777777"><w:pPr><w:pStyle w:val="Normal"/></w:pPr>%s</w:p>' % (
+        index + 1, body)
+
+
+def document_xml(size_mb: float, runs_per_paragraph: int = 4, cjk: bool = False, seed: int = 0) -> bytes:
+    """生成约 size_mb MB 的 document.xml"""
+    rng = random.Random(seed)
+    target = int(size_mb * 1024 * 1024)
+    head = ('<?xml version="1.0" encoding="UTF-8" standalone="yes"?>'
+            '<w:document xmlns:w="%s" xmlns:w14="%s"><w:body>' % (W_NS, W14_NS)).encode('utf-8')
+    tail = b'<w:sectPr/></w:body></w:document>'
+    chunks = [head]
+    size = len(head) + len(tail)
+    index = 0
+    while size < target:
+        chunk = paragraph_xml(index, runs_per_paragraph, rng, cjk).encode('utf-8')
+        chunks.append(chunk)
+        size += len(chunk)
+        index += 1
+    chunks.append(tail)
+    return b''.join(chunks)
+
+
+def docx_bytes(document: bytes, headers: int = 2) -> bytes:
+    """把 document.xml 打包为最小的 .docx"""
+    overrides = ''.join(
+        '<Override PartName="/word/header%d.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.header+xml"/>' % (i + 1)
+        for i in range(headers))
+    rels = ''.join(
+        '<Relationship Id="rId%d" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/header" '
+        'Target="header%d.xml"/>' % (i + 1, i + 1) for i in range(headers))
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr('[Content_Types].xml',
+                    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+                    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+                    '<Default Extension="xml" ContentType="application/xml"/>'
+                    '<Override PartName="/word/document.xml" '
+                    'ContentType="application/vnd.openxmlformats-officedocument.wordprocessingml.document.main+xml"/>'
+                    '%s</Types>' % overrides)
+        zf.writestr('_rels/.rels',
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '<Relationship Id="rId1" '
+                    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+                    'Target="word/document.xml"/></Relationships>')
+        zf.writestr('word/_rels/document.xml.rels',
+                    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+                    '%s</Relationships>' % rels)
+        zf.writestr('word/document.xml', document)
+        for i in range(headers):
+            zf.writestr('word/header%d.xml' % (i + 1),
+                        '<w:hdr xmlns:w="%s" xmlns:w14="%s"><w:p w14:paraId="7%07X"><w:r><w:t>header</w:t>'
+                        '</w:r></w:p></w:hdr>' % (W_NS, W14_NS, i))
+    return buffer.getvalue()
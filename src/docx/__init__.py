@@ -0,0 +1,61 @@
+"""
+docx：直接读写 .docx 压缩包的文档编辑工具。
+
+公开接口按需加载（PEP 562）：``import docx`` 只执行本文件，
+解析器、编号和样式引擎、XML 引擎（包括 lxml）都在第一次用到对应名称时才导入。
+
+    import docx
+
+    with docx.Docx.open('a.docx') as doc:
+        ...
+
+命令行入口见 ``python -m docx batch --help``。
+"""
+import importlib
+
+# 公开名称 -> 所在子模块
+_EXPORTS = {
+    'Docx': 'document',
+    'diff': 'document',
+    'Package': 'package',
+    'Part': 'package',
+    'Paragraph': 'paragraph',
+    'Run': 'run',
+    'Text': 'text',
+    'RunProperties': 'run_properties',
+    'Font': 'font',
+    'ParagraphView': 'stream',
+    'RunSpan': 'stream',
+    'iter_paragraphs': 'stream',
+    'ParaIdGenerator': 'para_id_generator',
+    'UniqueIDGenerator': 'utils.unique_id_generator',
+    'CommentAnchor': 'comments',
+    'CommentWriter': 'comments',
+    'Numbering': 'numbering',
+    'ListLabels': 'numbering',
+    'StyleSheet': 'styles',
+    'Match': 'search',
+    'Searcher': 'search',
+    'ParagraphChange': 'compare',
+    'RunChange': 'compare',
+    'diff_documents': 'compare',
+    'ParseCache': 'parse_cache',
+    'Template': 'template',
+    'Placeholder': 'template',
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    value = getattr(importlib.import_module('.' + module, __name__), name)
+    # 之后的访问直接命中模块字典，不再经过 __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_EXPORTS))
@@ -0,0 +1,225 @@
+"""
+asyncio 入口的公共部分：有界线程池、同时处理的文档数限制、异步字节流和取消。
+
+    configure(max_workers=4, max_in_flight=8)
+    doc = await Docx.open_async(request.content)
+    ...
+    await doc.save_async(response)
+
+解压、解析和序列化都在共享的有界线程池中执行，事件循环只负责搬运字节；
+同时在途的文档数由每个事件循环各自的信号量限制，超出的请求在 await 处排队。
+线程池中的解析仍受 GIL 约束，但每个任务执行期间事件循环照常调度其他协程。
+"""
+import asyncio
+import inspect
+import io
+import os
+import tempfile
+import threading
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from .package import write_atomic
+
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_MAX_IN_FLIGHT = 8
+
+# 读取异步流时每次读取的字节数；超过 SPOOL_SIZE 的上传暂存到临时文件
+CHUNK_SIZE = 1 << 16
+SPOOL_SIZE = 8 << 20
+
+_lock = threading.Lock()
+_executor: ThreadPoolExecutor = None
+_max_workers = DEFAULT_MAX_WORKERS
+_max_in_flight = DEFAULT_MAX_IN_FLIGHT
+_semaphores: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+class SaveCancelled(Exception):
+    """保存过程中检测到取消请求"""
+
+
+def configure(max_workers: int = None, max_in_flight: int = None):
+    """
+    设置线程池大小和同时在途的文档数，应在第一次调用异步入口之前设置。
+    已创建的线程池会在当前任务完成后关闭并按新大小重建。
+    """
+    global _executor, _max_workers, _max_in_flight
+    with _lock:
+        if max_workers is not None:
+            _max_workers = max_workers
+            if _executor is not None:
+                _executor.shutdown(wait=False)
+                _executor = None
+        if max_in_flight is not None:
+            _max_in_flight = max_in_flight
+            _semaphores.clear()
+
+
+def executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix='docx-io')
+        return _executor
+
+
+@asynccontextmanager
+async def in_flight():
+    """占用一个在途文档名额，名额用完时在此等待"""
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(_max_in_flight)
+    async with semaphore:
+        yield
+
+
+async def offload(func, *args, cleanup=None):
+    """
+    在线程池中执行 func(*args) 并等待结果。
+
+    等待中被取消时，尚未开始的任务直接撤销；已经在执行的任务无法中断，
+    结束后把结果交给 cleanup（例如关闭已打开的文档），然后继续抛出 CancelledError。
+    """
+    future = executor().submit(func, *args)
+    try:
+        return await asyncio.wrap_future(future)
+    except asyncio.CancelledError:
+        if not future.cancel() and cleanup is not None:
+            future.add_done_callback(lambda f: f.cancelled() or f.exception() or cleanup(f.result()))
+        raise
+
+
+def is_async_reader(source) -> bool:
+    return hasattr(source, '__aiter__') or inspect.iscoroutinefunction(getattr(source, 'read', None))
+
+
+def is_async_writer(target) -> bool:
+    write = getattr(target, 'write', None)
+    return inspect.iscoroutinefunction(write) or (write is not None and hasattr(target, 'drain'))
+
+
+async def spool(source) -> tempfile.SpooledTemporaryFile:
+    """
+    把异步字节流（带 async read() 的流，或产生 bytes 的异步迭代器）读入临时文件，
+    小文件留在内存中，写入磁盘的部分在线程池中完成。返回定位到开头的文件对象。
+    """
+    spooled = tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE)
+    try:
+        pending = []
+        size = 0
+        async for chunk in _iter_chunks(source):
+            pending.append(chunk)
+            size += len(chunk)
+            if size >= CHUNK_SIZE * 16:
+                await offload(spooled.write, b''.join(pending))
+                pending, size = [], 0
+        if pending:
+            await offload(spooled.write, b''.join(pending))
+        spooled.seek(0)
+    except BaseException:
+        spooled.close()
+        raise
+    return spooled
+
+
+async def _iter_chunks(source):
+    if hasattr(source, '__aiter__'):
+        async for chunk in source:
+            yield bytes(chunk)
+        return
+    while True:
+        chunk = await source.read(CHUNK_SIZE)
+        if not chunk:
+            return
+        yield bytes(chunk)
+
+
+async def drain(fileobj, target):
+    """把 fileobj 的内容分块写入异步流 target，读取在线程池中完成"""
+    fileobj.seek(0)
+    while True:
+        chunk = await offload(fileobj.read, CHUNK_SIZE * 16)
+        if not chunk:
+            return
+        result = target.write(chunk)
+        if inspect.isawaitable(result):
+            await result
+        elif hasattr(target, 'drain'):
+            await target.drain()
+
+
+class CancellableWriter:
+    """
+    包装保存目标的二进制流，每次写入前检查取消标志。
+
+    压缩包、部件序列化都按块写入，因此取消在下一块写入时生效，抛出 SaveCancelled。
+    """
+
+    def __init__(self, target, cancel: threading.Event):
+        self._target = target
+        self._cancel = cancel
+
+    def write(self, data):
+        if self._cancel.is_set():
+            raise SaveCancelled()
+        return self._target.write(data)
+
+    def __getattr__(self, name):
+        return getattr(self._target, name)
+
+
+def save_to(save, target, cancel: threading.Event):
+    """
+    在工作线程中执行 save(fileobj)，target 为路径或文件对象。
+    目标为路径时先写入同目录下的临时文件再替换（见 package.write_atomic），
+    取消或出错后目标保持原样，也可以原地保存到打开时的文件。
+    """
+    if isinstance(target, (str, os.PathLike)):
+        write_atomic(target, lambda fh: save(CancellableWriter(fh, cancel)))
+    else:
+        save(CancellableWriter(target, cancel))
+
+
+async def open_document(cls, source, cache=None, parse: bool = True):
+    """
+    Docx.open_async 的实现：在线程池中调用 cls._open_parsed。
+    为异步流和 bytes 创建的文件对象归文档所有，在 Docx.close 时关闭。
+    """
+    async with in_flight():
+        owned = None
+        if is_async_reader(source):
+            source = owned = await spool(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            source = owned = io.BytesIO(source)
+        try:
+            return await offload(cls._open_parsed, source, cache, parse, owned is not None, cleanup=cls.close)
+        except asyncio.CancelledError:
+            # 任务尚未开始时没有文档接管它；已经打开的文档由 cleanup 关闭，重复关闭没有影响
+            if owned is not None:
+                owned.close()
+            raise
+
+
+async def save_package(package, target):
+    """Docx.save_async 的实现：在线程池中调用 package.save，异步流目标先写入临时文件再分块发送"""
+    if package.is_source(target):
+        raise ValueError("Cannot save a package into the file object it is read from")
+    cancel = threading.Event()
+    async with in_flight():
+        if not is_async_writer(target):
+            try:
+                await offload(save_to, package.save, target, cancel)
+            except asyncio.CancelledError:
+                cancel.set()
+                raise
+            return
+        with tempfile.SpooledTemporaryFile(max_size=SPOOL_SIZE) as buffer:
+            try:
+                await offload(save_to, package.save, buffer, cancel)
+                await drain(buffer, target)
+            except asyncio.CancelledError:
+                cancel.set()
+                raise
@@ -0,0 +1,306 @@
+"""
+批量处理整个目录（或清单）中的 .docx 文件。
+
+    python -m docx batch ./drop --op extract-text --workers 8 --output results.jsonl
+
+每个文档在进程池中独立处理，单个文件出错不会影响其余文件；
+结果按完成顺序以 JSONL 逐行写出，结束时在 stderr 输出吞吐量和耗时分位数。
+"""
+import argparse
+import functools
+import importlib
+import json
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import FIRST_COMPLETED, BrokenExecutor, ProcessPoolExecutor, wait
+
+from .document import Docx
+from .para_id_generator import ParaIdGenerator
+from .font import Font
+from .tags import W_P, W14_PARA_ID
+
+OPERATIONS = {}
+
+
+def operation(name: str):
+    """注册一个按文档执行的操作：func(path, options) -> dict"""
+    def register(func):
+        OPERATIONS[name] = func
+        return func
+    return register
+
+
+def _output_path(path: str, options: dict) -> str:
+    """
+    输出路径保持输入相对于 input_root 的目录结构，不同目录下的同名文件不会相互覆盖；
+    不在 input_root 之下的文件按其绝对路径放到 out_dir 中。
+    """
+    out_dir = options.get('out_dir')
+    if not out_dir:
+        raise ValueError("this operation requires --out-dir")
+    path = os.path.abspath(path)
+    try:
+        relative = os.path.relpath(path, os.path.abspath(options.get('input_root') or os.curdir))
+    except ValueError:
+        # Windows 上位于不同盘符
+        relative = os.pardir
+    if relative == os.pardir or relative.startswith(os.pardir + os.sep):
+        drive, tail = os.path.splitdrive(path)
+        relative = os.path.join(drive.strip(':\\/'), tail.lstrip('\\/'))
+    output = os.path.join(out_dir, relative)
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    return output
+
+
+@operation('extract-text')
+def extract_text(path: str, options: dict) -> dict:
+    with Docx.open(path) as docx:
+        texts = [view.text for view in docx.iter_paragraphs()]
+    return {'paragraphs': len(texts), 'text': '\n'.join(texts)}
+
+
+@operation('scan-para-ids')
+def scan_para_ids(path: str, options: dict) -> dict:
+    generator = ParaIdGenerator(path)
+    return {
+        'ids': len(generator.generator),
+        'parts': {name: stats.count for name, stats in generator.part_stats.items()},
+    }
+
+
+@operation('rewrite-para-ids')
+def rewrite_para_ids(path: str, options: dict) -> dict:
+    """为缺少或重复 w14:paraId 的正文段落分配新ID"""
+    with Docx.open(path) as docx:
+        generator = docx.para_ids
+        seen = set()
+        rewritten = 0
+        for p in docx.document.element.iter(W_P):
+            para_id = p.get(W14_PARA_ID)
+            if para_id is None or para_id in seen:
+                para_id = generator.generate_unique_id()
+                p.set(W14_PARA_ID, para_id)
+                rewritten += 1
+            seen.add(para_id)
+        output = _output_path(path, options)
+        docx.save(output)
+    return {'rewritten': rewritten, 'output': output}
+
+
+@operation('apply-run-format')
+def apply_run_format(path: str, options: dict) -> dict:
+    """把 options['format'] 中的 RunProperties 字段应用到正文的每个 Run，其余格式保持不变"""
+    changes = dict(options.get('format') or {})
+    if isinstance(changes.get('font'), dict):
+        changes['font'] = Font(**changes['font'])
+    with Docx.open(path) as docx:
+        runs = 0
+        for paragraph in docx.paragraphs:
+            for run in paragraph.runs:
+                run.update_rpr(**changes)
+                runs += 1
+        output = _output_path(path, options)
+        docx.save(output)
+    return {'runs': runs, 'output': output}
+
+
+def resolve_operation(name: str):
+    """内置操作名，或 'module:function' 形式的自定义操作"""
+    if name in OPERATIONS:
+        return OPERATIONS[name]
+    module_name, sep, func_name = name.partition(':')
+    if not sep:
+        raise ValueError("unknown operation %r" % name)
+    return getattr(importlib.import_module(module_name), func_name)
+
+
+def _process_chunk(tasks: list) -> list[dict]:
+    return [_process(task) for task in tasks]
+
+
+def _process(task) -> dict:
+    """进程池中执行的单个任务，异常被捕获并作为结果返回"""
+    op_name, path, options = task
+    start = time.perf_counter()
+    record = {'path': path, 'ok': True}
+    try:
+        record['bytes'] = os.path.getsize(path)
+        record['result'] = resolve_operation(op_name)(path, options)
+    except Exception as e:
+        record['ok'] = False
+        record['error'] = '%s: %s' % (type(e).__name__, e)
+        record['traceback'] = traceback.format_exc(limit=5)
+    record['seconds'] = time.perf_counter() - start
+    return record
+
+
+def iter_inputs(source: str):
+    """目录中的全部 .docx，或清单文件中的路径（每行一个路径，或带 path 字段的 JSON）"""
+    if os.path.isdir(source):
+        for dirpath, _, filenames in os.walk(source):
+            for filename in sorted(filenames):
+                if filename.lower().endswith('.docx') and not filename.startswith('~$'):
+                    yield os.path.join(dirpath, filename)
+        return
+    with open(source, encoding='utf-8') as fh:
+        for line in fh:
+            line = line.strip()
+            if not line:
+                continue
+            yield json.loads(line)['path'] if line.startswith('{') else line
+
+
+def _chunks(items, size: int):
+    chunk = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def _crashed(task, error: BaseException) -> dict:
+    """工作进程异常退出时，为无法得到结果的任务生成失败记录"""
+    return {'path': task[1], 'ok': False, 'error': '%s: %s' % (type(error).__name__, error), 'seconds': 0.0}
+
+
+def _iter_completed(make_pool, chunks, limit: int):
+    """
+    提交任务并按完成顺序产生结果，同时在途的任务块不超过 limit 个，
+    慢文件不会阻塞其后已完成文件的输出，也不会一次把整个清单读入内存。
+
+    工作进程异常退出（如被 OOM 终止）时整个进程池失效，在途的任务块都拿不到结果。
+    此时换一个新进程池，把这些任务块逐个重新执行以找出导致崩溃的任务块，
+    只有它的文件记为失败，其余任务照常继续。
+    """
+    pool = make_pool()
+    try:
+        pending = {}
+        chunks = iter(chunks)
+        exhausted = False
+        while True:
+            while not exhausted and len(pending) < limit:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    exhausted = True
+                else:
+                    pending[pool.submit(_process_chunk, chunk)] = chunk
+            if not pending:
+                return
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            suspects = []
+            for future in done:
+                chunk = pending.pop(future)
+                try:
+                    records = future.result()
+                except BrokenExecutor:
+                    suspects.append(chunk)
+                    continue
+                yield from records
+            if not suspects:
+                continue
+            # 进程池已失效，其余在途的任务块同样需要重新执行
+            suspects += pending.values()
+            pending.clear()
+            pool.shutdown(wait=False)
+            pool = make_pool()
+            for chunk in suspects:
+                try:
+                    records = pool.submit(_process_chunk, chunk).result()
+                except BrokenExecutor as e:
+                    records = [_crashed(task, e) for task in chunk]
+                    pool.shutdown(wait=False)
+                    pool = make_pool()
+                yield from records
+    finally:
+        pool.shutdown()
+
+
+def _percentile(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(round(q * (len(values) - 1))))]
+
+
+def run_batch(source: str, op: str, workers: int = None, chunksize: int = 1,
+              options: dict = None, output=None) -> dict:
+    """
+    对 source 中的每个文档执行 op，结果按完成顺序逐行写入 output（文本流），返回汇总统计。
+    chunksize 为每次提交给工作进程的文档数。
+    """
+    options = dict(options or {})
+    if options.get('out_dir'):
+        os.makedirs(options['out_dir'], exist_ok=True)
+    options.setdefault('input_root', source if os.path.isdir(source) else os.path.dirname(os.path.abspath(source)))
+    resolve_operation(op)
+    tasks = ((op, path, options) for path in iter_inputs(source))
+    limit = 2 * (workers or os.cpu_count() or 1)
+
+    durations = []
+    total_bytes = 0
+    failed = 0
+    start = time.perf_counter()
+    make_pool = functools.partial(ProcessPoolExecutor, max_workers=workers)
+    for record in _iter_completed(make_pool, _chunks(tasks, chunksize), limit):
+        durations.append(record['seconds'])
+        total_bytes += record.get('bytes', 0)
+        if not record['ok']:
+            failed += 1
+        if output is not None:
+            output.write(json.dumps(record, ensure_ascii=False) + '\n')
+    elapsed = time.perf_counter() - start
+
+    return {
+        'documents': len(durations),
+        'failed': failed,
+        'seconds': elapsed,
+        'docs_per_s': len(durations) / elapsed if elapsed else 0.0,
+        'mb_per_s': total_bytes / 1e6 / elapsed if elapsed else 0.0,
+        'p50_s': _percentile(durations, 0.50),
+        'p95_s': _percentile(durations, 0.95),
+    }
+
+
+def _parse_option(value: str):
+    key, sep, raw = value.partition('=')
+    if not sep:
+        raise argparse.ArgumentTypeError("expected key=value, got %r" % value)
+    try:
+        return key, json.loads(raw)
+    except ValueError:
+        return key, raw
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m docx')
+    commands = parser.add_subparsers(dest='command', required=True)
+    batch = commands.add_parser('batch', help='run an operation over many .docx files')
+    batch.add_argument('source', help='directory of .docx files, or a manifest file')
+    batch.add_argument('--op', required=True,
+                       help='one of %s, or module:function' % ', '.join(sorted(OPERATIONS)))
+    batch.add_argument('--workers', type=int, default=None)
+    batch.add_argument('--chunksize', type=int, default=1, help='documents per worker task')
+    batch.add_argument('--output', default='-', help='JSONL output file (default: stdout)')
+    batch.add_argument('--out-dir', help='directory for rewritten documents')
+    batch.add_argument('--option', type=_parse_option, action='append', default=[],
+                       help='operation option as key=value (value may be JSON)')
+    args = parser.parse_args(argv)
+
+    options = dict(args.option)
+    if args.out_dir:
+        options['out_dir'] = args.out_dir
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        stats = run_batch(args.source, args.op, args.workers, args.chunksize, options, output)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print("%(documents)d documents, %(failed)d failed in %(seconds).2fs: "
+          "%(docs_per_s).1f docs/s, %(mb_per_s).2f MB/s, p50 %(p50_s).3fs, p95 %(p95_s).3fs" % stats,
+          file=sys.stderr)
+    return 1 if stats['failed'] else 0
@@ -0,0 +1,287 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape, quoteattr
+
+from . import xml_engine
+from .golbal import NAMESPACES, read_template
+from .para_id_generator import ParaIdGenerator
+from .paragraph import _RUN_CONTAINERS
+from .package import RT_COMMENTS, RT_COMMENTS_EXTENDED
+from .tags import (
+    W_COMMENT, W_COMMENT_RANGE_END, W_COMMENT_RANGE_START, W_COMMENT_REFERENCE, W_ID, W_P, W_PPR, W_R,
+    W14_PARA_ID,
+)
+
+CT_COMMENTS = 'application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml'
+CT_COMMENTS_EXTENDED = 'application/vnd.openxmlformats-officedocument.wordprocessingml.commentsExtended+xml'
+
+# 追加到 comments.xml / commentsExtended.xml 的片段用到的前缀
+_COMMENTS_PREFIXES = ('w', 'w14')
+_EXTENDED_PREFIXES = ('w15',)
+
+
+@dataclass(frozen=True)
+class CommentAnchor:
+    """
+    批注的锚点范围。
+
+    段落用 w14:paraId（str）或在正文中的序号（int）指定；
+    start_run / end_run 为段落内 Run 的序号（end_run 包含在内），
+    为 None 时分别表示段落开头和段落末尾。
+    """
+    paragraph: object
+    end_paragraph: object = None
+    start_run: int = None
+    end_run: int = None
+
+
+@dataclass(frozen=True)
+class _PendingComment:
+    comment_id: int
+    anchor: CommentAnchor
+    text: str
+    author: str
+    initials: str
+    date: str
+
+
+def _iter_runs_with_parent(element: xml_engine.Element):
+    for child in element:
+        if child.tag == W_R:
+            yield element, child
+        elif child.tag in _RUN_CONTAINERS:
+            yield from _iter_runs_with_parent(child)
+
+
+def max_comment_id(part) -> int:
+    """
+    批注部件中最大的 w:id，没有批注时为 -1。
+    已解析的部件读取树，否则流式读取（包括尚未保存的追加片段）。
+    """
+    max_id = -1
+    if part.loaded:
+        elements = part.readonly_element.iter(W_COMMENT)
+    else:
+        elements = _iter_comments(part)
+    for element in elements:
+        try:
+            max_id = max(max_id, int(element.get(W_ID)))
+        except (TypeError, ValueError):
+            pass
+    return max_id
+
+
+def _iter_comments(part):
+    with part.open() as fh:
+        for _, element in xml_engine.iterparse(fh, events=('end',), tag=W_COMMENT):
+            if element.tag == W_COMMENT:
+                yield element
+                element.clear()
+
+
+class CommentWriter:
+    """
+    批量插入批注。
+
+    ``add`` 只登记批注并分配批注ID；``flush`` 时先检查全部锚点和批注部件的命名空间，
+    任何一项不满足时抛出 ValueError，文档和段落ID都保持原样；检查通过后一次性分配段落ID，
+    在一次遍历中把所有 commentRangeStart / commentRangeEnd / commentReference
+    写入 document.xml，并把批注以片段追加到 comments.xml 和 commentsExtended.xml，
+    不解析这两个部件已有的内容。总开销为 O(文档 + 批注)。
+
+    date 为不带时区的 datetime 时按 UTC 处理，带时区的先换算为 UTC。
+
+    批注ID和段落ID取自 ``Docx.comment_ids`` / ``Docx.para_ids``，
+    同一文档上的多个 CommentWriter 不会分配重复的ID。
+    """
+
+    def __init__(self, docx, author: str, initials: str = "", date: datetime = None,
+                 id_generator: ParaIdGenerator = None):
+        if docx.package is None:
+            raise ValueError("CommentWriter needs a Docx opened from a .docx package")
+        self._docx = docx
+        self._author = author
+        self._initials = initials
+        self._date = date
+        self._id_generator = id_generator
+        self._pending: list[_PendingComment] = []
+
+    def _comments_part(self):
+        part = self._docx.comments
+        if part is None:
+            part = self._docx.package.add_part(
+                '/word/comments.xml', CT_COMMENTS, read_template('comments.xml'),
+                self._docx.document, RT_COMMENTS)
+        return part
+
+    def _existing_comments_extended_part(self):
+        parts = self._docx.package.related_parts(self._docx.document, RT_COMMENTS_EXTENDED)
+        return parts[0] if parts else None
+
+    def _comments_extended_part(self):
+        part = self._existing_comments_extended_part()
+        if part is not None:
+            return part
+        return self._docx.package.add_part(
+            '/word/commentsExtended.xml', CT_COMMENTS_EXTENDED, read_template('commentsExtended.xml'),
+            self._docx.document, RT_COMMENTS_EXTENDED)
+
+    def add(self, anchor: CommentAnchor, text: str, author: str = None, initials: str = None,
+            date: datetime = None) -> int:
+        """登记一条批注，返回分配的批注ID"""
+        comment_id = next(self._docx.comment_ids)
+        date = date or self._date or datetime.now(timezone.utc)
+        if date.tzinfo is not None:
+            date = date.astimezone(timezone.utc)
+        self._pending.append(_PendingComment(
+            comment_id,
+            anchor,
+            text,
+            author if author is not None else self._author,
+            initials if initials is not None else self._initials,
+            date.strftime('%Y-%m-%dT%H:%M:%SZ'),
+        ))
+        return comment_id
+
+    def add_many(self, items) -> list[int]:
+        """items 为 (anchor, text) 序列"""
+        return [self.add(anchor, text) for anchor, text in items]
+
+    def flush(self):
+        if not self._pending:
+            return
+        pending = self._pending
+        # 先完成全部检查，再分配段落ID和修改文档
+        matched = self._match_anchors(pending)
+        self._check_namespaces(self._docx.comments, _COMMENTS_PREFIXES)
+        self._check_namespaces(self._existing_comments_extended_part(), _EXTENDED_PREFIXES)
+
+        if self._id_generator is None:
+            self._id_generator = self._docx.para_ids
+        bodies = [comment.text.split('\n') for comment in pending]
+        para_ids = iter(self._id_generator.reserve(sum(len(lines) for lines in bodies)))
+
+        comments, extended = [], []
+        for comment, lines in zip(pending, bodies):
+            paragraphs = []
+            for n, line in enumerate(lines):
+                para_id = next(para_ids)
+                ref = '<w:r><w:annotationRef/></w:r>' if n == 0 else ''
+                paragraphs.append(
+                    '<w:p w14:paraId="%s" w14:textId="77777777">%s'
+                    '<w:r><w:t xml:space="preserve">%s</w:t></w:r></w:p>' % (para_id, ref, escape(line)))
+            comments.append('<w:comment w:id="%d" w:author=%s w:date="%s" w:initials=%s>%s</w:comment>' % (
+                comment.comment_id, quoteattr(comment.author), comment.date,
+                quoteattr(comment.initials), ''.join(paragraphs)))
+            extended.append('<w15:commentEx w15:paraId="%s" w15:done="0"/>' % para_id)
+
+        for p, p_starts, p_ends in matched:
+            self._mark_paragraph(p, p_starts, p_ends)
+        self._docx.document.mark_dirty()
+        self._pending = []
+        self._comments_part().append_xml(''.join(comments).encode('utf-8'))
+        self._comments_extended_part().append_xml(''.join(extended).encode('utf-8'))
+
+    @staticmethod
+    def _check_namespaces(part, prefixes: tuple):
+        """已有的批注部件必须在根元素上声明片段用到的前缀；新建的部件来自模板，总是满足"""
+        if part is None:
+            return
+        declared = part.root_namespaces()
+        missing = [prefix for prefix in prefixes if declared.get(prefix) != NAMESPACES[prefix]]
+        if missing:
+            raise ValueError("%s does not declare namespace prefixes %s" % (part.partname, missing))
+
+    def _match_anchors(self, pending: list[_PendingComment]) -> list:
+        """
+        一次遍历正文段落，找到每个批注起止所在的段落并检查 Run 序号，
+        返回 [(w:p, 起点列表, 终点列表), ...]；只读取文档，不做修改。
+        """
+        starts: dict[object, list] = {}
+        ends: dict[object, list] = {}
+        for comment in pending:
+            anchor = comment.anchor
+            end_paragraph = anchor.paragraph if anchor.end_paragraph is None else anchor.end_paragraph
+            starts.setdefault(anchor.paragraph, []).append((comment.comment_id, anchor.start_run))
+            ends.setdefault(end_paragraph, []).append((comment.comment_id, anchor.end_run))
+
+        matched = []
+        # comment_id -> (段落位置, Run 序号)
+        start_at: dict[int, tuple] = {}
+        end_at: dict[int, tuple] = {}
+        for index, p in enumerate(self._docx.document.readonly_element.iter(W_P)):
+            para_id = p.get(W14_PARA_ID)
+            p_starts = starts.get(index, []) + starts.get(para_id, [])
+            p_ends = ends.get(index, []) + ends.get(para_id, [])
+            if not p_starts and not p_ends:
+                continue
+            run_count = sum(1 for _ in _iter_runs_with_parent(p))
+            for comment_id, run_index in p_starts + p_ends:
+                if run_index is not None and not 0 <= run_index < run_count:
+                    raise ValueError("Comment %d anchors run %d, but paragraph %d has %d runs"
+                                     % (comment_id, run_index, index, run_count))
+            start_at.update((comment_id, (index, run_index)) for comment_id, run_index in p_starts)
+            end_at.update((comment_id, (index, run_index)) for comment_id, run_index in p_ends)
+            matched.append((p, p_starts, p_ends))
+
+        for comment in pending:
+            start, end = start_at.get(comment.comment_id), end_at.get(comment.comment_id)
+            if start is None or end is None:
+                raise ValueError("Comment %d anchor does not match any paragraph" % comment.comment_id)
+            # 段落开头（None）最早，段落末尾（None）最晚
+            start_key = (start[0], -1 if start[1] is None else start[1])
+            end_key = (end[0], float('inf') if end[1] is None else end[1])
+            if start_key > end_key:
+                raise ValueError("Comment %d starts after it ends" % comment.comment_id)
+        return matched
+
+    @staticmethod
+    def _mark_paragraph(p: xml_engine.Element, p_starts: list, p_ends: list):
+        runs = list(_iter_runs_with_parent(p))
+        # parent -> 子元素序号 -> 插在其前 / 其后的元素
+        before: dict[xml_engine.Element, dict[int, list]] = {}
+        after: dict[xml_engine.Element, dict[int, list]] = {}
+        appended = []
+        prepend_at = 1 if len(p) and p[0].tag == W_PPR else 0
+
+        child_index = {}
+
+        def position(run_index):
+            parent, run = runs[run_index]
+            if parent not in child_index:
+                child_index[parent] = {id(child): i for i, child in enumerate(parent)}
+            return parent, child_index[parent][id(run)]
+
+        for comment_id, run_index in p_starts:
+            marker = xml_engine.Element(W_COMMENT_RANGE_START, {W_ID: str(comment_id)})
+            if run_index is None:
+                if prepend_at < len(p):
+                    before.setdefault(p, {}).setdefault(prepend_at, []).append(marker)
+                else:
+                    appended.append(marker)
+            else:
+                parent, i = position(run_index)
+                before.setdefault(parent, {}).setdefault(i, []).append(marker)
+
+        for comment_id, run_index in p_ends:
+            end = xml_engine.Element(W_COMMENT_RANGE_END, {W_ID: str(comment_id)})
+            reference = xml_engine.Element(W_R)
+            xml_engine.SubElement(reference, W_COMMENT_REFERENCE, {W_ID: str(comment_id)})
+            if run_index is None:
+                appended.extend((end, reference))
+            else:
+                parent, i = position(run_index)
+                after.setdefault(parent, {}).setdefault(i, []).extend((end, reference))
+
+        for parent in set(before) | set(after):
+            parent_before = before.get(parent, {})
+            parent_after = after.get(parent, {})
+            children = []
+            for i, child in enumerate(parent):
+                children.extend(parent_before.get(i, ()))
+                children.append(child)
+                children.extend(parent_after.get(i, ()))
+            parent[:] = children
+        p.extend(appended)
@@ -0,0 +1,349 @@
+"""
+两个文档正文的结构化对比。
+
+    for change in diff_documents('v1.docx', 'v2.docx'):
+        print(change.kind, change.a_index, change.b_index, change.runs)
+
+第一遍流式读取两个文档，每个段落只保留 (paraId, 文本哈希, 格式哈希)；
+先按 w14:paraId 对齐，其余段落按内容哈希做 patience diff。
+第二遍再次流式读取，只为有变化的段落计算 Run 级别的差异。
+内存占用与段落数成正比，与 XML 大小无关。
+"""
+import unicodedata
+from bisect import bisect_left
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+
+from .document import Docx
+from .run_properties import RunProperties
+from .stream import ParagraphView
+
+EQUAL = 'equal'
+INSERTED = 'inserted'
+DELETED = 'deleted'
+MODIFIED = 'modified'
+MOVED = 'moved'
+
+
+@dataclass(frozen=True, slots=True)
+class RunChange:
+    """
+    段落内的变化。kind 为 insert / delete / replace（文本变化）或 format（文本相同、格式不同），
+    偏移为在各自段落文本中的位置。
+    """
+    kind: str
+    a_start: int
+    a_end: int
+    b_start: int
+    b_end: int
+    old_text: str = ""
+    new_text: str = ""
+    old_rpr: RunProperties = None
+    new_rpr: RunProperties = None
+
+
+@dataclass(frozen=True, slots=True)
+class ParagraphChange:
+    """段落级变化，a_index / b_index 为段落在各自文档中的序号，不存在时为 None"""
+    kind: str
+    a_index: int
+    b_index: int
+    para_id: str
+    old_text: str = None
+    new_text: str = None
+    old_style: str = None
+    new_style: str = None
+    runs: tuple[RunChange, ...] = ()
+
+
+def normalize_text(text: str) -> str:
+    return ' '.join(unicodedata.normalize('NFC', text).split())
+
+
+# 没有 w:rPr 与空的 w:rPr 格式相同，比较前把 None 换成空格式
+_NO_FORMAT = RunProperties()
+
+
+def _same_format(a: RunProperties, b: RunProperties) -> bool:
+    return (_NO_FORMAT if a is None else a) == (_NO_FORMAT if b is None else b)
+
+
+def _format_runs(view: ParagraphView) -> tuple:
+    """(长度, 格式) 序列，相邻的相同格式合并，与 Run 的拆分方式无关"""
+    runs = []
+    for span in view.spans:
+        length = span.end - span.start
+        rpr = _NO_FORMAT if span.rpr is None else span.rpr
+        if runs and runs[-1][1] == rpr:
+            runs[-1] = (runs[-1][0] + length, rpr)
+        else:
+            runs.append((length, rpr))
+    return tuple(runs)
+
+
+class _Signatures:
+    """一个文档全部段落的签名，每个段落三个字段"""
+
+    def __init__(self, views):
+        self.para_ids: list[str] = []
+        self.text_hashes: list[int] = []
+        self.hashes: list[int] = []
+        for view in views:
+            text_hash = hash(normalize_text(view.text))
+            self.para_ids.append(view.para_id)
+            self.text_hashes.append(text_hash)
+            self.hashes.append(hash((text_hash, view.style, _format_runs(view))))
+
+    def __len__(self):
+        return len(self.hashes)
+
+
+def _unique_para_ids(para_ids: list[str]) -> dict[str, int]:
+    index: dict[str, int] = {}
+    duplicates = set()
+    for i, para_id in enumerate(para_ids):
+        if para_id is None:
+            continue
+        if para_id in index:
+            duplicates.add(para_id)
+        index[para_id] = i
+    for para_id in duplicates:
+        del index[para_id]
+    return index
+
+
+def _increasing_pairs(pairs: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """按 b 排好序的 (a, b) 中 a 严格递增的最长子序列，O(n log n)"""
+    tails: list[int] = []
+    tail_index: list[int] = []
+    previous = [-1] * len(pairs)
+    for k, (a, _) in enumerate(pairs):
+        i = bisect_left(tails, a)
+        if i == len(tails):
+            tails.append(a)
+            tail_index.append(k)
+        else:
+            tails[i] = a
+            tail_index[i] = k
+        previous[k] = tail_index[i - 1] if i else -1
+    result = []
+    k = tail_index[-1] if tail_index else -1
+    while k >= 0:
+        result.append(pairs[k])
+        k = previous[k]
+    result.reverse()
+    return result
+
+
+# 没有唯一公共元素的区间在此大小以内才用 SequenceMatcher，否则整体视为替换
+_SEQUENCE_MATCHER_LIMIT = 2000
+
+
+def _match_hashes(a_keys: list, b_keys: list) -> list[tuple[int, int]]:
+    """
+    patience diff：去掉公共前后缀后，以两边都只出现一次的哈希为锚点（取最长递增子序列），
+    在锚点之间递归。返回相等元素的 (x, y) 下标对，按顺序排列。
+    """
+    matched = []
+    stack = [(0, len(a_keys), 0, len(b_keys))]
+    while stack:
+        a_lo, a_hi, b_lo, b_hi = stack.pop()
+        while a_lo < a_hi and b_lo < b_hi and a_keys[a_lo] == b_keys[b_lo]:
+            matched.append((a_lo, b_lo))
+            a_lo += 1
+            b_lo += 1
+        while a_lo < a_hi and b_lo < b_hi and a_keys[a_hi - 1] == b_keys[b_hi - 1]:
+            a_hi -= 1
+            b_hi -= 1
+            matched.append((a_hi, b_hi))
+        if a_lo == a_hi or b_lo == b_hi:
+            continue
+        a_unique = _unique_positions(a_keys, a_lo, a_hi)
+        b_unique = _unique_positions(b_keys, b_lo, b_hi)
+        pairs = [(a_unique[key], y) for key, y in b_unique.items() if key in a_unique]
+        pairs.sort(key=lambda pair: pair[1])
+        anchors = _increasing_pairs(pairs)
+        if anchors:
+            matched.extend(anchors)
+            bounds = [(a_lo - 1, b_lo - 1)] + anchors + [(a_hi, b_hi)]
+            for (x0, y0), (x1, y1) in zip(bounds, bounds[1:]):
+                if x1 - x0 > 1 and y1 - y0 > 1:
+                    stack.append((x0 + 1, x1, y0 + 1, y1))
+        elif a_hi - a_lo <= _SEQUENCE_MATCHER_LIMIT and b_hi - b_lo <= _SEQUENCE_MATCHER_LIMIT:
+            matcher = SequenceMatcher(None, a_keys[a_lo:a_hi], b_keys[b_lo:b_hi], autojunk=False)
+            for x, y, size in matcher.get_matching_blocks():
+                matched.extend((a_lo + x + k, b_lo + y + k) for k in range(size))
+    matched.sort()
+    return matched
+
+
+def _unique_positions(keys: list, lo: int, hi: int) -> dict:
+    positions = {}
+    duplicates = set()
+    for i in range(lo, hi):
+        key = keys[i]
+        if key in positions:
+            duplicates.add(key)
+        positions[key] = i
+    for key in duplicates:
+        del positions[key]
+    return positions
+
+
+def _gap_ops(gap_a: list[int], gap_b: list[int], a: _Signatures, b: _Signatures, ops: list):
+    """对齐两个锚点之间的段落；未匹配的段落按位置配对为 modified，多出的为 deleted / inserted"""
+    if not gap_a or not gap_b:
+        ops.extend((DELETED, i, None) for i in gap_a)
+        ops.extend((INSERTED, None, j) for j in gap_b)
+        return
+    x0 = y0 = 0
+    for x1, y1 in _match_hashes([a.hashes[i] for i in gap_a], [b.hashes[j] for j in gap_b]) + [(len(gap_a), len(gap_b))]:
+        paired = min(x1 - x0, y1 - y0)
+        ops.extend((MODIFIED, gap_a[x0 + k], gap_b[y0 + k]) for k in range(paired))
+        ops.extend((DELETED, gap_a[x], None) for x in range(x0 + paired, x1))
+        ops.extend((INSERTED, None, gap_b[y]) for y in range(y0 + paired, y1))
+        if x1 < len(gap_a):
+            ops.append((EQUAL, gap_a[x1], gap_b[y1]))
+        x0, y0 = x1 + 1, y1 + 1
+
+
+def align(a: _Signatures, b: _Signatures):
+    """
+    产生按文档顺序排列的 (kind, a_index, b_index)，kind 为 equal / modified / inserted / deleted，
+    以及交叉匹配（被移动）的段落对列表。
+    """
+    a_ids = _unique_para_ids(a.para_ids)
+    b_ids = _unique_para_ids(b.para_ids)
+    pairs = [(a_ids[para_id], j) for j, para_id in enumerate(b.para_ids)
+             if para_id in a_ids and b_ids.get(para_id) == j]
+    anchors = _increasing_pairs(pairs)
+    anchored = set(anchors)
+    moved = [pair for pair in pairs if pair not in anchored]
+    moved_a = {i for i, _ in moved}
+    moved_b = {j for _, j in moved}
+
+    ops = []
+    i0 = j0 = 0
+    for i1, j1 in anchors + [(len(a), len(b))]:
+        if i1 > i0 or j1 > j0:
+            gap_a = [i for i in range(i0, i1) if i not in moved_a]
+            gap_b = [j for j in range(j0, j1) if j not in moved_b]
+            _gap_ops(gap_a, gap_b, a, b, ops)
+        if i1 < len(a):
+            ops.append((EQUAL if a.hashes[i1] == b.hashes[j1] else MODIFIED, i1, j1))
+        i0, j0 = i1 + 1, j1 + 1
+    return ops, moved
+
+
+def _spans_at(view: ParagraphView):
+    return [(span.start, span.end, span.rpr) for span in view.spans]
+
+
+def _format_changes(a_view: ParagraphView, b_view: ParagraphView, a0: int, b0: int, length: int) -> list[RunChange]:
+    """文本相同的区间 [a0, a0 + length) / [b0, b0 + length) 中格式不同的部分"""
+    changes = []
+    a_spans = _spans_at(a_view)
+    b_spans = _spans_at(b_view)
+    ia = ib = 0
+    offset = 0
+    while offset < length:
+        pa, pb = a0 + offset, b0 + offset
+        while ia < len(a_spans) and a_spans[ia][1] <= pa:
+            ia += 1
+        while ib < len(b_spans) and b_spans[ib][1] <= pb:
+            ib += 1
+        a_rpr = a_spans[ia][2] if ia < len(a_spans) and a_spans[ia][0] <= pa else None
+        b_rpr = b_spans[ib][2] if ib < len(b_spans) and b_spans[ib][0] <= pb else None
+        a_end = a_spans[ia][1] if ia < len(a_spans) else a0 + length
+        b_end = b_spans[ib][1] if ib < len(b_spans) else b0 + length
+        step = max(1, min(a_end - pa, b_end - pb, length - offset))
+        if not _same_format(a_rpr, b_rpr):
+            last = changes[-1] if changes else None
+            if (last is not None and last.a_end == pa
+                    and _same_format(last.old_rpr, a_rpr) and _same_format(last.new_rpr, b_rpr)):
+                changes[-1] = RunChange('format', last.a_start, pa + step, last.b_start, pb + step,
+                                        old_rpr=a_rpr, new_rpr=b_rpr)
+            else:
+                changes.append(RunChange('format', pa, pa + step, pb, pb + step, old_rpr=a_rpr, new_rpr=b_rpr))
+        offset += step
+    return changes
+
+
+def run_changes(a_view: ParagraphView, b_view: ParagraphView) -> tuple[RunChange, ...]:
+    """两个段落之间的文本和格式差异"""
+    a_text, b_text = a_view.text, b_view.text
+    changes = []
+    matcher = SequenceMatcher(None, a_text, b_text, autojunk=False)
+    for tag, a0, a1, b0, b1 in matcher.get_opcodes():
+        if tag == 'equal':
+            changes.extend(_format_changes(a_view, b_view, a0, b0, a1 - a0))
+        else:
+            changes.append(RunChange(tag, a0, a1, b0, b1, a_text[a0:a1], b_text[b0:b1]))
+    return tuple(changes)
+
+
+def _paragraph_change(kind: str, i: int, j: int, a_view: ParagraphView, b_view: ParagraphView) -> ParagraphChange:
+    if a_view is None:
+        return ParagraphChange(kind, None, j, b_view.para_id, None, b_view.text, None, b_view.style)
+    if b_view is None:
+        return ParagraphChange(kind, i, None, a_view.para_id, a_view.text, None, a_view.style, None)
+    return ParagraphChange(
+        kind, i, j, b_view.para_id or a_view.para_id, a_view.text, b_view.text,
+        a_view.style, b_view.style, run_changes(a_view, b_view),
+    )
+
+
+class _Cursor:
+    """按序号向前推进的流式段落读取器，途经 keep 中的段落时暂存"""
+
+    def __init__(self, views, keep: set[int]):
+        self._views = iter(views)
+        self._keep = keep
+        self.kept: dict[int, ParagraphView] = {}
+
+    def get(self, index: int) -> ParagraphView:
+        if index in self.kept:
+            return self.kept.pop(index)
+        for view in self._views:
+            if view.index in self._keep:
+                self.kept[view.index] = view
+            if view.index == index:
+                return view
+        raise IndexError(index)
+
+
+def _open(source):
+    if isinstance(source, Docx):
+        return source, False
+    return Docx.open(source), True
+
+
+def diff_documents(a, b):
+    """
+    对比两个文档（Docx 对象、路径或文件对象）的正文，按 b 的顺序产生 ParagraphChange，
+    被移动的段落最后产生。没有变化的段落不会产生。
+    """
+    a_doc, close_a = _open(a)
+    b_doc, close_b = _open(b)
+    try:
+        ops, moved = align(_Signatures(a_doc.iter_paragraphs()), _Signatures(b_doc.iter_paragraphs()))
+        a_cursor = _Cursor(a_doc.iter_paragraphs(), {i for i, _ in moved})
+        b_cursor = _Cursor(b_doc.iter_paragraphs(), {j for _, j in moved})
+        for kind, i, j in ops:
+            if kind == EQUAL:
+                continue
+            yield _paragraph_change(
+                kind,
+                i,
+                j,
+                a_cursor.get(i) if i is not None else None,
+                b_cursor.get(j) if j is not None else None,
+            )
+        for i, j in moved:
+            a_view, b_view = a_cursor.get(i), b_cursor.get(j)
+            yield _paragraph_change(MOVED, i, j, a_view, b_view)
+    finally:
+        if close_a:
+            a_doc.close()
+        if close_b:
+            b_doc.close()
@@ -0,0 +1,285 @@
+
+import itertools
+from typing import TYPE_CHECKING, Iterator
+
+from . import instrumentation
+from .package import (
+    Package,
+    Part,
+    RT_COMMENTS,
+    RT_ENDNOTES,
+    RT_FOOTER,
+    RT_FOOTNOTES,
+    RT_GLOSSARY_DOCUMENT,
+    RT_HEADER,
+    RT_NUMBERING,
+    RT_STYLES,
+)
+from .paragraph import Paragraph
+from .stream import ParagraphView, iter_part_paragraphs
+from .tags import W_P
+
+if TYPE_CHECKING:
+    from .numbering import ListLabels, Numbering
+    from .para_id_generator import ParaIdGenerator
+    from .search import Match
+    from .styles import StyleSheet
+
+
+class Docx:
+    def __init__(self, xml: str = None, package: Package = None):
+        self._package = package
+        self._lists: "Numbering" = None
+        self._style_sheet: "StyleSheet" = None
+        self._para_ids: "ParaIdGenerator" = None
+        self._comment_ids: Iterator[int] = None
+        # 由 open_async 创建、随文档关闭的源文件对象（上传内容的临时文件等）
+        self._owned_source = None
+        if package is not None:
+            self._document = package.main_document_part
+        else:
+            self._document = Part('/word/document.xml', blob=(xml or '').encode('utf-8'))
+
+    @classmethod
+    def open(cls, path_or_fileobj, cache=None):
+        """
+        直接从 .docx 压缩包打开文档，各部件在首次访问时才解压和解析。
+
+        cache 为 parse_cache.ParseCache 或缓存目录，未修改部件的段落表和样式表从中读取；
+        默认使用环境变量 DOCX_PARSE_CACHE 指定的目录，False 表示不使用缓存。
+        """
+        from . import parse_cache
+
+        return cls(package=Package.open(path_or_fileobj, parse_cache.resolve(cache)))
+
+    @classmethod
+    async def open_async(cls, source, cache=None, parse: bool = True):
+        """
+        open 的异步版本。source 可以是路径、文件对象、bytes，或异步字节流（例如上传的请求体）。
+
+        解压和解析在 aio 的有界线程池中执行；parse 为 True 时顺带解析正文部件，
+        之后访问 paragraphs 等不会再在事件循环中解析。同时在途的文档数受 aio.configure 限制。
+        """
+        from . import aio
+
+        return await aio.open_document(cls, source, cache, parse)
+
+    @classmethod
+    def _open_parsed(cls, source, cache, parse: bool, owned: bool = False):
+        """owned 为 True 时 source 交由文档管理，关闭文档（或打开失败）时一并关闭"""
+        try:
+            docx = cls.open(source, cache)
+        except BaseException:
+            if owned:
+                source.close()
+            raise
+        if owned:
+            docx._owned_source = source
+        if parse and docx.document is not None:
+            try:
+                docx.document.readonly_element
+            except BaseException:
+                docx.close()
+                raise
+        return docx
+
+    def save(self, target):
+        """
+        流式保存到路径或文件对象，只有被修改过的部件会重新序列化。
+        """
+        if self._package is None:
+            raise ValueError("Docx was not opened from a .docx package")
+        self._package.save(target)
+
+    async def save_async(self, target):
+        """
+        save 的异步版本。target 可以是路径、文件对象，或异步字节流
+        （带 async write()，或 write() 加 async drain()，例如下载响应）。
+
+        序列化和压缩在线程池中执行。任务被取消时工作线程在下一次写入时停止，
+        写了一半的文件会被删除。
+        """
+        if self._package is None:
+            raise ValueError("Docx was not opened from a .docx package")
+        from . import aio
+
+        await aio.save_package(self._package, target)
+
+    def close(self):
+        if self._package is not None:
+            self._package.close()
+        if self._owned_source is not None:
+            self._owned_source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    @property
+    def package(self) -> Package:
+        return self._package
+
+    @property
+    def xml(self) -> str:
+        if self._document.loaded:
+            return instrumentation.tostring(self._document.readonly_element, 'Docx.xml')
+        return self._document.blob.decode('utf-8')
+
+    @property
+    def paragraphs(self) -> list[Paragraph]:
+        """正文中的全部段落，直接包装文档树中的 w:p 元素"""
+        return [Paragraph(p) for p in self._document.element.iter(W_P)]
+
+    @property
+    def story_parts(self) -> list[Part]:
+        """包含文本的部件：正文、页眉、页脚、脚注、尾注和批注"""
+        parts = [self._document] + self.headers + self.footers
+        parts.extend(part for part in (self.footnotes, self.endnotes, self.comments) if part is not None)
+        return parts
+
+    def find(self, patterns, regex: bool = False, flags: int = 0, parts: list[Part] = None) -> list["Match"]:
+        """
+        在文档中查找一个或多个模式，匹配可以跨越 Run 和 w:t 的边界。
+        parts 默认为 story_parts。
+        """
+        from . import search
+
+        return search.find(self.story_parts if parts is None else parts, patterns, regex, flags)
+
+    def replace(self, old, new=None, regex: bool = False, flags: int = 0, parts: list[Part] = None) -> int:
+        """
+        替换文本并返回替换次数。old 为单个模式（此时 new 为替换），
+        或 {模式: 替换} 字典以便一次扫描完成全部替换；替换可以是 callable(Match) -> str。
+        """
+        replacements = old if isinstance(old, dict) else {old: new}
+        if any(value is None for value in replacements.values()):
+            raise ValueError("replacement must not be None")
+        from . import search
+
+        return search.replace(self.story_parts if parts is None else parts, replacements, regex, flags)
+
+    @property
+    def lists(self) -> "Numbering":
+        """numbering.xml 的索引表，也用于新建列表"""
+        if self._lists is None:
+            from .numbering import Numbering
+
+            self._lists = Numbering(self)
+        return self._lists
+
+    @property
+    def style_sheet(self) -> "StyleSheet":
+        """styles.xml 的样式表，用于解析 Run 的有效格式"""
+        if self._style_sheet is None:
+            from .styles import StyleSheet
+
+            self._style_sheet = StyleSheet(self.styles)
+        return self._style_sheet
+
+    @property
+    def para_ids(self) -> "ParaIdGenerator":
+        """
+        文档共用的段落ID分配器，首次访问时扫描全部部件（包括内存中新增和修改的部件）。
+        新建段落的代码都应从这里取ID，否则彼此之间可能重复。
+        """
+        if self._para_ids is None:
+            from .para_id_generator import ParaIdGenerator
+
+            self._para_ids = ParaIdGenerator(self)
+        return self._para_ids
+
+    @property
+    def comment_ids(self) -> Iterator[int]:
+        """文档共用的批注ID计数器，从批注部件中最大的 w:id 之后开始"""
+        if self._comment_ids is None:
+            from .comments import max_comment_id
+
+            part = self.comments
+            self._comment_ids = itertools.count(max_comment_id(part) + 1 if part is not None else 0)
+        return self._comment_ids
+
+    def list_labels(self) -> "ListLabels":
+        """正文全部段落的列表标签，一次遍历计算"""
+        from .numbering import ListLabels
+
+        return ListLabels(self.lists, self._document.readonly_element.iter(W_P))
+
+    def diff(self, other):
+        """与另一个文档对比正文，见 compare.diff_documents"""
+        return diff(self, other)
+
+    def iter_paragraphs(self):
+        """
+        流式遍历正文段落，产生只读的 ParagraphView，适合抽取文本等只读任务。
+        """
+        return iter_part_paragraphs(self._document)
+
+    def iter_header_paragraphs(self):
+        for part in self.headers:
+            yield from iter_part_paragraphs(part)
+
+    def iter_footer_paragraphs(self):
+        for part in self.footers:
+            yield from iter_part_paragraphs(part)
+
+    def iter_comment_paragraphs(self):
+        part = self.comments
+        if part is not None:
+            yield from iter_part_paragraphs(part)
+
+    def _related(self, reltype: str) -> list[Part]:
+        if self._package is None:
+            return []
+        return self._package.related_parts(self._document, reltype)
+
+    def _related_one(self, reltype: str) -> Part:
+        parts = self._related(reltype)
+        return parts[0] if parts else None
+
+    @property
+    def document(self) -> Part:
+        return self._document
+
+    @property
+    def comments(self) -> Part:
+        return self._related_one(RT_COMMENTS)
+
+    @property
+    def footnotes(self) -> Part:
+        return self._related_one(RT_FOOTNOTES)
+
+    @property
+    def endnotes(self) -> Part:
+        return self._related_one(RT_ENDNOTES)
+
+    @property
+    def numbering(self) -> Part:
+        return self._related_one(RT_NUMBERING)
+
+    @property
+    def styles(self) -> Part:
+        return self._related_one(RT_STYLES)
+
+    @property
+    def glossary(self) -> Part:
+        return self._related_one(RT_GLOSSARY_DOCUMENT)
+
+    @property
+    def headers(self) -> list[Part]:
+        return self._related(RT_HEADER)
+
+    @property
+    def footers(self) -> list[Part]:
+        return self._related(RT_FOOTER)
+
+
+def diff(a, b):
+    """
+    流式对比两个文档（Docx、路径或文件对象）的正文，惰性产生段落级和 Run 级变化。
+    """
+    from .compare import diff_documents
+
+    return diff_documents(a, b)
+
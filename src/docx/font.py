@@ -0,0 +1,31 @@
+    
+
+import itertools
+from dataclasses import dataclass
+
+# 共享实例表的上限，超过时丢弃最早加入的一半（与 run_properties.MAX_INTERNED 相同的策略）
+MAX_INTERNED = 4096
+
+_interned: dict = {}
+
+
+def clear_intern_cache():
+    _interned.clear()
+
+
+@dataclass(frozen=True, slots=True)
+class Font:
+    ascii: str = ""
+    hAnsi: str = ""
+    eastAsia: str = ""
+    hint: str = ""
+
+    def intern(self) -> "Font":
+        """返回与之相等的共享实例"""
+        interned = _interned.get(self)
+        if interned is None:
+            interned = _interned[self] = self
+            if len(_interned) > MAX_INTERNED:
+                for key in list(itertools.islice(_interned, len(_interned) - MAX_INTERNED // 2)):
+                    del _interned[key]
+        return interned
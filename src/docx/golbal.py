@@ -1,3 +1,5 @@
+import os
+
 NAMESPACES = {
     'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main',
     'w14': 'http://schemas.microsoft.com/office/word/2010/wordml',
@@ -33,4 +35,12 @@ NAMESPACES = {
     'wpsCustomData': 'http://www.wps.cn/officeDocument/2013/wpsCustomData',
     'm': 'http://schemas.openxmlformats.org/officeDocument/2006/math',
     'w15': 'http://schemas.microsoft.com/office/word/2012/wordml'
-}
\ No newline at end of file
+}
+
+# 随包提供的部件模板（comments.xml、commentsExtended.xml、numbering.xml）和列表原型（list_templates.xml）
+TEMPLATES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'templates')
+
+
+def read_template(name: str) -> bytes:
+    with open(os.path.join(TEMPLATES_DIR, name), 'rb') as fh:
+        return fh.read()
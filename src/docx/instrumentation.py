@@ -0,0 +1,191 @@
+"""
+可选的解析/序列化计数器。
+
+    with instrumentation.collect('edit-contract') as stats:
+        run.text = '...'
+    print(stats.snapshot())
+
+未开启时，各个包装函数只多一次全局布尔判断；开启后按 (调用点, 操作)
+累计次数、耗时、字节数和创建的元素数。调用点是 ``类名.方法名`` 形式的字符串。
+作用域结束时把快照交给通过 ``add_exporter`` 注册的导出函数（例如上报到监控系统）；
+导出函数抛出的异常只记录到日志，不会影响其他导出函数，也不会掩盖作用域内抛出的异常。
+"""
+import copy
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from . import xml_engine
+
+logger = logging.getLogger(__name__)
+
+PARSE = 'parse'
+SERIALIZE = 'serialize'
+CREATE = 'create'
+COPY = 'copy'
+
+# 当前是否有任何作用域在收集，未开启时的快速路径只检查这个值
+_active = 0
+_active_lock = threading.Lock()
+_current: ContextVar = ContextVar('docx_instrumentation', default=None)
+_exporters: list = []
+
+
+@dataclass
+class OpStats:
+    count: int = 0
+    seconds: float = 0.0
+    bytes: int = 0
+    elements: int = 0
+
+
+class Collector:
+    """一个收集作用域内的统计"""
+
+    def __init__(self, name: str = None):
+        self.name = name
+        self._stats: dict[tuple[str, str], OpStats] = {}
+        self._lock = threading.Lock()
+
+    def record(self, site: str, op: str, seconds: float, nbytes: int = 0, elements: int = 0):
+        with self._lock:
+            stats = self._stats.get((site, op))
+            if stats is None:
+                stats = self._stats[(site, op)] = OpStats()
+            stats.count += 1
+            stats.seconds += seconds
+            stats.bytes += nbytes
+            stats.elements += elements
+
+    def get(self, site: str, op: str) -> OpStats:
+        return self._stats.get((site, op), OpStats())
+
+    def totals(self) -> dict[str, OpStats]:
+        """按操作汇总"""
+        totals: dict[str, OpStats] = {}
+        for (_, op), stats in self._stats.items():
+            total = totals.setdefault(op, OpStats())
+            total.count += stats.count
+            total.seconds += stats.seconds
+            total.bytes += stats.bytes
+            total.elements += stats.elements
+        return totals
+
+    def snapshot(self) -> dict:
+        """{调用点: {操作: {count, seconds, bytes, elements}}}"""
+        result: dict = {}
+        for (site, op), stats in sorted(self._stats.items()):
+            result.setdefault(site, {})[op] = {
+                'count': stats.count,
+                'seconds': stats.seconds,
+                'bytes': stats.bytes,
+                'elements': stats.elements,
+            }
+        return result
+
+
+def add_exporter(exporter):
+    """注册导出函数 exporter(name, snapshot)，每个 collect 作用域结束时调用"""
+    _exporters.append(exporter)
+
+
+def remove_exporter(exporter):
+    _exporters.remove(exporter)
+
+
+@contextmanager
+def collect(name: str = None):
+    """在当前上下文（线程或协程）中收集统计"""
+    global _active
+    collector = Collector(name)
+    token = _current.set(collector)
+    with _active_lock:
+        _active += 1
+    try:
+        yield collector
+    finally:
+        _current.reset(token)
+        with _active_lock:
+            _active -= 1
+        snapshot = None
+        for exporter in list(_exporters):
+            if snapshot is None:
+                snapshot = collector.snapshot()
+            try:
+                exporter(name, snapshot)
+            except Exception:
+                logger.exception("导出函数 %r 处理 %s 的统计时出错", exporter, name)
+
+
+def current() -> Collector:
+    return _current.get() if _active else None
+
+
+def _count(element) -> int:
+    return sum(1 for _ in element.iter())
+
+
+def fromstring(data, site: str):
+    if not _active:
+        return xml_engine.fromstring(data)
+    collector = _current.get()
+    if collector is None:
+        return xml_engine.fromstring(data)
+    start = time.perf_counter()
+    element = xml_engine.fromstring(data)
+    seconds = time.perf_counter() - start
+    collector.record(site, PARSE, seconds, len(data), _count(element))
+    return element
+
+
+def tostring(element, site: str, encoding: str = 'unicode'):
+    if not _active:
+        return xml_engine.tostring(element, encoding)
+    collector = _current.get()
+    if collector is None:
+        return xml_engine.tostring(element, encoding)
+    start = time.perf_counter()
+    data = xml_engine.tostring(element, encoding)
+    seconds = time.perf_counter() - start
+    collector.record(site, SERIALIZE, seconds, len(data), _count(element))
+    return data
+
+
+def write(element, writer, site: str):
+    """
+    把整棵树序列化到文本流 writer 并 flush。
+    writer 需提供 bytes_written 以统计写出的字节数。
+    """
+    if not _active or _current.get() is None:
+        xml_engine.write(element, writer)
+        writer.flush()
+        return
+    start = time.perf_counter()
+    xml_engine.write(element, writer)
+    writer.flush()
+    seconds = time.perf_counter() - start
+    _current.get().record(site, SERIALIZE, seconds, getattr(writer, 'bytes_written', 0), _count(element))
+
+
+def record_created(site: str, element):
+    """记录新建的元素（整棵子树）"""
+    if _active:
+        collector = _current.get()
+        if collector is not None:
+            collector.record(site, CREATE, 0.0, 0, _count(element))
+
+
+def deepcopy(element, site: str):
+    if not _active:
+        return copy.deepcopy(element)
+    collector = _current.get()
+    if collector is None:
+        return copy.deepcopy(element)
+    start = time.perf_counter()
+    result = copy.deepcopy(element)
+    seconds = time.perf_counter() - start
+    collector.record(site, COPY, seconds, 0, _count(result))
+    return result
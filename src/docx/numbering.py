@@ -0,0 +1,468 @@
+from __future__ import annotations
+
+import copy
+import re
+from dataclasses import dataclass
+
+from . import xml_engine
+from .golbal import read_template
+from .package import RT_NUMBERING
+from .tags import (
+    PATH_NUM_PR, PATH_PSTYLE, W_ABSTRACT_NUM, W_ABSTRACT_NUM_ID, W_FRAME_PR, W_ILVL, W_IS_LGL, W_KEEP_LINES,
+    W_KEEP_NEXT, W_LVL, W_LVL_OVERRIDE, W_LVL_RESTART, W_LVL_TEXT, W_NSID, W_NUM, W_NUM_FMT,
+    W_NUM_ID, W_NUM_ID_MAC_AT_CLEANUP, W_NUM_PR, W_NUM_STYLE_LINK, W_PAGE_BREAK_BEFORE, W_PPR, W_PSTYLE,
+    W_START, W_START_OVERRIDE, W_STYLE_LINK, W_VAL, W_WIDOW_CONTROL,
+)
+from .utils.unique_id_generator import UniqueIDGenerator
+
+CT_NUMBERING = 'application/vnd.openxmlformats-officedocument.wordprocessingml.numbering+xml'
+
+MAX_LEVELS = 9
+
+# add_list 可用的列表类型 -> templates/list_templates.xml 中的 abstractNumId
+LIST_TEMPLATES = {
+    'decimal': 0,
+    'bullet': 1,
+}
+
+# w:pPr 中排在 w:numPr 之前的子元素
+_BEFORE_NUM_PR = frozenset((W_PSTYLE, W_KEEP_NEXT, W_KEEP_LINES, W_PAGE_BREAK_BEFORE, W_FRAME_PR, W_WIDOW_CONTROL))
+
+_PLACEHOLDER_RE = re.compile(r'%([1-9])')
+_ROMAN = (
+    (1000, 'm'), (900, 'cm'), (500, 'd'), (400, 'cd'), (100, 'c'), (90, 'xc'),
+    (50, 'l'), (40, 'xl'), (10, 'x'), (9, 'ix'), (5, 'v'), (4, 'iv'), (1, 'i'),
+)
+
+# (解析时的 XML 引擎, abstractNumId -> 原型 w:abstractNum)，引擎切换后重新解析
+_template_abstract_nums: tuple = None
+
+
+@dataclass(frozen=True, slots=True)
+class Level:
+    """一个列表级别的定义（w:lvl），已合并 w:num 中的覆盖"""
+    ilvl: int
+    start: int = 1
+    fmt: str = 'decimal'
+    text: str = ''
+    restart: int = None
+    legal: bool = False
+
+
+def _int_val(element, default=None):
+    if element is None:
+        return default
+    try:
+        return int(element.get(W_VAL))
+    except (TypeError, ValueError):
+        return default
+
+
+def _read_level(lvl) -> Level:
+    fmt = lvl.find(W_NUM_FMT)
+    text = lvl.find(W_LVL_TEXT)
+    legal = lvl.find(W_IS_LGL)
+    return Level(
+        int(lvl.get(W_ILVL, 0)),
+        _int_val(lvl.find(W_START), 1),
+        fmt.get(W_VAL, 'decimal') if fmt is not None else 'decimal',
+        text.get(W_VAL, '') if text is not None else '',
+        _int_val(lvl.find(W_LVL_RESTART)),
+        legal is not None and legal.get(W_VAL, 'true') not in ('0', 'false', 'off'),
+    )
+
+
+def _roman(value: int) -> str:
+    result = []
+    for number, letters in _ROMAN:
+        count, value = divmod(value, number)
+        result.append(letters * count)
+    return ''.join(result)
+
+
+def format_number(value: int, fmt: str) -> str:
+    """按 w:numFmt 格式化序号，不支持的格式按十进制处理"""
+    if fmt in ('lowerLetter', 'upperLetter'):
+        if value <= 0:
+            return ''
+        # Word 的字母序号：a..z, aa..zz, aaa..
+        letter = chr(ord('a') + (value - 1) % 26) * ((value - 1) // 26 + 1)
+        return letter if fmt == 'lowerLetter' else letter.upper()
+    if fmt in ('lowerRoman', 'upperRoman'):
+        if value <= 0:
+            return str(value)
+        roman = _roman(value)
+        return roman if fmt == 'lowerRoman' else roman.upper()
+    if fmt == 'decimalZero':
+        return '%02d' % value
+    if fmt == 'none':
+        return ''
+    return str(value)
+
+
+def _template_abstract_num(kind: str):
+    global _template_abstract_nums
+    if kind not in LIST_TEMPLATES:
+        raise ValueError("unknown list kind %r, expected one of %s" % (kind, ', '.join(LIST_TEMPLATES)))
+    if _template_abstract_nums is None or _template_abstract_nums[0] is not xml_engine.engine:
+        root = xml_engine.fromstring(read_template('list_templates.xml'))
+        _template_abstract_nums = (xml_engine.engine, {
+            int(element.get(W_ABSTRACT_NUM_ID)): element for element in root.iter(W_ABSTRACT_NUM)
+        })
+    return _template_abstract_nums[1][LIST_TEMPLATES[kind]]
+
+
+class Numbering:
+    """
+    numbering.xml 的索引表。
+
+    构造时对部件做一次遍历，建立 abstractNumId -> w:abstractNum、
+    numId -> abstractNumId 以及级别覆盖的查找表；各 numId 合并后的级别定义按需计算并缓存。
+
+    只有 w:numStyleLink 的 w:abstractNum 经由编号样式（styles.xml 中样式的 w:numPr）
+    解析到带对应 w:styleLink、真正定义级别的 w:abstractNum，两者共享编号计数。
+    """
+
+    def __init__(self, docx):
+        self._docx = docx
+        self._part = docx.numbering
+        self.abstract_nums: dict[int, xml_engine.Element] = {}
+        self.nums: dict[int, xml_engine.Element] = {}
+        self._num_abstract: dict[int, int] = {}
+        self._overrides: dict[int, dict[int, tuple]] = {}
+        self._levels: dict[int, tuple] = {}
+        self._abstracts: dict[int, int] = {}
+        # w:styleLink 样式名 -> abstractNumId，abstractNumId -> w:numStyleLink 样式名
+        self._style_links: dict[str, int] = {}
+        self._num_style_links: dict[int, str] = {}
+        # abstractNumId -> {w:lvl 中的 w:pStyle: ilvl}
+        self._level_styles: dict[int, dict[str, int]] = {}
+        self._nsids: UniqueIDGenerator = None
+        # 新 w:abstractNum / w:num 在根元素中的插入位置
+        self._abstract_end = 0
+        self._num_end = 0
+        if self._part is not None:
+            self._load(self._part.readonly_element)
+
+    def _load(self, root: xml_engine.Element):
+        self._root = root
+        first_num = last_num = last_abstract = cleanup = None
+        nsids = []
+        for index, child in enumerate(root):
+            tag = child.tag
+            if tag == W_ABSTRACT_NUM:
+                last_abstract = index
+                self._add_abstract_num(int(child.get(W_ABSTRACT_NUM_ID)), child)
+                nsid = child.find(W_NSID)
+                if nsid is not None:
+                    nsids.append(nsid.get(W_VAL))
+            elif tag == W_NUM:
+                if first_num is None:
+                    first_num = index
+                last_num = index
+                self._add_num(child)
+            elif tag == W_NUM_ID_MAC_AT_CLEANUP:
+                cleanup = index
+        end = len(root) if cleanup is None else cleanup
+        self._num_end = end if last_num is None else last_num + 1
+        if last_abstract is not None:
+            self._abstract_end = last_abstract + 1
+        else:
+            self._abstract_end = first_num if first_num is not None else end
+        self._nsids = UniqueIDGenerator(nsids)
+
+    def _add_abstract_num(self, abstract_id: int, abstract: xml_engine.Element):
+        self.abstract_nums[abstract_id] = abstract
+        style_link = abstract.find(W_STYLE_LINK)
+        if style_link is not None:
+            self._style_links[style_link.get(W_VAL)] = abstract_id
+        num_style_link = abstract.find(W_NUM_STYLE_LINK)
+        if num_style_link is not None:
+            self._num_style_links[abstract_id] = num_style_link.get(W_VAL)
+        level_styles = {}
+        for lvl in abstract.findall(W_LVL):
+            pstyle = lvl.find(W_PSTYLE)
+            if pstyle is not None:
+                level_styles.setdefault(pstyle.get(W_VAL), int(lvl.get(W_ILVL, 0)))
+        if level_styles:
+            self._level_styles[abstract_id] = level_styles
+
+    def _add_num(self, num: xml_engine.Element):
+        num_id = int(num.get(W_NUM_ID))
+        self.nums[num_id] = num
+        self._num_abstract[num_id] = _int_val(num.find(W_ABSTRACT_NUM_ID))
+        overrides = {}
+        for override in num.findall(W_LVL_OVERRIDE):
+            lvl = override.find(W_LVL)
+            overrides[int(override.get(W_ILVL, 0))] = (
+                _int_val(override.find(W_START_OVERRIDE)),
+                _read_level(lvl) if lvl is not None else None,
+            )
+        if overrides:
+            self._overrides[num_id] = overrides
+
+    def abstract_id(self, num_id: int) -> int:
+        """numId 实际使用的 abstractNumId，w:numStyleLink 已解析"""
+        if num_id in self._abstracts:
+            return self._abstracts[num_id]
+        abstract_id = self._num_abstract.get(num_id)
+        seen = set()
+        while abstract_id in self._num_style_links and abstract_id not in seen:
+            seen.add(abstract_id)
+            style_id = self._num_style_links[abstract_id]
+            linked = self._num_abstract.get(self._docx.style_sheet.num_pr(style_id)[0])
+            if linked is None or linked in seen:
+                linked = self._style_links.get(style_id)
+            if linked is None:
+                break
+            abstract_id = linked
+        self._abstracts[num_id] = abstract_id
+        return abstract_id
+
+    def paragraph_num_pr(self, p: xml_engine.Element) -> tuple:
+        """
+        段落的 (numId, ilvl)：直接的 w:numPr 优先，缺少的项取自段落样式（沿 basedOn 继承）。
+        仍没有 ilvl 时，取 w:lvl 中 w:pStyle 与段落样式相同的级别，否则为 0。
+        """
+        if not self.nums:
+            return None, None
+        num_pr = p.find(PATH_NUM_PR)
+        num_id = ilvl = None
+        if num_pr is not None:
+            num_id = _int_val(num_pr.find(W_NUM_ID))
+            ilvl = _int_val(num_pr.find(W_ILVL))
+        if num_id is not None and ilvl is not None:
+            return num_id, ilvl
+        styles = self._docx.style_sheet
+        pstyle = p.find(PATH_PSTYLE)
+        style_id = pstyle.get(W_VAL) if pstyle is not None else styles.default_paragraph_style
+        style_num_id, style_ilvl = styles.num_pr(style_id)
+        num_id = style_num_id if num_id is None else num_id
+        ilvl = style_ilvl if ilvl is None else ilvl
+        if ilvl is None and num_id:
+            ilvl = self._level_styles.get(self.abstract_id(num_id), {}).get(style_id, 0)
+        return num_id, ilvl
+
+    def start_overrides(self, num_id: int) -> list[int]:
+        """w:num 中带 w:startOverride 的级别"""
+        return [ilvl for ilvl, (start, _) in self._overrides.get(num_id, {}).items() if start is not None]
+
+    def levels(self, num_id: int) -> tuple:
+        """numId 合并覆盖后的级别定义，按 ilvl 索引，未定义的级别为 None"""
+        levels = self._levels.get(num_id)
+        if levels is None:
+            resolved = [None] * MAX_LEVELS
+            abstract = self.abstract_nums.get(self.abstract_id(num_id))
+            if abstract is not None:
+                for lvl in abstract.findall(W_LVL):
+                    level = _read_level(lvl)
+                    if 0 <= level.ilvl < MAX_LEVELS:
+                        resolved[level.ilvl] = level
+            for ilvl, (start, level) in self._overrides.get(num_id, {}).items():
+                if not 0 <= ilvl < MAX_LEVELS:
+                    continue
+                if level is not None:
+                    resolved[ilvl] = level
+                if start is not None and resolved[ilvl] is not None:
+                    level = resolved[ilvl]
+                    resolved[ilvl] = Level(level.ilvl, start, level.fmt, level.text, level.restart, level.legal)
+            levels = self._levels[num_id] = tuple(resolved)
+        return levels
+
+    def _ensure_part(self):
+        if self._part is None:
+            package = self._docx.package
+            if package is None:
+                raise ValueError("Docx was not opened from a .docx package")
+            self._part = package.add_part(
+                '/word/numbering.xml', CT_NUMBERING, read_template('numbering.xml'),
+                self._docx.document, RT_NUMBERING)
+            self._load(self._part.readonly_element)
+
+    def _insert_num(self, abstract_id: int, start: int = None) -> int:
+        num_id = max(self.nums, default=0) + 1
+        num = xml_engine.Element(W_NUM, {W_NUM_ID: str(num_id)})
+        xml_engine.SubElement(num, W_ABSTRACT_NUM_ID, {W_VAL: str(abstract_id)})
+        if start is not None:
+            override = xml_engine.SubElement(num, W_LVL_OVERRIDE, {W_ILVL: '0'})
+            xml_engine.SubElement(override, W_START_OVERRIDE, {W_VAL: str(start)})
+        self._root.insert(self._num_end, num)
+        self._num_end += 1
+        self._add_num(num)
+        self._part.mark_dirty()
+        return num_id
+
+    def add_list(self, kind: str = 'decimal', start: int = None) -> int:
+        """
+        按模板新建一个列表定义（w:abstractNum + w:num），返回 numId。
+        只更新索引表，不扫描文档。
+        """
+        self._ensure_part()
+        abstract = copy.deepcopy(_template_abstract_num(kind))
+        abstract_id = max(self.abstract_nums, default=-1) + 1
+        abstract.set(W_ABSTRACT_NUM_ID, str(abstract_id))
+        nsid = abstract.find(W_NSID)
+        if nsid is not None:
+            nsid.set(W_VAL, self._nsids.generate_unique_id())
+        self._root.insert(self._abstract_end, abstract)
+        self._abstract_end += 1
+        self._num_end += 1
+        self._add_abstract_num(abstract_id, abstract)
+        return self._insert_num(abstract_id, start)
+
+    def restart_list(self, num_id: int, start: int = 1) -> int:
+        """新建引用同一 w:abstractNum 的 w:num，从 start 重新编号，返回新的 numId"""
+        abstract_id = self._num_abstract.get(num_id)
+        if abstract_id is None:
+            raise KeyError(num_id)
+        return self._insert_num(abstract_id, start)
+
+
+def set_list(p: xml_engine.Element, num_id: int, ilvl: int = 0):
+    """给 w:p 设置 w:numPr，num_id 为 0 时取消编号"""
+    ppr = p.find(W_PPR)
+    if ppr is None:
+        ppr = xml_engine.Element(W_PPR)
+        p.insert(0, ppr)
+    num_pr = ppr.find(W_NUM_PR)
+    if num_pr is None:
+        index = 0
+        while index < len(ppr) and ppr[index].tag in _BEFORE_NUM_PR:
+            index += 1
+        num_pr = xml_engine.Element(W_NUM_PR)
+        ppr.insert(index, num_pr)
+    num_pr.clear()
+    xml_engine.SubElement(num_pr, W_ILVL, {W_VAL: str(ilvl)})
+    xml_engine.SubElement(num_pr, W_NUM_ID, {W_VAL: str(num_id)})
+
+
+class _State:
+    """编号计数器：abstractNumId -> 各级别当前序号，以及已出现过的 numId"""
+    __slots__ = ('counters', 'started')
+
+    def __init__(self, counters=None, started=None):
+        self.counters: dict[int, list] = counters or {}
+        self.started: set[int] = started or set()
+
+    def snapshot(self) -> tuple:
+        return (
+            tuple(sorted((key, tuple(value)) for key, value in self.counters.items())),
+            frozenset(self.started),
+        )
+
+    @classmethod
+    def restore(cls, snapshot: tuple):
+        counters, started = snapshot
+        return cls({key: list(value) for key, value in counters}, set(started))
+
+
+class ListLabels:
+    """
+    文档中全部段落的列表标签（如 "1."、"a."、"•"），一次线性遍历计算。
+
+    每 ``CHECKPOINT_INTERVAL`` 个段落保存一次计数器快照。段落修改后调用 ``refresh``，
+    只从修改位置之前最近的快照开始重算；段落数不变时，一旦某个快照与之前相同，
+    后面的标签也不会变化，重算随即停止。
+    """
+
+    CHECKPOINT_INTERVAL = 256
+
+    def __init__(self, numbering: Numbering, paragraphs):
+        self._numbering = numbering
+        self._paragraphs = list(paragraphs)
+        self._labels: list[str] = [None] * len(self._paragraphs)
+        self._checkpoints: list[tuple] = []
+        self._compute(0)
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __getitem__(self, index: int) -> str:
+        return self._labels[index]
+
+    def __iter__(self):
+        return iter(self._labels)
+
+    @property
+    def labels(self) -> list[str]:
+        return list(self._labels)
+
+    def refresh(self, start: int, end: int = None, paragraphs=None):
+        """
+        段落 [start, end) 被修改（默认只有 start 一个段落）后更新标签。
+        插入或删除了段落时传入新的段落列表 paragraphs。
+        """
+        resized = False
+        if paragraphs is not None:
+            paragraphs = list(paragraphs)
+            resized = len(paragraphs) != len(self._paragraphs)
+            self._paragraphs = paragraphs
+            if resized:
+                self._labels = self._labels[:start] + [None] * (len(paragraphs) - start)
+        self._compute(start, None if resized else (start + 1 if end is None else end))
+
+    def _compute(self, start: int, converge_after: int = None):
+        interval = self.CHECKPOINT_INTERVAL
+        if self._checkpoints:
+            # 快照 n 是第 n * interval 个段落之前的状态
+            k = min(start // interval, len(self._checkpoints) - 1)
+            state = _State.restore(self._checkpoints[k])
+        else:
+            k = 0
+            state = _State()
+        old = self._checkpoints
+        self._checkpoints = old[:k]
+        step = self._step
+        paragraphs = self._paragraphs
+        labels = self._labels
+        for index in range(k * interval, len(paragraphs)):
+            if index % interval == 0:
+                snapshot = state.snapshot()
+                n = index // interval
+                if converge_after is not None and index >= converge_after and n < len(old) and old[n] == snapshot:
+                    self._checkpoints.extend(old[n:])
+                    return
+                self._checkpoints.append(snapshot)
+            labels[index] = step(state, paragraphs[index])
+
+    def _step(self, state: _State, p: xml_engine.Element) -> str:
+        numbering = self._numbering
+        num_id, ilvl = numbering.paragraph_num_pr(p)
+        if not num_id:
+            return None
+        levels = numbering.levels(num_id)
+        if not 0 <= ilvl < MAX_LEVELS or levels[ilvl] is None:
+            return None
+        abstract_id = numbering.abstract_id(num_id)
+        counters = state.counters.get(abstract_id)
+        if counters is None:
+            counters = state.counters[abstract_id] = [None] * MAX_LEVELS
+        if num_id not in state.started:
+            # 同一 abstractNum 的各个 w:num 共享计数，带 startOverride 的 w:num 首次出现时重新开始
+            state.started.add(num_id)
+            for overridden in numbering.start_overrides(num_id):
+                counters[overridden] = None
+
+        level = levels[ilvl]
+        counters[ilvl] = level.start if counters[ilvl] is None else counters[ilvl] + 1
+        for deeper in range(ilvl + 1, MAX_LEVELS):
+            deeper_level = levels[deeper]
+            restart = deeper if deeper_level is None or deeper_level.restart is None else deeper_level.restart
+            if ilvl < restart:
+                counters[deeper] = None
+
+        if level.fmt == 'none':
+            return ''
+        if level.fmt == 'bullet':
+            return level.text
+
+        def render(m):
+            n = int(m.group(1)) - 1
+            ref = levels[n]
+            value = counters[n]
+            if value is None:
+                value = ref.start if ref is not None else 1
+            fmt = 'decimal' if level.legal or ref is None else ref.fmt
+            return format_number(value, fmt)
+
+        return _PLACEHOLDER_RE.sub(render, level.text)
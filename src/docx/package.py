@@ -0,0 +1,666 @@
+from __future__ import annotations
+
+import copy
+import io
+import os
+import posixpath
+import re
+import secrets
+import shutil
+import struct
+import sys
+import zipfile
+
+from . import instrumentation
+from . import xml_engine
+from .utils.namespaces import is_namespace_registered, register_namespace
+
+CT_NS = 'http://schemas.openxmlformats.org/package/2006/content-types'
+RELS_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+
+CONTENT_TYPES_NAME = '[Content_Types].xml'
+
+RT_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+RT_COMMENTS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments'
+RT_COMMENTS_EXTENDED = 'http://schemas.microsoft.com/office/2011/relationships/commentsExtended'
+RT_HEADER = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/header'
+RT_FOOTER = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/footer'
+RT_FOOTNOTES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/footnotes'
+RT_ENDNOTES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/endnotes'
+RT_NUMBERING = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/numbering'
+RT_STYLES = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles'
+RT_GLOSSARY_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/glossaryDocument'
+
+XML_DECLARATION = b'<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\r\n'
+
+_XMLNS_RE = re.compile(rb'xmlns:([A-Za-z_][\w.-]*)="([^"]*)"')
+_LOCAL_FILE_HEADER_SIZE = 30
+_LOCAL_FILE_HEADER_SIGNATURE = b'PK\x03\x04'
+_FLAG_DATA_DESCRIPTOR = 0x08
+_COPY_CHUNK_SIZE = 1 << 16
+_WRITE_CHUNK_SIZE = 1 << 16
+
+# _copy_raw 直接操作 ZipFile 的内部状态，只在验证过的版本上启用，其余版本解压后重新压缩
+_RAW_COPY = (3, 8) <= sys.version_info[:2] < (3, 15)
+_RAW_COPY_ATTRIBUTES = ('_lock', '_writecheck', '_didModify', 'start_dir', 'filelist', 'NameToInfo', 'fp')
+
+
+_ATTRIBUTE_ESCAPES = str.maketrans({
+    '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', '\n': '&#10;', '\r': '&#13;', '\t': '&#9;',
+})
+
+
+def _quoteattr(value: str) -> str:
+    """带双引号的属性值；不用 xml.sax.saxutils，它会连带导入 urllib 和 email"""
+    return '"%s"' % value.translate(_ATTRIBUTE_ESCAPES)
+
+
+def _root_namespaces(blob: bytes) -> dict[str, str]:
+    """
+    读取根元素起始标签上声明的命名空间。
+
+    ElementTree 序列化时只会输出实际用到的命名空间，而 mc:Ignorable
+    引用的前缀也必须保留声明，否则 Word 会认为文档已损坏。
+    """
+    start = blob.find(b'<', blob.find(b'?>') + 1 if blob.startswith(b'<?') else 0)
+    end = blob.find(b'>', start)
+    return {prefix.decode(): uri.decode() for prefix, uri in _XMLNS_RE.findall(blob[start:end])}
+
+
+def _rels_name(partname: str) -> str:
+    """返回部件对应的 .rels 成员名，例如 /word/document.xml -> word/_rels/document.xml.rels"""
+    directory, filename = posixpath.split(partname)
+    return posixpath.join(directory, '_rels', filename + '.rels').lstrip('/')
+
+
+class _ChunkWriter:
+    """
+    供 ElementTree 写入的文本流：按块编码后写入二进制目标，
+    并在根元素起始标签中补齐缺失的命名空间声明。
+    """
+
+    def __init__(self, target, namespaces: dict[str, str]):
+        self._target = target
+        self._namespaces = namespaces
+        self._buffer: list[str] = []
+        self._size = 0
+        self._in_root_tag = True
+        self.bytes_written = 0
+
+    def write(self, data: str):
+        self._buffer.append(data)
+        self._size += len(data)
+        if self._in_root_tag:
+            if '>' not in data:
+                return
+            self._in_root_tag = False
+            self._buffer = [self._complete_root_tag(''.join(self._buffer))]
+        if self._size >= _WRITE_CHUNK_SIZE:
+            self.flush()
+
+    def _complete_root_tag(self, head: str) -> str:
+        missing = ''.join(
+            ' xmlns:%s="%s"' % (prefix, uri)
+            for prefix, uri in self._namespaces.items()
+            if ' xmlns:%s=' % prefix not in head
+        )
+        if not missing:
+            return head
+        end = len(head)
+        for i, char in enumerate(head):
+            if char in ' />' and i > 0:
+                end = i
+                break
+        return head[:end] + missing + head[end:]
+
+    def flush(self):
+        if self._buffer:
+            data = ''.join(self._buffer).encode('utf-8')
+            self._target.write(data)
+            self.bytes_written += len(data)
+            self._buffer = []
+            self._size = 0
+
+
+def write_atomic(path, write):
+    """
+    调用 write(fileobj) 写入 path 所在目录下的临时文件，完成后替换 path。
+
+    出错或被中断时删除临时文件，path 保持原样，因此 path 可以是正在读取的源文件。
+    已存在的 path 保留原有的权限位。
+    """
+    path = os.fspath(path)
+    directory, filename = os.path.split(os.path.abspath(path))
+    while True:
+        temp = os.path.join(directory, '.%s.%s.tmp' % (filename, secrets.token_hex(4)))
+        try:
+            fh = open(temp, 'xb')
+        except FileExistsError:
+            continue
+        break
+    try:
+        with fh:
+            write(fh)
+        if os.path.exists(path):
+            shutil.copymode(path, temp)
+        os.replace(temp, path)
+    except BaseException:
+        try:
+            os.unlink(temp)
+        except OSError:
+            pass
+        raise
+
+
+def copy_member(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """把 source 中的成员复制到 target，能直接复制压缩字节时不解压也不重新压缩"""
+    if _RAW_COPY and all(hasattr(target, name) for name in _RAW_COPY_ATTRIBUTES) and hasattr(source, '_lock'):
+        _copy_raw(source, target, info)
+    else:
+        _copy_inflated(source, target, info)
+
+
+def _copy_inflated(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """只使用 ZipFile 公开接口的复制：流式解压后按原压缩方式重新压缩"""
+    zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+    zinfo.compress_type = info.compress_type
+    zinfo.external_attr = info.external_attr
+    zinfo.comment = info.comment
+    force_zip64 = info.file_size > zipfile.ZIP64_LIMIT
+    with source.open(info, 'r') as src, target.open(zinfo, 'w', force_zip64=force_zip64) as dst:
+        shutil.copyfileobj(src, dst, _COPY_CHUNK_SIZE)
+
+
+def _copy_raw(source: zipfile.ZipFile, target: zipfile.ZipFile, info: zipfile.ZipInfo):
+    """
+    把 source 中的成员以原始压缩字节复制到 target，不解压也不重新压缩。
+    依赖 ZipFile 的内部属性，由 copy_member 判断是否可用。
+    """
+    zinfo = copy.copy(info)
+    # 本地文件头中直接写入 CRC 和大小，不再需要数据描述符
+    zinfo.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    zip64 = zinfo.file_size > zipfile.ZIP64_LIMIT or zinfo.compress_size > zipfile.ZIP64_LIMIT
+    with source._lock:
+        fp = source.fp
+        fp.seek(info.header_offset)
+        header = fp.read(_LOCAL_FILE_HEADER_SIZE)
+        if header[:4] != _LOCAL_FILE_HEADER_SIGNATURE:
+            raise zipfile.BadZipFile('Bad local file header for %r' % info.filename)
+        name_len, extra_len = struct.unpack('<HH', header[26:30])
+        fp.seek(info.header_offset + _LOCAL_FILE_HEADER_SIZE + name_len + extra_len)
+        with target._lock:
+            target._writecheck(zinfo)
+            target._didModify = True
+            zinfo.header_offset = target.fp.tell()
+            target.fp.write(zinfo.FileHeader(zip64))
+            remaining = info.compress_size
+            while remaining > 0:
+                chunk = fp.read(min(_COPY_CHUNK_SIZE, remaining))
+                if not chunk:
+                    raise EOFError('Truncated zip member %r' % info.filename)
+                target.fp.write(chunk)
+                remaining -= len(chunk)
+            target.filelist.append(zinfo)
+            target.NameToInfo[zinfo.filename] = zinfo
+            target.start_dir = target.fp.tell()
+
+
+class Relationship:
+    def __init__(self, rid: str, reltype: str, target: str, external: bool = False, target_ref: str = None):
+        self.rid = rid
+        self.reltype = reltype
+        self.target = target
+        self.external = external
+        # .rels 文件中原始的 Target 值
+        self.target_ref = target_ref or target
+
+
+class Relationships:
+    """
+    一个 .rels 文件中的关系列表，目标已解析为绝对部件名。
+    """
+
+    def __init__(self, base_dir: str = '/'):
+        self._base_dir = base_dir
+        self._rels: dict[str, Relationship] = {}
+        self.dirty = False
+
+    def __iter__(self):
+        return iter(self._rels.values())
+
+    def __len__(self):
+        return len(self._rels)
+
+    def get(self, rid: str) -> Relationship:
+        return self._rels.get(rid)
+
+    def by_type(self, reltype: str) -> list[Relationship]:
+        return [rel for rel in self._rels.values() if rel.reltype == reltype]
+
+    def add(self, rid: str, reltype: str, target: str, external: bool = False) -> Relationship:
+        target_ref = target
+        if not external and not target.startswith('/'):
+            target = posixpath.normpath(posixpath.join(self._base_dir, target))
+        rel = Relationship(rid, reltype, target, external, target_ref)
+        self._rels[rid] = rel
+        return rel
+
+    def relate_to(self, partname: str, reltype: str) -> Relationship:
+        """新增一条指向 partname 的关系，已存在时直接返回"""
+        for rel in self.by_type(reltype):
+            if rel.target == partname:
+                return rel
+        used = set(self._rels)
+        n = len(used) + 1
+        while 'rId%d' % n in used:
+            n += 1
+        self.dirty = True
+        return self.add('rId%d' % n, reltype, posixpath.relpath(partname, self._base_dir))
+
+    def to_bytes(self) -> bytes:
+        items = []
+        for rel in self._rels.values():
+            mode = ' TargetMode="External"' if rel.external else ''
+            items.append('<Relationship Id=%s Type=%s Target=%s%s/>' % (
+                _quoteattr(rel.rid), _quoteattr(rel.reltype), _quoteattr(rel.target_ref), mode))
+        xml = '<Relationships xmlns="%s">%s</Relationships>' % (RELS_NS, ''.join(items))
+        return XML_DECLARATION + xml.encode('utf-8')
+
+    @classmethod
+    def load(cls, blob: bytes, base_dir: str):
+        rels = cls(base_dir)
+        root = instrumentation.fromstring(blob, 'Relationships.load')
+        for element in root.findall('{%s}Relationship' % RELS_NS):
+            rels.add(
+                element.get('Id'),
+                element.get('Type'),
+                element.get('Target'),
+                element.get('TargetMode') == 'External',
+            )
+        return rels
+
+
+class ContentTypes:
+    """
+    [Content_Types].xml 中的 Default / Override 映射。
+    """
+
+    def __init__(self):
+        self.defaults: dict[str, str] = {}
+        self.overrides: dict[str, str] = {}
+        self.dirty = False
+
+    def add_override(self, partname: str, content_type: str):
+        if self.overrides.get(partname) != content_type:
+            self.overrides[partname] = content_type
+            self.dirty = True
+
+    def to_bytes(self) -> bytes:
+        items = ['<Default Extension=%s ContentType=%s/>' % (_quoteattr(ext), _quoteattr(ct))
+                 for ext, ct in self.defaults.items()]
+        items += ['<Override PartName=%s ContentType=%s/>' % (_quoteattr(name), _quoteattr(ct))
+                  for name, ct in self.overrides.items()]
+        xml = '<Types xmlns="%s">%s</Types>' % (CT_NS, ''.join(items))
+        return XML_DECLARATION + xml.encode('utf-8')
+
+    def get(self, partname: str) -> str:
+        content_type = self.overrides.get(partname)
+        if content_type is None:
+            ext = posixpath.splitext(partname)[1][1:].lower()
+            content_type = self.defaults.get(ext)
+        return content_type
+
+    @classmethod
+    def load(cls, blob: bytes):
+        content_types = cls()
+        root = instrumentation.fromstring(blob, 'ContentTypes.load')
+        for element in root.findall('{%s}Default' % CT_NS):
+            content_types.defaults[element.get('Extension').lower()] = element.get('ContentType')
+        for element in root.findall('{%s}Override' % CT_NS):
+            content_types.overrides[element.get('PartName')] = element.get('ContentType')
+        return content_types
+
+
+class Part:
+    """
+    包中的一个部件。
+
+    部件内容只有在第一次访问 ``blob`` 时才从压缩包中解压，
+    只有在第一次访问 ``element`` 时才解析为 XML 树。
+    """
+
+    def __init__(self, partname: str, content_type: str = None, package=None, blob: bytes = None):
+        self.partname = partname
+        self.content_type = content_type
+        self._package = package
+        self._blob = blob
+        self._element: xml_engine.Element = None
+        self._namespaces: dict[str, str] = None
+        self._rels: Relationships = None
+        self._appended: list[bytes] = []
+        self._dirty = blob is not None and package is None
+
+    @property
+    def name(self) -> str:
+        """压缩包中的成员名"""
+        return self.partname.lstrip('/')
+
+    @property
+    def loaded(self) -> bool:
+        return self._element is not None
+
+    @property
+    def dirty(self) -> bool:
+        """部件内容是否可能已被修改，保存时只重新序列化脏部件"""
+        return self._dirty
+
+    def mark_dirty(self):
+        """修改了 ``readonly_element`` 以外途径拿到的树之后调用，保存时重新序列化"""
+        self._dirty = True
+
+    @property
+    def blob(self) -> bytes:
+        if self._appended:
+            self._materialize()
+        if self._blob is None and self._package is not None:
+            self._blob = self._package.read(self.name)
+        return self._blob
+
+    @blob.setter
+    def blob(self, value: bytes):
+        self._blob = value
+        self._element = None
+        self._namespaces = None
+        self._dirty = True
+
+    def open(self):
+        """
+        以二进制流的方式打开部件内容，供流式解析使用。
+
+        内容包括 ``append_xml`` 追加的片段（此时先在内存中合并），但不反映对已解析树的修改，
+        已解析的部件应直接读取树。没有追加片段时不会缓存解压后的数据。
+        """
+        if self._appended:
+            self._materialize()
+        return self._open_stored()
+
+    def _open_stored(self):
+        """不含追加片段的原内容"""
+        if self._blob is None and self._package is not None:
+            return self._package.open_member(self.name)
+        return io.BytesIO(self._blob or b'')
+
+    def append_xml(self, fragment: bytes):
+        """
+        在根元素末尾追加一段 XML 片段，不解析已有内容。
+
+        片段在保存时以流的方式写在原内容与根元素结束标签之间，
+        片段中使用的前缀必须已在根元素上声明。
+        """
+        if self._element is not None:
+            wrapper = instrumentation.fromstring(b'<wrapper %s>%s</wrapper>' % (
+                b' '.join(b'xmlns:%s="%s"' % (p.encode(), u.encode())
+                          for p, u in (self._namespaces or {}).items()), fragment), 'Part.append_xml')
+            self._element.extend(list(wrapper))
+        else:
+            self._appended.append(fragment)
+        self._dirty = True
+
+    @property
+    def zip_info(self) -> zipfile.ZipInfo:
+        """未修改的部件在压缩包中的成员信息（CRC、大小），其余情况为 None"""
+        if self._dirty or self._package is None:
+            return None
+        return self._package.member_info(self.name)
+
+    @property
+    def cache(self):
+        """所在包的解析缓存（parse_cache.ParseCache），没有时为 None"""
+        return self._package.cache if self._package is not None else None
+
+    def root_namespaces(self) -> dict[str, str]:
+        """根元素上声明的命名空间，只读取部件开头的一小段"""
+        if self._namespaces is None:
+            with self._open_stored() as fh:
+                self._namespaces = _root_namespaces(fh.read(8192))
+        return self._namespaces
+
+    def _materialize(self):
+        buffer = io.BytesIO()
+        self._write_appended(buffer)
+        self._blob = buffer.getvalue()
+        self._appended = []
+
+    def _write_appended(self, fileobj):
+        """复制原内容，在根元素结束标签之前写入追加的片段"""
+        tail = b''
+        with self._open_stored() as fh:
+            while True:
+                chunk = fh.read(_COPY_CHUNK_SIZE)
+                if not chunk:
+                    break
+                data = tail + chunk
+                fileobj.write(data[:-256])
+                tail = data[-256:]
+        close = tail.rfind(b'</')
+        if close < 0:
+            raise ValueError("Cannot append to %s: root element has no end tag" % self.partname)
+        fileobj.write(tail[:close])
+        for fragment in self._appended:
+            fileobj.write(fragment)
+        fileobj.write(tail[close:])
+
+    @property
+    def element(self) -> xml_engine.Element:
+        """
+        解析后的根元素。
+
+        调用方拿到的是可原地修改的树，因此访问后部件即视为脏部件；
+        只读的场景请使用 ``readonly_element`` 或 ``open()`` 做流式解析。
+        """
+        element = self.readonly_element
+        self._dirty = True
+        return element
+
+    @property
+    def readonly_element(self) -> xml_engine.Element:
+        """
+        与 ``element`` 是同一棵树，但不把部件标记为脏部件，未修改的部件保存时仍按原始字节复制。
+        调用方不得修改这棵树；确实修改了的话需要调用 ``mark_dirty()``。
+        """
+        if self._element is None:
+            blob = self.blob
+            self._namespaces = _root_namespaces(blob)
+            for prefix, uri in self._namespaces.items():
+                if not is_namespace_registered(prefix) and not re.match(r'ns\d+$', prefix):
+                    register_namespace(prefix, uri)
+            self._element = instrumentation.fromstring(blob, 'Part.element')
+        return self._element
+
+    def write(self, fileobj):
+        """
+        把部件内容写入二进制流。已解析的部件分块序列化，未解析的部件直接写入原始字节。
+        """
+        if self._element is None:
+            if self._appended:
+                self._write_appended(fileobj)
+            else:
+                fileobj.write(self.blob)
+            return
+        fileobj.write(XML_DECLARATION)
+        writer = _ChunkWriter(fileobj, self._namespaces or {})
+        instrumentation.write(self._element, writer, 'Part.write')
+
+    @property
+    def rels(self) -> Relationships:
+        if self._rels is None:
+            base_dir = posixpath.dirname(self.partname)
+            blob = None
+            if self._package is not None:
+                blob = self._package.read_optional(_rels_name(self.partname))
+            self._rels = Relationships.load(blob, base_dir) if blob else Relationships(base_dir)
+        return self._rels
+
+    def __repr__(self):
+        return f"<Part {self.partname}>"
+
+
+class Package:
+    """
+    直接从 zip 读取的 OPC 包。
+
+    打开时只读取 [Content_Types].xml 和包级关系，其余部件按需解压解析。
+    cache 为可选的 parse_cache.ParseCache，部件的预解析结果从中读取。
+    """
+
+    def __init__(self, zip_file: zipfile.ZipFile, cache=None):
+        self._zip = zip_file
+        self.cache = cache
+        self._parts: dict[str, Part] = {}
+        self.content_types = ContentTypes.load(zip_file.read(CONTENT_TYPES_NAME))
+        self.rels = Relationships.load(zip_file.read('_rels/.rels'), '/')
+
+    @classmethod
+    def open(cls, path_or_fileobj, cache=None):
+        return cls(zipfile.ZipFile(path_or_fileobj, 'r'), cache)
+
+    def close(self):
+        self._zip.close()
+
+    def is_source(self, fileobj) -> bool:
+        """fileobj 是否为打开包时传入的文件对象"""
+        return fileobj is self._zip.fp
+
+    def save(self, target):
+        """
+        流式写出压缩包。脏部件重新序列化，其余成员按原始压缩字节复制。
+
+        未修改的成员在写出时才从源压缩包读取，因此目标为路径时先写入同目录下的临时文件再替换，
+        可以原地保存到打开时的文件；目标不能是打开时传入的文件对象。
+        """
+        if isinstance(target, (str, os.PathLike)):
+            write_atomic(target, self._write)
+        elif self.is_source(target):
+            raise ValueError("Cannot save a package into the file object it is read from")
+        else:
+            self._write(target)
+
+    def _write(self, target):
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as out:
+            dirty_rels = {}
+            if self.rels.dirty:
+                dirty_rels['_rels/.rels'] = self.rels
+            for part in self._parts.values():
+                if part._rels is not None and part._rels.dirty:
+                    dirty_rels[_rels_name(part.partname)] = part._rels
+
+            written = set()
+            for info in self._zip.infolist():
+                name = info.filename
+                part = self._parts.get('/' + name)
+                if part is not None and part.dirty:
+                    self._write_part(out, part, info.date_time)
+                elif name == CONTENT_TYPES_NAME and self.content_types.dirty:
+                    out.writestr(self._zip_info(name, info.date_time), self.content_types.to_bytes())
+                elif name in dirty_rels:
+                    out.writestr(self._zip_info(name, info.date_time), dirty_rels[name].to_bytes())
+                else:
+                    copy_member(self._zip, out, info)
+                written.add(name)
+            for partname, part in self._parts.items():
+                if part.name not in written:
+                    self._write_part(out, part)
+            for name, rels in dirty_rels.items():
+                if name not in written:
+                    out.writestr(self._zip_info(name), rels.to_bytes())
+
+    def add_part(self, partname: str, content_type: str, blob: bytes, source, reltype: str) -> Part:
+        """
+        向包中加入新部件，并登记内容类型和来自 source（Part 或包本身）的关系。
+        """
+        part = Part(partname, content_type, self, blob)
+        part.mark_dirty()
+        self._parts[partname] = part
+        self.content_types.add_override(partname, content_type)
+        source.rels.relate_to(partname, reltype)
+        return part
+
+    @staticmethod
+    def _zip_info(name: str, date_time=None) -> zipfile.ZipInfo:
+        info = zipfile.ZipInfo(name, date_time=date_time or (1980, 1, 1, 0, 0, 0))
+        info.compress_type = zipfile.ZIP_DEFLATED
+        return info
+
+    @classmethod
+    def _write_part(cls, out: zipfile.ZipFile, part: Part, date_time=None):
+        with out.open(cls._zip_info(part.name, date_time), 'w') as fh:
+            part.write(fh)
+
+    def read(self, name: str) -> bytes:
+        return self._zip.read(name)
+
+    def namelist(self) -> list[str]:
+        return self._zip.namelist()
+
+    def partnames(self) -> list[str]:
+        """全部部件名，包括 add_part 新增、尚未保存的部件"""
+        names = ['/' + name for name in self._zip.namelist()]
+        existing = set(names)
+        names.extend(name for name in self._parts if name not in existing)
+        return names
+
+    def read_optional(self, name: str) -> bytes:
+        try:
+            return self._zip.read(name)
+        except KeyError:
+            return None
+
+    def infolist(self) -> list[zipfile.ZipInfo]:
+        return self._zip.infolist()
+
+    def copy_member(self, out: zipfile.ZipFile, info: zipfile.ZipInfo):
+        """把成员复制到另一个压缩包，尽可能不解压"""
+        copy_member(self._zip, out, info)
+
+    def member_info(self, name: str) -> zipfile.ZipInfo:
+        try:
+            return self._zip.getinfo(name)
+        except KeyError:
+            return None
+
+    def open_member(self, name: str):
+        return self._zip.open(name, 'r')
+
+    def exists(self, partname: str) -> bool:
+        if partname in self._parts:
+            return True
+        try:
+            self._zip.getinfo(partname.lstrip('/'))
+        except KeyError:
+            return False
+        return True
+
+    def part(self, partname: str) -> Part:
+        part = self._parts.get(partname)
+        if part is None:
+            if not self.exists(partname):
+                return None
+            part = Part(partname, self.content_types.get(partname), self)
+            self._parts[partname] = part
+        return part
+
+    def related_parts(self, source, reltype: str) -> list[Part]:
+        """返回 source（Part 或包本身）上指定关系类型的全部部件"""
+        parts = []
+        for rel in source.rels.by_type(reltype):
+            if rel.external:
+                continue
+            part = self.part(rel.target)
+            if part is not None:
+                parts.append(part)
+        return parts
+
+    @property
+    def main_document_part(self) -> Part:
+        parts = self.related_parts(self, RT_OFFICE_DOCUMENT)
+        return parts[0] if parts else None
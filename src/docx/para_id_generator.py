@@ -0,0 +1,255 @@
+import concurrent.futures
+import logging
+import os
+import re
+import time
+import zipfile
+from dataclasses import dataclass
+
+from . import xml_engine
+from .tags import W_P, W14_PARA_ID, W14_TEXT_ID
+from .utils.unique_id_generator import UniqueIDGenerator
+
+logger = logging.getLogger(__name__)
+
+# 可能包含段落ID的部件
+_PART_RE = re.compile(
+    r'^word/(document|comments|footnotes|endnotes|header\d*|footer\d*|glossary/document)\.xml$'
+)
+
+
+@dataclass
+class PartScanStats:
+    """单个部件的扫描结果"""
+    count: int = 0
+    seconds: float = 0.0
+    error: str = None
+
+
+def is_para_id_part(name: str) -> bool:
+    return _PART_RE.match(name) is not None
+
+
+def iter_para_ids(source, text_ids: bool = True):
+    """
+    用 iterparse 流式读取 source（路径或二进制流）中的段落ID，
+    text_ids 为 True 时同时返回 w14:textId，两者共用同一个ID空间。
+
+    属性在 start 事件中即可读取；元素在 end 事件后立即清空，
+    根元素的直接子元素结束时再清空根元素，树的内存占用保持常数级。
+    """
+    depth = 0
+    root = None
+    for event, element in xml_engine.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = element
+            depth += 1
+            if element.tag == W_P:
+                para_id = element.get(W14_PARA_ID)
+                if para_id:
+                    yield para_id
+                if text_ids:
+                    text_id = element.get(W14_TEXT_ID)
+                    if text_id:
+                        yield text_id
+        else:
+            depth -= 1
+            element.clear()
+            if depth == 1:
+                root.clear()
+
+
+def iter_element_para_ids(root: xml_engine.Element, text_ids: bool = True):
+    """与 iter_para_ids 相同，但读取已解析（可能已修改）的树"""
+    for p in root.iter(W_P):
+        para_id = p.get(W14_PARA_ID)
+        if para_id:
+            yield para_id
+        if text_ids:
+            text_id = p.get(W14_TEXT_ID)
+            if text_id:
+                yield text_id
+
+
+def _scan_task(task):
+    """
+    扫描任务：task 为 (名称, zip路径或None, 文件路径或成员名)。
+    定义在模块级，便于在进程池中执行。
+    """
+    name, zip_path, member = task
+    start = time.perf_counter()
+    if zip_path is None:
+        ids = list(iter_para_ids(member))
+    else:
+        with zipfile.ZipFile(zip_path) as zf, zf.open(member) as fh:
+            ids = list(iter_para_ids(fh))
+    return name, ids, time.perf_counter() - start
+
+
+def _scan_part(part):
+    """扫描内存中的部件：已解析的部件读取树，其余流式读取（包括追加的片段和新增部件）"""
+    start = time.perf_counter()
+    if part.loaded:
+        ids = list(iter_element_para_ids(part.readonly_element))
+    else:
+        with part.open() as fh:
+            ids = list(iter_para_ids(fh))
+    return part.name, ids, time.perf_counter() - start
+
+
+class ParaIdGenerator:
+    def __init__(self, docx_path, workers: int = 1, executor: str = 'thread'):
+        """
+        Initialize the paragraph ID generator with existing IDs.
+
+        docx_path may be an unzipped docx directory, a .docx file, or an opened
+        Docx. With workers > 1 the parts are scanned concurrently in a thread
+        pool, or a process pool when executor='process'.
+        """
+        self.part_stats: dict[str, PartScanStats] = {}
+        ids = set()
+        for _, part_ids in self._scan(docx_path, workers, executor):
+            ids.update(part_ids)
+
+        logger.info("找到 %d 个现有的段落ID", len(ids))
+
+        self.generator = UniqueIDGenerator(ids)
+
+    @classmethod
+    async def create_async(cls, docx_path, workers: int = 1, executor: str = 'thread'):
+        """
+        在 aio 的线程池中扫描文档，目录遍历和文件读取不阻塞事件循环。
+        """
+        from . import aio
+
+        async with aio.in_flight():
+            return await aio.offload(cls, docx_path, workers, executor)
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        """
+        从 ``to_bytes`` 导出的状态恢复，不需要重新扫描文档。
+        """
+        generator = cls.__new__(cls)
+        generator.part_stats = {}
+        generator.generator = UniqueIDGenerator.from_bytes(data)
+        return generator
+
+    def to_bytes(self) -> bytes:
+        return self.generator.to_bytes()
+
+    def _scan(self, source, workers, executor):
+        if hasattr(source, 'package'):
+            return self._scan_docx(source, workers)
+
+        if os.path.isdir(source):
+            word_dir = os.path.join(source, 'word')
+            tasks = []
+            for dirpath, _, filenames in os.walk(word_dir):
+                for filename in filenames:
+                    path = os.path.join(dirpath, filename)
+                    name = os.path.relpath(path, source).replace(os.sep, '/')
+                    if is_para_id_part(name):
+                        tasks.append((name, None, path))
+        else:
+            with zipfile.ZipFile(source) as zf:
+                tasks = [(name, source, name) for name in zf.namelist() if is_para_id_part(name)]
+
+        if workers <= 1 or len(tasks) <= 1:
+            results = map(self._safe(_scan_task), tasks)
+            return self._collect(results)
+        # concurrent.futures 按需导入各个执行器，只在用到时才加载 multiprocessing
+        if executor == 'process':
+            pool_cls = concurrent.futures.ProcessPoolExecutor
+        else:
+            pool_cls = concurrent.futures.ThreadPoolExecutor
+        with pool_cls(max_workers=workers) as pool:
+            futures = [pool.submit(_scan_task, task) for task in tasks]
+            results = []
+            for task, future in zip(tasks, futures):
+                try:
+                    results.append(future.result())
+                except (xml_engine.ParseError, OSError, zipfile.BadZipFile) as e:
+                    results.append((task[0], e, 0.0))
+        return self._collect(results)
+
+    def _scan_docx(self, docx, workers):
+        if docx.package is None:
+            parts = [docx.document]
+        else:
+            parts = [docx.package.part(name) for name in docx.package.partnames()
+                     if is_para_id_part(name.lstrip('/'))]
+        scan = self._safe(_scan_part, lambda part: part.name)
+        if workers <= 1 or len(parts) <= 1:
+            return self._collect(map(scan, parts))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as pool:
+            return self._collect(list(pool.map(scan, parts)))
+
+    @staticmethod
+    def _safe(func, name_of=lambda task: task[0]):
+        def wrapper(task):
+            try:
+                return func(task)
+            except (xml_engine.ParseError, OSError, zipfile.BadZipFile) as e:
+                return name_of(task), e, 0.0
+        return wrapper
+
+    def _collect(self, results):
+        for name, ids, seconds in results:
+            if isinstance(ids, Exception):
+                logger.warning("读取部件 %s 时出错: %s", name, ids)
+                self.part_stats[name] = PartScanStats(error=str(ids))
+                continue
+            self.part_stats[name] = PartScanStats(len(ids), seconds)
+            logger.debug("从 %s 中提取到 %d 个段落ID，用时 %.3fs", name, len(ids), seconds)
+            yield name, ids
+
+    def generate_unique_id(self):
+        """
+        Generate a unique paragraph ID.
+        """
+        return self.generator.generate_unique_id()
+
+    def reserve(self, n: int) -> list[str]:
+        """
+        Reserve n unique paragraph IDs at once.
+        """
+        return self.generator.reserve(n)
+
+    def add(self, para_id: str):
+        """
+        Register an ID created elsewhere so it is never generated.
+        """
+        self.generator.add(para_id)
+
+    def update(self, para_ids):
+        """
+        Register many IDs created elsewhere at once.
+        """
+        self.generator.update(para_ids)
+
+    def reset(self):
+        """
+        Reset the paragraph ID generator.
+        """
+        self.generator.reset()
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG)
+    # 测试提取段落ID
+    docx_extract_path = './doc/extracted_docx'  # 解压后的docx目录
+
+    if os.path.exists(docx_extract_path):
+        generator = ParaIdGenerator(docx_extract_path)
+
+        # 生成几个新的唯一ID
+        print("\n生成新的唯一ID:")
+        for i in range(5):
+            new_id = generator.generate_unique_id()
+            print(f"新ID {i+1}: {new_id}")
+        for name, stats in generator.part_stats.items():
+            print(f"{name}: {stats.count} 个ID, {stats.seconds:.3f}s")
+    else:
+        print(f"目录不存在: {docx_extract_path}")
+        print("请先解压docx文件")
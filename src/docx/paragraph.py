@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+
+from . import instrumentation
+from . import xml_engine
+from .run import Run
+from .text import Text
+
+from .tags import (
+    PATH_PSTYLE, W_BDO, W_COMMENT_REFERENCE, W_CUSTOM_XML, W_DEL, W_DIR, W_FLD_SIMPLE, W_HYPERLINK,
+    W_ID, W_INS, W_MOVE_FROM, W_MOVE_TO, W_P, W_PPR, W_R, W_SDT, W_SDT_CONTENT,
+    W_SMART_TAG, W_VAL, W14_PARA_ID,
+)
+
+# 可以包含 w:r 的段落级容器
+_RUN_CONTAINERS = frozenset((
+    W_HYPERLINK, W_INS, W_SMART_TAG, W_FLD_SIMPLE, W_CUSTOM_XML, W_SDT, W_SDT_CONTENT, W_DIR, W_BDO,
+))
+_REVISION_TAGS = frozenset((W_INS, W_DEL, W_MOVE_FROM, W_MOVE_TO))
+
+
+def _iter_runs(element: xml_engine.Element):
+    for child in element:
+        if child.tag == W_R:
+            yield child
+        elif child.tag in _RUN_CONTAINERS:
+            yield from _iter_runs(child)
+
+
+class Paragraph:
+    """
+    w:p 元素的包装对象。
+
+    段落维护一个字符偏移索引：``_starts[k]`` 是第 k 个 (Run, Text) 文本片段
+    在段落文本中的起始偏移，定位某个偏移只需要一次二分查找；
+    区间修改只改动受影响的 w:t，并增量更新索引。
+    """
+
+    def __init__(self, element: xml_engine.Element = None):
+        if element is None:
+            element = xml_engine.Element(W_P)
+            instrumentation.record_created('Paragraph.__init__', element)
+        self._element: xml_engine.Element = element
+        self._runs: list[Run] = None
+        self._slots: list[tuple[Run, Text]] = None
+        self._starts: list[int] = None
+        self._length = 0
+
+    @property
+    def element(self) -> xml_engine.Element:
+        return self._element
+
+    @property
+    def xml(self) -> str:
+        # 仅在需要时序列化
+        return instrumentation.tostring(self._element, 'Paragraph.xml')
+
+    @classmethod
+    def from_xml_str(cls, xml: str):
+        root = instrumentation.fromstring(xml, 'Paragraph.from_xml_str')
+        return cls.from_xml(root)
+
+    @classmethod
+    def from_xml(cls, xml: xml_engine.Element):
+        return cls(xml)
+
+    @staticmethod
+    def is_valid_paragraph(xml: xml_engine.Element) -> bool:
+        # Check if the XML element is a valid paragraph
+        return xml.tag == W_P
+
+    @property
+    def para_id(self) -> str:
+        return self._element.get(W14_PARA_ID)
+
+    @property
+    def style(self) -> str:
+        pstyle = self._element.find(PATH_PSTYLE)
+        return pstyle.get(W_VAL) if pstyle is not None else None
+
+    @property
+    def ppr(self) -> xml_engine.Element:
+        return self._element.find(W_PPR)
+
+    @property
+    def runs(self) -> list[Run]:
+        if self._runs is None:
+            self._runs = [Run.load_from_xml(r) for r in _iter_runs(self._element)]
+        return self._runs
+
+    @property
+    def texts(self) -> list[Text]:
+        return [text for _, text in self._index()[0]]
+
+    @property
+    def comments(self) -> list[str]:
+        """段落中引用的批注ID"""
+        return [ref.get(W_ID) for ref in self._element.iter(W_COMMENT_REFERENCE)]
+
+    @property
+    def revisions(self) -> list[xml_engine.Element]:
+        return [child for child in self._element.iter() if child.tag in _REVISION_TAGS]
+
+    @property
+    def text(self) -> str:
+        return "".join(text.text for text in self.texts)
+
+    def _index(self):
+        if self._slots is None:
+            slots, starts, offset = [], [], 0
+            for run in self.runs:
+                for text in run.texts:
+                    slots.append((run, text))
+                    starts.append(offset)
+                    offset += len(text.text)
+            self._slots, self._starts, self._length = slots, starts, offset
+        return self._slots, self._starts
+
+    def __len__(self):
+        self._index()
+        return self._length
+
+    def locate(self, offset: int) -> tuple[Run, Text, int]:
+        """
+        把段落文本中的偏移映射为 (Run, Text, Text 内偏移)。
+        """
+        slots, starts = self._index()
+        if not slots or not 0 <= offset <= self._length:
+            raise IndexError(offset)
+        k = max(bisect_right(starts, offset) - 1, 0)
+        run, text = slots[k]
+        return run, text, offset - starts[k]
+
+    def replace_range(self, start: int, end: int, new_text: str):
+        """
+        把段落文本 [start, end) 替换为 new_text，新文本沿用第一个受影响 Run 的格式。
+        """
+        slots, starts = self._index()
+        if not 0 <= start <= end <= self._length:
+            raise IndexError((start, end))
+        if not slots:
+            run = Run()
+            run.text = new_text
+            self._element.append(run.element)
+            self._runs = None
+            self._slots = None
+            return
+
+        i = max(bisect_right(starts, start) - 1, 0)
+        # 结束位置落在片段边界上时归属前一个片段，避免多改一个 Run
+        j = max(bisect_left(starts, end) - 1, i) if end > start else i
+        first = slots[i][1]
+        last = slots[j][1]
+        a = start - starts[i]
+        b = end - starts[j]
+
+        first_text = first.text
+        if i == j:
+            value = first_text[:a] + new_text + first_text[b:]
+        else:
+            value = first_text[:a] + new_text
+            rest = last.text[b:]
+            last.text = rest
+            if rest != rest.strip():
+                last.preserve_space = True
+        first.text = value
+        if value != value.strip():
+            first.preserve_space = True
+
+        for run, text in slots[i + 1:j]:
+            run.remove_text(text)
+
+        # 增量更新索引：删除中间片段，平移之后的起始偏移
+        delta = len(new_text) - (end - start)
+        del slots[i + 1:j]
+        del starts[i + 1:j]
+        following = i + 1
+        if j > i:
+            starts[following] = starts[i] + len(value)
+            following += 1
+        for k in range(following, len(starts)):
+            starts[k] += delta
+        self._length += delta
+
+    def get_text(self) -> str:
+        return self.text
+
+    def get_xml(self) -> str:
+        return self.xml
+
+    def get_ppr(self) -> str:
+        ppr = self.ppr
+        return instrumentation.tostring(ppr, 'Paragraph.get_ppr') if ppr is not None else None
+
+    def get_runs(self) -> list:
+        return self.runs
+
+    def set_text(self, new_text: str):
+        self.replace_range(0, len(self), new_text)
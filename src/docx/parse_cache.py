@@ -0,0 +1,186 @@
+"""
+可选的磁盘解析缓存。
+
+服务反复打开同一批模板时，部件的预解析结果（段落表、样式表）以
+(种类, 成员名, zip 中的 CRC32, 解压后大小) 为键保存在缓存目录中；
+命中时 mmap 条目文件后直接 marshal.loads，不再解压和解析 XML。
+
+    cache = ParseCache('/var/cache/docx', max_bytes=512 << 20)
+    with Docx.open('template.docx', cache=cache) as doc:
+        ...
+
+也可以设置环境变量 DOCX_PARSE_CACHE=<目录>，Docx.open 默认使用该目录。
+只有未修改、直接来自压缩包的部件才会读写缓存。条目只包含内置类型，
+与 XML 引擎无关；总大小超过上限时按最近使用时间淘汰。多个进程可以共享同一目录。
+"""
+import hashlib
+import marshal
+import mmap
+import os
+import tempfile
+import threading
+
+CACHE_ENV = 'DOCX_PARSE_CACHE'
+DEFAULT_MAX_BYTES = 256 << 20
+
+# 条目格式变化时递增，旧条目的键随之失效
+FORMAT_VERSION = 3
+
+_MAGIC = b'DXPC'
+_SUFFIX = '.entry'
+_MISSING = object()
+
+_default: dict = {}
+_default_lock = threading.Lock()
+
+
+class ParseCache:
+    """
+    目录中的一组缓存条目，每个条目一个文件。
+
+    读取只 mmap 文件，命中时更新文件的修改时间作为最近使用时间；
+    写入先写临时文件再原子替换，写入后如果总大小超过 max_bytes，从最久未用的条目开始删除。
+    """
+
+    def __init__(self, directory, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.directory = os.fspath(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, part, kind: str) -> str:
+        """部件的缓存键；部件已修改或不是来自压缩包时为 None"""
+        info = part.zip_info
+        if info is None:
+            return None
+        raw = '%d:%s:%s:%08x:%d' % (FORMAT_VERSION, kind, info.filename, info.CRC, info.file_size)
+        return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    def load(self, part, kind: str, build):
+        """
+        返回部件 kind 种类的预解析数据。未命中时调用 build() 生成并写入缓存，
+        build 的结果必须可以 marshal（只由内置类型组成）。
+        """
+        key = self.key(part, kind)
+        if key is None:
+            return build()
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = build()
+            self.put(key, value)
+        return value
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key: str, default=None):
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as fh, mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if mm[:len(_MAGIC)] != _MAGIC:
+                    raise ValueError('bad cache entry')
+                with memoryview(mm) as view, view[len(_MAGIC):] as body:
+                    value = marshal.loads(body)
+        except FileNotFoundError:
+            self.misses += 1
+            return default
+        except (OSError, ValueError, EOFError, TypeError):
+            # 空文件或损坏的条目，删除后按未命中处理
+            self._remove(path)
+            self.misses += 1
+            return default
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value):
+        data = _MAGIC + marshal.dumps(value)
+        if len(data) > self.max_bytes:
+            return
+        # 缓存写不进去（磁盘满、目录只读）不影响文档的读写
+        try:
+            fd, tmp = tempfile.mkstemp(suffix='.tmp', dir=self.directory)
+            try:
+                with os.fdopen(fd, 'wb') as fh:
+                    fh.write(data)
+                os.replace(tmp, self._path(key))
+            except BaseException:
+                self._remove(tmp)
+                raise
+        except OSError:
+            return
+        self._evict()
+
+    def _entries(self) -> list[tuple[float, int, str]]:
+        entries = []
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if not entry.name.endswith(_SUFFIX):
+                    continue
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _evict(self):
+        with self._lock:
+            entries = self._entries()
+            total = sum(size for _, size, _ in entries)
+            if total <= self.max_bytes:
+                return
+            entries.sort()
+            for _, size, path in entries:
+                self._remove(path)
+                total -= size
+                if total <= self.max_bytes:
+                    break
+
+    @staticmethod
+    def _remove(path: str):
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+    @property
+    def size(self) -> int:
+        """全部条目的总字节数"""
+        return sum(size for _, size, _ in self._entries())
+
+    def clear(self):
+        with self._lock:
+            for _, _, path in self._entries():
+                self._remove(path)
+
+
+def default_cache() -> ParseCache:
+    """环境变量 DOCX_PARSE_CACHE 指定的缓存，未设置时为 None"""
+    directory = os.environ.get(CACHE_ENV)
+    if not directory:
+        return None
+    with _default_lock:
+        cache = _default.get(directory)
+        if cache is None:
+            cache = _default[directory] = ParseCache(directory)
+        return cache
+
+
+def resolve(cache) -> ParseCache:
+    """
+    Docx.open 的 cache 参数：ParseCache、缓存目录，None 表示使用 default_cache()，
+    False 表示不使用缓存。
+    """
+    if cache is None:
+        return default_cache()
+    if cache is False:
+        return None
+    if isinstance(cache, ParseCache):
+        return cache
+    return ParseCache(cache)
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from .text import Text
+from . import xml_engine
+from . import instrumentation
+from .run_properties import RunProperties
+from .tags import W_R, W_RPR, W_T
+
+class Run:
+    """
+    w:r 元素的包装对象。
+
+    Run 直接持有文档树中的 w:r 元素，setter 原地修改该元素，
+    文本和属性按需从元素中读取并缓存，只有访问 ``xml`` 时才序列化。
+    """
+
+    def __init__(self, element: xml_engine.Element = None):
+        if element is None:
+            element = xml_engine.Element(W_R)
+            instrumentation.record_created('Run.__init__', element)
+        self._element: xml_engine.Element = element
+        self._rpr: RunProperties = None
+        self._texts: list[Text] = None
+
+    @property
+    def element(self) -> xml_engine.Element:
+        return self._element
+
+    @property
+    def text(self) -> str:
+        return "".join(t.text or '' for t in self._element.findall(W_T))
+
+    @property
+    def xml(self) -> str:
+        return instrumentation.tostring(self._element, 'Run.xml')
+
+    @property
+    def rpr(self) -> RunProperties:
+        if self._rpr is None:
+            self._rpr = RunProperties.load_from_xml(self._element.find(W_RPR))
+        return self._rpr
+
+    @property
+    def texts(self) -> list:
+        if self._texts is None:
+            self._texts = [Text.load_from_xml(t) for t in self._element.findall(W_T)]
+        return self._texts
+
+    @text.setter
+    def text(self, value: str):
+        self._text_update(value)
+
+    @rpr.setter
+    def rpr(self, value: RunProperties):
+        self._rpr = value
+        self._rpr_update()
+
+    @texts.setter
+    def texts(self, value: list):
+        self._texts = list(value)
+        self._texts_update()
+
+    @xml.setter
+    def xml(self, value: str):
+        self._xml_update(instrumentation.fromstring(value, 'Run.xml'))
+
+    def update_rpr(self, **changes):
+        """
+        只修改 changes 中的格式属性（值为 None 表示移除），
+        与 ``rpr`` setter 不同，w:rPr 中 RunProperties 不建模的子元素原样保留。
+        """
+        rpr = (self.rpr or RunProperties()).replace(**changes)
+        element = self._element.find(W_RPR)
+        if element is None:
+            element = xml_engine.Element(W_RPR)
+            instrumentation.record_created('Run.update_rpr', element)
+            self._element.insert(0, element)
+        rpr.patch(element, changes)
+        self._rpr = rpr
+
+    def remove_text(self, text: Text):
+        """
+        从 w:r 中移除一个 w:t
+        """
+        if any(child is text.element for child in self._element):
+            self._element.remove(text.element)
+        if self._texts is not None and text in self._texts:
+            self._texts.remove(text)
+
+    def _remove_texts(self):
+        for child in self._element.findall(W_T):
+            self._element.remove(child)
+
+    def _texts_update(self):
+        """
+        根据文本对象更新 w:r 元素中的 w:t 子元素
+        """
+        self._remove_texts()
+        for t in self._texts:
+            self._element.append(t.to_xml())
+
+    def _rpr_update(self):
+        """
+        根据属性变化更新 w:rPr 子元素
+        """
+        for child in self._element.findall(W_RPR):
+            self._element.remove(child)
+        if self._rpr is not None:
+            self._element.insert(0, self._rpr.to_xml_element())
+
+    def _text_update(self, value: str):
+        """
+        用单个 w:t 替换 w:r 中现有的文本元素
+        """
+        t = Text(value)
+        self._texts = [t]
+        self._remove_texts()
+        self._element.append(t.to_xml())
+
+    def _xml_update(self, element: xml_engine.Element):
+        """
+        用新解析的元素原地替换 w:r 的内容，并清空缓存
+        """
+        tail = self._element.tail
+        self._element.clear()
+        self._element.tag = element.tag
+        self._element.attrib.update(element.attrib)
+        self._element.text = element.text
+        self._element.extend(list(element))
+        self._element.tail = tail
+        self._rpr = None
+        self._texts = None
+
+    @classmethod
+    def load_from_xml(cls, xml: xml_engine.Element):
+        return cls(xml)
+
+    @classmethod
+    def from_xml_str(cls, xml: str):
+        return cls(instrumentation.fromstring(xml, 'Run.from_xml_str'))
@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import dataclasses
+import itertools
+from dataclasses import dataclass
+from . import font as _font_module
+from .font import Font
+from . import xml_engine
+
+from . import instrumentation
+from .tags import (
+    W_ASCII, W_ASCII_THEME, W_B, W_COLOR, W_EAST_ASIA, W_EAST_ASIA_THEME, W_HANSI, W_HANSI_THEME,
+    W_HIGHLIGHT, W_HINT, W_I, W_ICS, W_KERN, W_NS, W_RFONTS, W_RPR, W_SPACING, W_SZ, W_SZ_CS, W_VAL,
+)
+
+_FALSE_VALUES = ('0', 'false', 'off')
+
+# 相同格式共享同一个实例，以及该实例对应的 w:rPr 元素和字节。
+# 三张表都有上限：超过 MAX_INTERNED 项时丢弃最早加入的一半，长时间运行的进程内存不会无限增长；
+# 因此相等的格式不保证是同一个实例，比较格式应使用 ==。
+MAX_INTERNED = 4096
+
+_interned: dict = {}
+_element_cache: dict = {}
+_bytes_cache: dict = {}
+
+
+def trim_cache(cache: dict, limit: int):
+    """表超过 limit 项时丢弃最早加入的项，只保留 limit // 2 项"""
+    if len(cache) > limit:
+        for key in list(itertools.islice(cache, len(cache) - limit // 2)):
+            del cache[key]
+
+
+def _toggle(element: xml_engine.Element) -> bool:
+    return element.get(W_VAL, 'true').lower() not in _FALSE_VALUES
+
+
+def _int_val(element: xml_engine.Element) -> int:
+    val = element.get(W_VAL)
+    try:
+        return int(val)
+    except (TypeError, ValueError):
+        return None
+
+
+def _str_val(element: xml_engine.Element) -> str:
+    return element.get(W_VAL)
+
+
+def _font(element: xml_engine.Element) -> Font:
+    return Font(
+        element.get(W_ASCII) or "",
+        element.get(W_HANSI) or "",
+        element.get(W_EAST_ASIA) or "",
+        element.get(W_HINT) or "",
+    )
+
+
+# w:rPr 子元素 -> (字段名, 读取函数)，解析时每个子元素只做一次字典查找
+_READERS = {
+    W_RFONTS: ('font', _font),
+    W_SZ: ('size', _int_val),
+    W_SZ_CS: ('size_cs', _int_val),
+    W_B: ('bold', _toggle),
+    W_I: ('italic', _toggle),
+    W_ICS: ('italic_cs', _toggle),
+    W_COLOR: ('color', _str_val),
+    W_HIGHLIGHT: ('highlight_color', _str_val),
+    W_KERN: ('kern', _int_val),
+    W_SPACING: ('spacing', _int_val),
+}
+
+
+_FIELD_TAGS = {field: tag for tag, (field, _) in _READERS.items()}
+
+# CT_RPr 中子元素的顺序，patch 插入新子元素时据此定位
+_RPR_ORDER = {'{%s}%s' % (W_NS, name): position for position, name in enumerate((
+    'rStyle', 'rFonts', 'b', 'bCs', 'i', 'iCs', 'caps', 'smallCaps', 'strike', 'dstrike', 'outline',
+    'shadow', 'emboss', 'imprint', 'noProof', 'snapToGrid', 'vanish', 'webHidden', 'color', 'spacing',
+    'w', 'kern', 'position', 'sz', 'szCs', 'highlight', 'u', 'effect', 'bdr', 'shd', 'fitText',
+    'vertAlign', 'rtl', 'cs', 'em', 'lang', 'eastAsianLayout', 'specVanish', 'oMath',
+))}
+
+# w:rFonts 上的字体属性，以及会覆盖它的主题字体属性
+_FONT_ATTRIBUTES = ((W_ASCII, W_ASCII_THEME), (W_HANSI, W_HANSI_THEME), (W_EAST_ASIA, W_EAST_ASIA_THEME), (W_HINT, None))
+
+
+def _insert_ordered(rPr: xml_engine.Element, child: xml_engine.Element):
+    position = _RPR_ORDER[child.tag]
+    for index, existing in enumerate(rPr):
+        # 未知的子元素（扩展命名空间等）视为排在最后
+        if _RPR_ORDER.get(existing.tag, len(_RPR_ORDER)) > position:
+            rPr.insert(index, child)
+            return
+    rPr.append(child)
+
+
+def _patch_fonts(rFonts: xml_engine.Element, font: Font):
+    """改写 w:rFonts 上建模的字体属性，w:cs 等其他属性保持不变"""
+    for (attribute, theme), value in zip(_FONT_ATTRIBUTES, (font.ascii, font.hAnsi, font.eastAsia, font.hint)):
+        if value:
+            rFonts.set(attribute, value)
+            if theme is not None:
+                rFonts.attrib.pop(theme, None)
+        else:
+            rFonts.attrib.pop(attribute, None)
+
+
+def clear_intern_cache():
+    """清空共享实例及其序列化缓存"""
+    _interned.clear()
+    _element_cache.clear()
+    _bytes_cache.clear()
+    _font_module.clear_intern_cache()
+
+
+@dataclass(frozen=True, slots=True)
+class RunProperties:
+    font: Font = None  # 字体名称
+    size: int = None   # 字体大小
+    size_cs: int = None  # 字体大小（复杂脚本）
+    color: str = None  # 字体颜色
+    bold: bool = None  # 是否加粗
+    italic: bool = None  # 是否斜体
+    italic_cs: bool = None  # 是否复杂脚本斜体
+    highlight_color: str = None  # 高亮颜色
+    kern: int = None  # 字偶间距
+    spacing: int = None  # 字符间距
+
+    def intern(self) -> "RunProperties":
+        """返回与之相等的共享实例，文档中相同的格式只保留一份"""
+        interned = _interned.get(self)
+        if interned is None:
+            font = self.font.intern() if self.font is not None else None
+            interned = self if font is self.font else dataclasses.replace(self, font=font)
+            _interned[interned] = interned
+            trim_cache(_interned, MAX_INTERNED)
+        return interned
+
+    def to_tuple(self) -> tuple:
+        """只由内置类型组成的元组（可以 marshal），与 from_tuple 互逆"""
+        values = [getattr(self, field.name) for field in dataclasses.fields(self)]
+        if self.font is not None:
+            values[0] = (self.font.ascii, self.font.hAnsi, self.font.eastAsia, self.font.hint)
+        return tuple(values)
+
+    @classmethod
+    def from_tuple(cls, values: tuple) -> "RunProperties":
+        font = values[0]
+        return cls(Font(*font) if font is not None else None, *values[1:]).intern()
+
+    def replace(self, **changes) -> "RunProperties":
+        """返回修改了部分属性的共享实例"""
+        return dataclasses.replace(self, **changes).intern()
+
+    def merge(self, other: "RunProperties") -> "RunProperties":
+        """
+        在本格式之上叠加 other：other 中不为 None 的属性覆盖本格式，
+        字体按各个字段分别覆盖。返回共享实例。
+        """
+        if other is None:
+            return self.intern()
+        changes = {}
+        for field in dataclasses.fields(self):
+            value = getattr(other, field.name)
+            if value is not None:
+                changes[field.name] = value
+        if self.font is not None and other.font is not None:
+            changes['font'] = Font(
+                other.font.ascii or self.font.ascii,
+                other.font.hAnsi or self.font.hAnsi,
+                other.font.eastAsia or self.font.eastAsia,
+                other.font.hint or self.font.hint,
+            )
+        return dataclasses.replace(self, **changes).intern() if changes else self.intern()
+
+    def _build_element(self) -> xml_engine.Element:
+        rpr = xml_engine.Element(W_RPR)
+        # 子元素顺序遵循 CT_RPr 的定义
+        # 字体样式
+        if self.font:
+            rFonts = xml_engine.SubElement(rpr, W_RFONTS)
+            if self.font.ascii:
+                rFonts.set(W_ASCII, self.font.ascii)
+            if self.font.hAnsi:
+                rFonts.set(W_HANSI, self.font.hAnsi)
+            if self.font.eastAsia:
+                rFonts.set(W_EAST_ASIA, self.font.eastAsia)
+            if self.font.hint:
+                rFonts.set(W_HINT, self.font.hint)
+        if self.bold is not None:
+            b = xml_engine.SubElement(rpr, W_B)
+            if not self.bold:
+                b.set(W_VAL, '0')
+        if self.italic is not None:
+            i = xml_engine.SubElement(rpr, W_I)
+            if not self.italic:
+                i.set(W_VAL, '0')
+        if self.italic_cs is not None:
+            iCs = xml_engine.SubElement(rpr, W_ICS)
+            if not self.italic_cs:
+                iCs.set(W_VAL, '0')
+        if self.color:
+            color = xml_engine.SubElement(rpr, W_COLOR)
+            color.set(W_VAL, self.color)
+        if self.spacing:
+            spacing = xml_engine.SubElement(rpr, W_SPACING)
+            spacing.set(W_VAL, str(self.spacing))
+        if self.kern:
+            kern = xml_engine.SubElement(rpr, W_KERN)
+            kern.set(W_VAL, str(self.kern))
+        # 字体大小
+        if self.size:
+            sz = xml_engine.SubElement(rpr, W_SZ)
+            sz.set(W_VAL, str(self.size))
+        if self.size_cs is not None:
+            szCs = xml_engine.SubElement(rpr, W_SZ_CS)
+            szCs.set(W_VAL, str(self.size_cs))
+        if self.highlight_color:
+            highlight = xml_engine.SubElement(rpr, W_HIGHLIGHT)
+            highlight.set(W_VAL, self.highlight_color)
+        instrumentation.record_created('RunProperties._build_element', rpr)
+        return rpr
+
+    def _cache_element(self) -> xml_engine.Element:
+        element = _element_cache[self] = self._build_element()
+        trim_cache(_element_cache, MAX_INTERNED)
+        return element
+
+    def to_xml_element(self) -> xml_engine.Element:
+        """转换为XML元素，返回缓存元素的副本，可以直接插入文档树"""
+        element = _element_cache.get(self)
+        if element is None:
+            element = self._cache_element()
+        return instrumentation.deepcopy(element, 'RunProperties.to_xml_element')
+
+    def to_xml_bytes(self) -> bytes:
+        """转换为序列化后的 w:rPr，结果按格式缓存"""
+        data = _bytes_cache.get(self)
+        if data is None:
+            element = _element_cache.get(self)
+            if element is None:
+                element = self._cache_element()
+            data = _bytes_cache[self] = instrumentation.tostring(element, 'RunProperties.to_xml_bytes', None)
+            trim_cache(_bytes_cache, MAX_INTERNED)
+        return data
+
+    def patch(self, rPr: xml_engine.Element, fields) -> None:
+        """
+        只把 fields 中的属性写入已有的 w:rPr：对应子元素被替换，属性为 None 时被移除。
+        RunProperties 不建模的子元素（w:rStyle、w:u、w:lang 等）保持原样和原有顺序。
+        """
+        built = _element_cache.get(self)
+        if built is None:
+            built = self._cache_element()
+        for name in fields:
+            tag = _FIELD_TAGS[name]
+            old = rPr.find(tag)
+            new = built.find(tag)
+            if name == 'font' and old is not None and new is not None:
+                _patch_fonts(old, self.font)
+                continue
+            if old is not None:
+                rPr.remove(old)
+            if new is not None:
+                _insert_ordered(rPr, instrumentation.deepcopy(new, 'RunProperties.patch'))
+
+    @classmethod
+    def load_from_xml(cls, rPr: xml_engine.Element):
+        if rPr is None:
+            return None
+        values = {}
+        for child in rPr:
+            reader = _READERS.get(child.tag)
+            if reader is not None:
+                field, read = reader
+                values[field] = read(child)
+        return cls(**values).intern()
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+
+from . import xml_engine
+from .paragraph import Paragraph, _iter_runs
+from .tags import W_P, W_T, W14_PARA_ID, XML_SPACE
+
+
+@dataclass(frozen=True, slots=True)
+class Match:
+    """
+    一次匹配。start / end 是在段落文本（Paragraph.text）中的偏移，
+    pattern 为命中的原始模式，groups 为正则模式下的分组内容。
+    """
+    part: str
+    paragraph: int
+    para_id: str
+    start: int
+    end: int
+    text: str
+    pattern: str
+    groups: tuple = ()
+    # 正则模式下的 re.Match（在段落文本上），用于展开替换串
+    regex_match: re.Match = field(default=None, compare=False, repr=False)
+
+
+def _paragraph_text(element: xml_engine.Element) -> str:
+    """与 Paragraph.text 规则一致，但不创建 Run / Text 对象"""
+    pieces = []
+    for run in _iter_runs(element):
+        for t in run.findall(W_T):
+            value = t.text or ""
+            if t.get(XML_SPACE) != 'preserve':
+                value = value.strip()
+            pieces.append(value)
+    return "".join(pieces)
+
+
+# 模式中引用分组（\1、(?P=name)、(?(1)...)）时，合并为一个正则会改变分组编号
+_GROUP_REFERENCE_RE = re.compile(r'\\[1-9]|\(\?P=|\(\?\(')
+
+
+def _trie_pattern(trie: dict) -> str:
+    """
+    把字典树转换为正则，公共前缀只匹配一次，同一位置优先最长的模式。
+    字典树中 '' 键的值为模式序号，模式结束处放一个空的具名分组 _k，
+    由 lastgroup 直接得到命中的模式，不需要按匹配文本反查。
+    用显式栈后序遍历，很长的字面量也不会超出递归深度。
+    """
+    results: dict[int, str] = {}
+    stack = [(trie, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            stack.append((node, True))
+            stack.extend((child, False) for key, child in node.items() if key)
+            continue
+        branches = [re.escape(char) + results.pop(id(node[char]))
+                    for char in sorted(key for key in node if key)]
+        if '' in node:
+            # 空分支排在最后，同一位置先尝试更长的模式
+            branches.append('(?P<_%d>)' % node[''])
+        results[id(node)] = branches[0] if len(branches) == 1 else '(?:%s)' % '|'.join(branches)
+    return results[id(trie)]
+
+
+class Searcher:
+    """
+    把多个模式编译为一个正则，对文本只扫描一次。
+
+    字面量模式合并为字典树形式的正则（效果类似 Aho-Corasick），
+    模式数量增加时扫描开销基本不变；按 flags（如 IGNORECASE）会匹配相同文本的不同字面量无法区分，
+    抛出 ValueError。正则模式用具名分组合并。
+    正则中引用了分组（合并后编号会变化）或不能合并时，各个正则分别扫描，
+    再按位置合并结果，命中的模式与合并扫描相同。
+    """
+
+    def __init__(self, patterns, regex: bool = False, flags: int = 0):
+        if isinstance(patterns, (str, re.Pattern)):
+            patterns = [patterns]
+        self.patterns = [p.pattern if isinstance(p, re.Pattern) else p for p in patterns]
+        if not self.patterns or any(p == '' for p in self.patterns):
+            raise ValueError("search patterns must be non-empty")
+        self.regex = regex
+        self._parts = None
+        self._compiled = None
+        if not regex:
+            trie: dict = {}
+            for k, pattern in enumerate(self.patterns):
+                node = trie
+                for char in pattern:
+                    node = node.setdefault(char, {})
+                node.setdefault('', k)
+            self._compiled = re.compile(_trie_pattern(trie), flags)
+            if flags & re.IGNORECASE:
+                self._check_literals()
+        elif len(self.patterns) == 1:
+            self._compiled = re.compile(self.patterns[0], flags)
+        else:
+            self._parts = [re.compile(p, flags) for p in self.patterns]
+            if not any(_GROUP_REFERENCE_RE.search(p) for p in self.patterns):
+                try:
+                    self._compiled = re.compile(
+                        '|'.join('(?P<_%d>%s)' % (k, p) for k, p in enumerate(self.patterns)), flags)
+                except re.error:
+                    # 重名的分组、只能出现在开头的内联标志等
+                    self._compiled = None
+
+    def _check_literals(self):
+        """每个字面量在自身文本上必须命中自己，否则它与另一个模式匹配相同的文本，永远不会被报告"""
+        for pattern in self.patterns:
+            other = self.patterns[int(self._compiled.fullmatch(pattern).lastgroup[1:])]
+            if other != pattern:
+                raise ValueError("patterns %r and %r match the same text" % (other, pattern))
+
+    def finditer(self, text: str):
+        """产生 (start, end, pattern, re.Match 或 None)，跳过空匹配；正则模式下 re.Match 只对应命中的模式"""
+        if self._compiled is None:
+            yield from self._finditer_separately(text)
+            return
+        for m in self._compiled.finditer(text):
+            start, end = m.span()
+            if start == end:
+                continue
+            if not self.regex:
+                yield start, end, self.patterns[int(m.lastgroup[1:])], None
+            elif self._parts is None:
+                yield start, end, self.patterns[0], m
+            else:
+                k = int(m.lastgroup[1:])
+                # 在原位置单独重跑命中的模式，得到按它自己编号的分组；不限定结束位置，前后文断言照常生效
+                yield start, end, self.patterns[k], self._parts[k].match(text, start)
+
+    def _finditer_separately(self, text: str):
+        """
+        各个正则分别向前查找，每次取起点最靠前的匹配，起点相同时取排在前面的模式，
+        与合并为一个分支正则时的结果一致。
+        """
+        # 每个模式的下一个匹配，None 表示之后不会再有匹配
+        heads = [_search_nonempty(compiled, text, 0) for compiled in self._parts]
+        pos = 0
+        while True:
+            best = None
+            for k, m in enumerate(heads):
+                if m is not None and m.start() < pos:
+                    m = heads[k] = _search_nonempty(self._parts[k], text, pos)
+                if m is not None and (best is None or m.start() < heads[best].start()):
+                    best = k
+            if best is None:
+                return
+            m = heads[best]
+            yield m.start(), m.end(), self.patterns[best], m
+            pos = m.end()
+
+    def expand(self, match: Match, replacement: str) -> str:
+        """正则模式下展开替换串中的 \\1、\\g<name> 引用"""
+        if not self.regex or match.regex_match is None:
+            return replacement
+        return match.regex_match.expand(replacement)
+
+
+def _search_nonempty(compiled: re.Pattern, text: str, pos: int) -> re.Match:
+    while pos <= len(text):
+        m = compiled.search(text, pos)
+        if m is None or m.end() > m.start():
+            return m
+        pos = m.start() + 1
+    return None
+
+
+class _PartBuffer:
+    """一个部件的段落元素和段落文本"""
+
+    def __init__(self, part):
+        self.part = part
+        self.elements = list(part.readonly_element.iter(W_P))
+        self.texts = [_paragraph_text(p) for p in self.elements]
+
+    def matches(self, searcher: Searcher):
+        """
+        逐个段落查找，每个段落文本单独作为一个字符串，
+        匹配不会跨越段落，^ / $ 和前后文断言都以段落为边界。
+        """
+        for index, text in enumerate(self.texts):
+            if not text:
+                continue
+            for start, end, pattern, regex_match in searcher.finditer(text):
+                yield Match(
+                    self.part.name,
+                    index,
+                    self.elements[index].get(W14_PARA_ID),
+                    start,
+                    end,
+                    text[start:end],
+                    pattern,
+                    regex_match.groups() if regex_match is not None else (),
+                    regex_match,
+                )
+
+
+def find(parts, patterns, regex: bool = False, flags: int = 0) -> list[Match]:
+    """在 parts 的全部段落中查找 patterns，匹配可以跨越 Run 和 w:t"""
+    searcher = Searcher(patterns, regex, flags)
+    result = []
+    for part in parts:
+        result.extend(_PartBuffer(part).matches(searcher))
+    return result
+
+
+def replace(parts, replacements: dict, regex: bool = False, flags: int = 0) -> int:
+    """
+    按 {模式: 替换} 一次性替换，替换可以是字符串或 callable(Match) -> str。
+
+    每个部件的段落只读取一次；之后按段落和偏移从后往前调用 Paragraph.replace_range，
+    前面的偏移不受影响，新文本沿用第一个受影响 Run 的格式。返回替换次数。
+    """
+    searcher = Searcher(list(replacements), regex, flags)
+    lookup = {p.pattern if isinstance(p, re.Pattern) else p: value for p, value in replacements.items()}
+    count = 0
+    for part in parts:
+        buffer = _PartBuffer(part)
+        by_paragraph: dict[int, list[Match]] = {}
+        for match in buffer.matches(searcher):
+            by_paragraph.setdefault(match.paragraph, []).append(match)
+        if by_paragraph:
+            part.mark_dirty()
+        for index in sorted(by_paragraph, reverse=True):
+            paragraph = Paragraph(buffer.elements[index])
+            for match in reversed(by_paragraph[index]):
+                value = lookup[match.pattern]
+                if callable(value):
+                    value = value(match)
+                else:
+                    value = searcher.expand(match, value)
+                paragraph.replace_range(match.start, match.end, value)
+                count += 1
+    return count
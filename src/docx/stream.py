@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from . import xml_engine
+from .paragraph import _iter_runs
+from .run_properties import RunProperties
+from .tags import PATH_PSTYLE, W_P, W_RPR, W_T, W_VAL, W14_PARA_ID, XML_SPACE
+
+
+@dataclass(frozen=True, slots=True)
+class RunSpan:
+    """段落文本中 [start, end) 区间使用的格式"""
+    start: int
+    end: int
+    rpr: RunProperties
+
+
+@dataclass(frozen=True, slots=True)
+class ParagraphView:
+    """
+    只读的轻量段落视图，不持有 XML 元素。
+    """
+    part: str
+    index: int
+    para_id: str
+    style: str
+    text: str
+    spans: tuple[RunSpan, ...]
+
+
+def paragraph_view(element: xml_engine.Element, part: str = None, index: int = 0) -> ParagraphView:
+    """由 w:p 元素构建段落视图，文本规则与 Paragraph.text 一致"""
+    pieces = []
+    spans = []
+    offset = 0
+    for run in _iter_runs(element):
+        start = offset
+        for t in run.findall(W_T):
+            value = t.text or ""
+            if t.get(XML_SPACE) != 'preserve':
+                value = value.strip()
+            pieces.append(value)
+            offset += len(value)
+        if offset > start:
+            spans.append(RunSpan(start, offset, RunProperties.load_from_xml(run.find(W_RPR))))
+    pstyle = element.find(PATH_PSTYLE)
+    return ParagraphView(
+        part,
+        index,
+        element.get(W14_PARA_ID),
+        pstyle.get(W_VAL) if pstyle is not None else None,
+        "".join(pieces),
+        tuple(spans),
+    )
+
+
+def iter_paragraphs(source, part: str = None):
+    """
+    用 iterparse 单次流式遍历 source（路径或二进制流）中的 w:p，产生 ParagraphView。
+
+    每个段落在生成视图后立即从父元素上摘除，段落外的元素在结束时同样摘除，
+    因此内存占用与文档大小无关。段落按文档顺序（开始标签的顺序，与 element.iter(w:p) 相同）
+    产生和编号：嵌套在文本框中的段落暂存到外层段落结束，紧随其后产生，且不计入外层段落的文本。
+    """
+    stack = []
+    # 尚未结束的段落的序号，以及最外层段落结束前暂存的嵌套段落视图
+    open_paragraphs = []
+    nested = []
+    index = 0
+    for event, element in xml_engine.iterparse(source, events=('start', 'end')):
+        if event == 'start':
+            stack.append(element)
+            if element.tag == W_P:
+                open_paragraphs.append(index)
+                index += 1
+            continue
+        stack.pop()
+        if element.tag == W_P:
+            view = paragraph_view(element, part, open_paragraphs.pop())
+            if open_paragraphs:
+                nested.append(view)
+            else:
+                yield view
+                if nested:
+                    nested.sort(key=lambda v: v.index)
+                    yield from nested
+                    nested = []
+        elif open_paragraphs:
+            continue
+        if stack:
+            stack[-1].remove(element)
+
+
+def paragraph_table(views) -> tuple:
+    """
+    把段落视图压缩为只含内置类型的表，供解析缓存保存：
+    (格式表, [(para_id, style, text, (start, end, 格式序号, ...)), ...])，格式只保存一次。
+    """
+    formats: dict = {}
+    rows = []
+    for view in views:
+        spans = []
+        for span in view.spans:
+            spans += (span.start, span.end, formats.setdefault(span.rpr, len(formats)))
+        rows.append((view.para_id, view.style, view.text, tuple(spans)))
+    return tuple(rpr.to_tuple() if rpr is not None else None for rpr in formats), rows
+
+
+def iter_table(table: tuple, part: str = None):
+    """由 paragraph_table 的结果重建 ParagraphView"""
+    formats = [RunProperties.from_tuple(values) if values is not None else None for values in table[0]]
+    for index, (para_id, style, text, spans) in enumerate(table[1]):
+        yield ParagraphView(part, index, para_id, style, text, tuple(
+            RunSpan(spans[k], spans[k + 1], formats[spans[k + 2]]) for k in range(0, len(spans), 3)))
+
+
+def iter_part_paragraphs(part):
+    """
+    遍历部件中的段落。已解析的部件直接读取内存中的树（可能已被修改），
+    所在包带有解析缓存时读取缓存的段落表，否则从压缩包流式读取，不会解析整个部件。
+    """
+    if part.loaded:
+        for index, element in enumerate(part.readonly_element.iter(W_P)):
+            yield paragraph_view(element, part.name, index)
+        return
+    cache = part.cache
+    if cache is not None and part.zip_info is not None:
+        yield from iter_table(cache.load(part, 'paragraphs', lambda: paragraph_table(_iter_stream(part))), part.name)
+        return
+    yield from _iter_stream(part)
+
+
+def _iter_stream(part):
+    with part.open() as fh:
+        yield from iter_paragraphs(fh, part.name)
@@ -0,0 +1,212 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from . import instrumentation
+from . import xml_engine
+from .paragraph import _iter_runs
+from .run_properties import RunProperties
+from .tags import (
+    PATH_PSTYLE, PATH_RSTYLE, W_BASED_ON, W_DEFAULT, W_DOC_DEFAULTS, W_ILVL, W_NUM_ID, W_NUM_PR, W_PPR,
+    W_RPR, W_RPR_DEFAULT, W_STYLE, W_STYLE_ID, W_TYPE, W_VAL,
+)
+
+# 开关属性：在样式层级中出现时相互翻转（段落样式与字符样式异或），直接格式则为绝对值
+TOGGLE_FIELDS = ('bold', 'italic', 'italic_cs')
+
+_EMPTY = RunProperties().intern()
+
+
+@dataclass(frozen=True, slots=True)
+class Style:
+    style_id: str
+    type: str
+    based_on: str = None
+    default: bool = False
+    rpr: RunProperties = None
+    num_id: int = None  # 样式 w:pPr/w:numPr 中的编号
+    ilvl: int = None
+
+
+def _int_child(parent: xml_engine.Element, tag: str) -> int:
+    element = parent.find(tag) if parent is not None else None
+    try:
+        return int(element.get(W_VAL))
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+def _combine_styles(paragraph: RunProperties, character: RunProperties) -> RunProperties:
+    """段落样式之上叠加字符样式，开关属性取异或"""
+    if paragraph is None:
+        return character
+    if character is None:
+        return paragraph
+    result = paragraph.merge(character)
+    toggles = {}
+    for name in TOGGLE_FIELDS:
+        p_value = getattr(paragraph, name)
+        c_value = getattr(character, name)
+        if p_value is not None and c_value is not None:
+            toggles[name] = p_value != c_value
+    return result.replace(**toggles) if toggles else result
+
+
+class StyleSheet:
+    """
+    styles.xml 的样式表和有效格式解析。
+
+    构造时读取一次全部样式，basedOn 链在首次用到时展开并缓存；
+    ``resolve`` 按 (段落样式, 字符样式, 直接格式) 缓存结果，
+    相同组合的 Run 共享同一个 RunProperties 实例。
+    """
+
+    def __init__(self, part=None):
+        self.styles: dict[str, Style] = {}
+        self.defaults: RunProperties = _EMPTY
+        self.default_paragraph_style: str = None
+        self.default_character_style: str = None
+        self._flat: dict[str, RunProperties] = {}
+        self._resolved: dict[tuple, RunProperties] = {}
+        self._num_prs: dict[str, tuple] = {}
+        if part is None:
+            return
+        cache = part.cache
+        if cache is not None and part.zip_info is not None:
+            self._load_table(cache.load(part, 'styles', lambda: StyleSheet._read(part).to_table()))
+        else:
+            self._load(part.readonly_element)
+
+    @classmethod
+    def _read(cls, part) -> "StyleSheet":
+        """解析部件内容但不把树挂到部件上，部件保持未修改状态"""
+        sheet = cls()
+        sheet._load(instrumentation.fromstring(part.blob, 'StyleSheet.load'))
+        return sheet
+
+    def _load(self, root: xml_engine.Element):
+        defaults = root.find(W_DOC_DEFAULTS)
+        if defaults is not None:
+            rpr = defaults.find(W_RPR_DEFAULT + '/' + W_RPR)
+            if rpr is not None:
+                self.defaults = RunProperties.load_from_xml(rpr)
+        for element in root.iter(W_STYLE):
+            style_id = element.get(W_STYLE_ID)
+            if style_id is None:
+                continue
+            based_on = element.find(W_BASED_ON)
+            ppr = element.find(W_PPR)
+            num_pr = ppr.find(W_NUM_PR) if ppr is not None else None
+            style = Style(
+                style_id,
+                element.get(W_TYPE, 'paragraph'),
+                based_on.get(W_VAL) if based_on is not None else None,
+                element.get(W_DEFAULT) in ('1', 'true', 'on'),
+                RunProperties.load_from_xml(element.find(W_RPR)),
+                _int_child(num_pr, W_NUM_ID),
+                _int_child(num_pr, W_ILVL),
+            )
+            self.styles[style_id] = style
+            if style.default:
+                if style.type == 'paragraph':
+                    self.default_paragraph_style = style_id
+                elif style.type == 'character':
+                    self.default_character_style = style_id
+
+    def to_table(self) -> tuple:
+        """只含内置类型的样式表，供解析缓存保存"""
+        return (
+            self.defaults.to_tuple(),
+            self.default_paragraph_style,
+            self.default_character_style,
+            [(style.style_id, style.type, style.based_on, style.default,
+              style.rpr.to_tuple() if style.rpr is not None else None, style.num_id, style.ilvl)
+             for style in self.styles.values()],
+        )
+
+    def _load_table(self, table: tuple):
+        defaults, self.default_paragraph_style, self.default_character_style, styles = table
+        self.defaults = RunProperties.from_tuple(defaults)
+        for style_id, type_, based_on, default, rpr, num_id, ilvl in styles:
+            self.styles[style_id] = Style(
+                style_id, type_, based_on, default, RunProperties.from_tuple(rpr) if rpr is not None else None,
+                num_id, ilvl)
+
+    def flatten(self, style_id: str) -> RunProperties:
+        """沿 basedOn 链合并样式的 rPr，结果缓存；样式不存在时返回 None"""
+        if style_id is None:
+            return None
+        if style_id in self._flat:
+            return self._flat[style_id]
+        chain = []
+        seen = set()
+        current = self.styles.get(style_id)
+        while current is not None and current.style_id not in seen:
+            seen.add(current.style_id)
+            chain.append(current)
+            if current.based_on in self._flat:
+                break
+            current = self.styles.get(current.based_on)
+        if not chain:
+            return None
+        base = self._flat.get(chain[-1].based_on) if chain[-1].based_on in self._flat else None
+        # 从链的根部往下展开，途经的每个样式都记入缓存
+        for style in reversed(chain):
+            base = (base or _EMPTY).merge(style.rpr)
+            self._flat[style.style_id] = base
+        return self._flat[style_id]
+
+    def num_pr(self, style_id: str) -> tuple:
+        """
+        样式沿 basedOn 链继承的 (numId, ilvl)，链上都没有时对应项为 None。结果缓存。
+        """
+        result = self._num_prs.get(style_id)
+        if result is None:
+            num_id = ilvl = None
+            seen = set()
+            current = self.styles.get(style_id)
+            while current is not None and current.style_id not in seen and (num_id is None or ilvl is None):
+                seen.add(current.style_id)
+                num_id = current.num_id if num_id is None else num_id
+                ilvl = current.ilvl if ilvl is None else ilvl
+                current = self.styles.get(current.based_on)
+            result = self._num_prs[style_id] = (num_id, ilvl)
+        return result
+
+    def resolve(self, p_style: str = None, r_style: str = None, direct: RunProperties = None) -> RunProperties:
+        """
+        Run 的有效格式：docDefaults -> 段落样式 -> 字符样式 -> 直接格式。
+        p_style 为 None 或不存在时使用默认段落样式。
+        """
+        key = (p_style, r_style, direct)
+        result = self._resolved.get(key)
+        if result is None:
+            paragraph = self.flatten(p_style if p_style in self.styles else self.default_paragraph_style)
+            character = self.flatten(r_style if r_style is not None else self.default_character_style)
+            result = self.defaults.merge(_combine_styles(paragraph, character)).merge(direct)
+            self._resolved[key] = result
+        return result
+
+    def resolve_run(self, r: xml_engine.Element, p: xml_engine.Element = None, p_style: str = None) -> RunProperties:
+        """w:r 元素的有效格式，段落样式取自 p 或直接给出的 p_style"""
+        if p is not None and p_style is None:
+            pstyle = p.find(PATH_PSTYLE)
+            p_style = pstyle.get(W_VAL) if pstyle is not None else None
+        rstyle = r.find(PATH_RSTYLE)
+        return self.resolve(
+            p_style,
+            rstyle.get(W_VAL) if rstyle is not None else None,
+            RunProperties.load_from_xml(r.find(W_RPR)),
+        )
+
+    def resolve_paragraph(self, p: xml_engine.Element) -> list[RunProperties]:
+        """段落中各个 Run 的有效格式"""
+        pstyle = p.find(PATH_PSTYLE)
+        p_style = pstyle.get(W_VAL) if pstyle is not None else None
+        return [self.resolve_run(r, p_style=p_style) for r in _iter_runs(p)]
+
+    def clear_cache(self):
+        """样式被修改后清空展开和解析的缓存"""
+        self._flat.clear()
+        self._resolved.clear()
+        self._num_prs.clear()
@@ -0,0 +1,138 @@
+# 由 tools/gen_tags.py 生成，请勿手工修改。
+# Clark 形式（{命名空间}本地名）的元素名、属性名常量和预编译的查找路径。
+
+MC_NS = 'http://schemas.openxmlformats.org/markup-compatibility/2006'
+R_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W14_NS = 'http://schemas.microsoft.com/office/word/2010/wordml'
+W15_NS = 'http://schemas.microsoft.com/office/word/2012/wordml'
+XML_NS = 'http://www.w3.org/XML/1998/namespace'
+
+# 元素
+W_DOCUMENT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}document'
+W_BODY = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}body'
+W_P = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}p'
+W_R = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}r'
+W_T = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}t'
+W_TAB = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tab'
+W_BR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}br'
+W_CR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}cr'
+W_INSTR_TEXT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}instrText'
+W_DEL_TEXT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}delText'
+W_PPR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pPr'
+W_RPR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rPr'
+W_PSTYLE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pStyle'
+W_RSTYLE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rStyle'
+W_SECT_PR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}sectPr'
+W_TBL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tbl'
+W_TR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tr'
+W_TC = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}tc'
+W_DRAWING = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}drawing'
+W_TXBX_CONTENT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}txbxContent'
+W_HYPERLINK = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hyperlink'
+W_INS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ins'
+W_DEL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}del'
+W_MOVE_FROM = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}moveFrom'
+W_MOVE_TO = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}moveTo'
+W_SMART_TAG = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}smartTag'
+W_FLD_SIMPLE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}fldSimple'
+W_CUSTOM_XML = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}customXml'
+W_SDT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}sdt'
+W_SDT_CONTENT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}sdtContent'
+W_DIR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}dir'
+W_BDO = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}bdo'
+W_RFONTS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rFonts'
+W_B = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}b'
+W_I = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}i'
+W_ICS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}iCs'
+W_COLOR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}color'
+W_SPACING = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}spacing'
+W_KERN = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}kern'
+W_SZ = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}sz'
+W_SZ_CS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}szCs'
+W_HIGHLIGHT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}highlight'
+W_IND = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ind'
+W_JC = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}jc'
+W_COMMENTS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}comments'
+W_COMMENT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}comment'
+W_COMMENT_RANGE_START = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}commentRangeStart'
+W_COMMENT_RANGE_END = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}commentRangeEnd'
+W_COMMENT_REFERENCE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}commentReference'
+W_ANNOTATION_REF = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}annotationRef'
+W_FOOTNOTE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}footnote'
+W_ENDNOTE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}endnote'
+W_HDR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hdr'
+W_FTR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ftr'
+W_NUMBERING = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numbering'
+W_ABSTRACT_NUM = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}abstractNum'
+W_ABSTRACT_NUM_ID = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}abstractNumId'
+W_NUM = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}num'
+W_NUM_PR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numPr'
+W_NUM_ID = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numId'
+W_ILVL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ilvl'
+W_LVL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}lvl'
+W_START = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}start'
+W_NUM_FMT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numFmt'
+W_LVL_TEXT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}lvlText'
+W_LVL_RESTART = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}lvlRestart'
+W_LVL_JC = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}lvlJc'
+W_LVL_OVERRIDE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}lvlOverride'
+W_START_OVERRIDE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}startOverride'
+W_NSID = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}nsid'
+W_MULTI_LEVEL_TYPE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}multiLevelType'
+W_NUM_STYLE_LINK = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numStyleLink'
+W_STYLE_LINK = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}styleLink'
+W_IS_LGL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}isLgl'
+W_NUM_ID_MAC_AT_CLEANUP = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numIdMacAtCleanup'
+W_KEEP_NEXT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}keepNext'
+W_KEEP_LINES = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}keepLines'
+W_PAGE_BREAK_BEFORE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pageBreakBefore'
+W_FRAME_PR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}framePr'
+W_WIDOW_CONTROL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}widowControl'
+W_STYLES = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}styles'
+W_STYLE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}style'
+W_NAME = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}name'
+W_BASED_ON = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}basedOn'
+W_LINK = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}link'
+W_NEXT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}next'
+W_DOC_DEFAULTS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}docDefaults'
+W_RPR_DEFAULT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rPrDefault'
+W_PPR_DEFAULT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pPrDefault'
+W15_COMMENTS_EX = '{http://schemas.microsoft.com/office/word/2012/wordml}commentsEx'
+W15_COMMENT_EX = '{http://schemas.microsoft.com/office/word/2012/wordml}commentEx'
+MC_ALTERNATE_CONTENT = '{http://schemas.openxmlformats.org/markup-compatibility/2006}AlternateContent'
+MC_CHOICE = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Choice'
+MC_FALLBACK = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Fallback'
+
+# 属性
+W_VAL = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}val'
+W_ID = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}id'
+W_ASCII = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}ascii'
+W_HANSI = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hAnsi'
+W_EAST_ASIA = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}eastAsia'
+W_HINT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hint'
+W_AUTHOR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}author'
+W_DATE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}date'
+W_INITIALS = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}initials'
+W_TYPE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}type'
+W_STYLE_ID = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}styleId'
+W_DEFAULT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}default'
+W_LEFT = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}left'
+W_HANGING = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hanging'
+W_ASCII_THEME = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}asciiTheme'
+W_HANSI_THEME = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}hAnsiTheme'
+W_EAST_ASIA_THEME = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}eastAsiaTheme'
+W14_PARA_ID = '{http://schemas.microsoft.com/office/word/2010/wordml}paraId'
+W14_TEXT_ID = '{http://schemas.microsoft.com/office/word/2010/wordml}textId'
+W15_PARA_ID = '{http://schemas.microsoft.com/office/word/2012/wordml}paraId'
+W15_PARA_ID_PARENT = '{http://schemas.microsoft.com/office/word/2012/wordml}paraIdParent'
+W15_DONE = '{http://schemas.microsoft.com/office/word/2012/wordml}done'
+XML_SPACE = '{http://www.w3.org/XML/1998/namespace}space'
+R_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+R_EMBED = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}embed'
+MC_IGNORABLE = '{http://schemas.openxmlformats.org/markup-compatibility/2006}Ignorable'
+
+# 查找路径
+PATH_PSTYLE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pPr/{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pStyle'
+PATH_RSTYLE = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rPr/{http://schemas.openxmlformats.org/wordprocessingml/2006/main}rStyle'
+PATH_NUM_PR = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}pPr/{http://schemas.openxmlformats.org/wordprocessingml/2006/main}numPr'
@@ -0,0 +1,263 @@
+"""
+模板填充（邮件合并）。
+
+    template = Template('contract.docx')
+    template.render({'name': '张三', 'date': '2024-01-01'}, 'out/zhangsan.docx')
+    for path in template.render_many(records, out_dir='out', workers=8):
+        ...
+
+模板只打开和解析一次：构造时找出全部占位符及其所在 Run 的偏移，
+把含占位符的部件序列化为“静态片段 + 受影响段落”交替的序列。
+每次填充只复制受影响的段落并替换文本，静态片段原样写出；
+其余部件按原始压缩字节复制，不解压也不重新压缩。
+"""
+from __future__ import annotations
+
+import concurrent.futures
+import io
+import os
+import re
+import zipfile
+from bisect import bisect_right
+from dataclasses import dataclass
+
+from . import instrumentation
+from . import xml_engine
+from .document import Docx
+from .package import _root_namespaces, write_atomic
+from .paragraph import Paragraph
+from .search import _paragraph_text
+from .tags import W_P
+
+# 默认的占位符形式 {{name}}，名称可以包含点号
+PLACEHOLDER_RE = re.compile(r'\{\{\s*([A-Za-z_][\w.]*)\s*\}\}')
+
+# 序列化时代替受影响段落的标记文本，使用私用区字符，不会与文档内容冲突
+_MARKER = '\ue000%d\ue000'
+_MARKER_RE = re.compile(rb'<[^<>]*>\xee\x80\x80(\d+)\xee\x80\x80</[^<>]*>')
+_XMLNS_RE = re.compile(r' xmlns:([\w.-]+)="([^"]*)"')
+
+# render_many 的工作进程中解析好的模板
+_worker_template = None
+
+
+@dataclass(frozen=True, slots=True)
+class Placeholder:
+    """
+    一个占位符。paragraph 为段落在部件中的序号（element.iter(w:p) 的顺序），
+    start / end 为在段落文本中的偏移；run 为首字符所在 Run 的序号，offset 为在该 Run 文本中的偏移。
+    """
+    name: str
+    part: str
+    paragraph: int
+    start: int
+    end: int
+    run: int
+    offset: int
+
+
+class _PartPlan:
+    """
+    一个含占位符的部件。segments 为序列化后的静态片段，比 paragraphs 多一个；
+    paragraphs[k] 为 (段落元素, [(嵌套段落序号, 占位符列表), ...])，
+    嵌套段落序号是在该段落 iter(w:p) 中的位置，0 即段落本身。
+    """
+
+    def __init__(self, segments: list[bytes], paragraphs: list, namespaces: dict[str, str]):
+        self.segments = segments
+        self.paragraphs = paragraphs
+        self.namespaces = namespaces
+
+    def write(self, fileobj, values: dict):
+        for segment, (element, targets) in zip(self.segments, self.paragraphs):
+            fileobj.write(segment)
+            fileobj.write(self._render(element, targets, values))
+        fileobj.write(self.segments[-1])
+
+    def _render(self, element: xml_engine.Element, targets: list, values: dict) -> bytes:
+        # 只复制受影响的段落，模板中的段落保持不变
+        clone = instrumentation.deepcopy(element, 'Template.render')
+        clone.tail = None
+        nested = list(clone.iter(W_P)) if len(targets) > 1 or targets[0][0] else [clone]
+        for position, placeholders in targets:
+            paragraph = Paragraph(nested[position])
+            for placeholder in reversed(placeholders):
+                paragraph.replace_range(placeholder.start, placeholder.end, str(values[placeholder.name]))
+        xml = instrumentation.tostring(clone, 'Template.render')
+        # 根元素上已经声明的命名空间不在段落上重复声明
+        end = xml.find('>')
+        head = _XMLNS_RE.sub(
+            lambda m: '' if self.namespaces.get(m.group(1)) == m.group(2) else m.group(0), xml[:end])
+        return (head + xml[end:]).encode('utf-8')
+
+
+class Template:
+    """
+    解析一次、多次填充的模板。source 为路径、文件对象或 .docx 字节；
+    pattern 为占位符正则，有分组时第一个分组为名称，否则整个匹配为名称。
+    """
+
+    def __init__(self, source, pattern=PLACEHOLDER_RE):
+        if isinstance(source, (bytes, bytearray)):
+            data = bytes(source)
+        elif hasattr(source, 'read'):
+            data = source.read()
+        else:
+            with open(source, 'rb') as fh:
+                data = fh.read()
+        self._data = data
+        self.pattern = re.compile(pattern) if isinstance(pattern, str) else pattern
+        self.placeholders: list[Placeholder] = []
+        self._plans: dict[str, _PartPlan] = {}
+        self._docx = Docx.open(io.BytesIO(data), cache=False)
+        for part in self._docx.story_parts:
+            plan = self._plan(part)
+            if plan is not None:
+                self._plans[part.name] = plan
+        self._required = frozenset(self.names)
+
+    @property
+    def names(self) -> list[str]:
+        """模板中出现的占位符名称，按首次出现的顺序"""
+        return list(dict.fromkeys(placeholder.name for placeholder in self.placeholders))
+
+    def _find(self, part, index: int, element: xml_engine.Element) -> list[Placeholder]:
+        text = _paragraph_text(element)
+        matches = [m for m in self.pattern.finditer(text) if m.end() > m.start()]
+        if not matches:
+            return []
+        run_starts = []
+        offset = 0
+        for run in Paragraph(element).runs:
+            run_starts.append(offset)
+            offset += sum(len(text.text) for text in run.texts)
+        placeholders = []
+        for m in matches:
+            run = bisect_right(run_starts, m.start()) - 1
+            placeholders.append(Placeholder(
+                m.group(1) if self.pattern.groups else m.group(),
+                part.name, index, m.start(), m.end(), run, m.start() - run_starts[run],
+            ))
+        return placeholders
+
+    def _plan(self, part) -> _PartPlan:
+        root = part.readonly_element
+        paragraphs = []
+        nested: dict[int, int] = {}
+        for index, element in enumerate(root.iter(W_P)):
+            placeholders = self._find(part, index, element)
+            if not placeholders:
+                continue
+            self.placeholders.extend(placeholders)
+            position = nested.get(id(element))
+            if position is not None:
+                # 文本框等嵌套在另一个受影响段落中的段落，随外层段落一起复制
+                paragraphs[-1][1].append((position, placeholders))
+                continue
+            paragraphs.append((element, [(0, placeholders)]))
+            nested = {id(p): k for k, p in enumerate(element.iter(W_P))}
+        if not paragraphs:
+            return None
+
+        # 受影响的段落临时换成标记，整体序列化一次后按标记切分
+        top = {id(element): k for k, (element, _) in enumerate(paragraphs)}
+        swapped = []
+        for parent in root.iter():
+            for position, child in enumerate(parent):
+                k = top.get(id(child))
+                if k is not None:
+                    marker = xml_engine.Element(W_P)
+                    marker.text = _MARKER % k
+                    marker.tail = child.tail
+                    parent[position] = marker
+                    swapped.append((parent, position, child))
+        try:
+            buffer = io.BytesIO()
+            part.write(buffer)
+        finally:
+            for parent, position, child in swapped:
+                parent[position] = child
+        pieces = _MARKER_RE.split(buffer.getvalue())
+        order = [paragraphs[int(k)] for k in pieces[1::2]]
+        return _PartPlan(pieces[0::2], order, _root_namespaces(pieces[0]))
+
+    def render(self, values: dict, target=None):
+        """
+        用 values 填充占位符，写入 target（路径或文件对象）；target 为 None 时返回 .docx 字节。
+        values 中缺少某个占位符时抛出 KeyError，此时不会写出任何内容；
+        target 为路径时先写入临时文件再替换（见 package.write_atomic），出错时不会留下不完整的文件。
+        """
+        missing = self._required - values.keys()
+        if missing:
+            raise KeyError("missing values for placeholders: %s" % ', '.join(sorted(missing)))
+        if isinstance(target, (str, os.PathLike)):
+            write_atomic(target, lambda fh: self._write(values, fh))
+            return None
+        if target is None:
+            buffer = io.BytesIO()
+            self._write(values, buffer)
+            return buffer.getvalue()
+        self._write(values, target)
+        return None
+
+    def _write(self, values: dict, target):
+        package = self._docx.package
+        with zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as out:
+            for info in package.infolist():
+                plan = self._plans.get(info.filename)
+                if plan is None:
+                    package.copy_member(out, info)
+                    continue
+                zinfo = zipfile.ZipInfo(info.filename, date_time=info.date_time)
+                zinfo.compress_type = zipfile.ZIP_DEFLATED
+                with out.open(zinfo, 'w') as fh:
+                    plan.write(fh, values)
+
+    def render_many(self, records, out_dir: str = None, filename: str = '{index}.docx',
+                    workers: int = None, chunksize: int = 16):
+        """
+        逐个填充 records 中的值字典，按顺序产生结果：给出 out_dir 时写入
+        out_dir/filename（可以引用记录中的字段和序号 index，记录中同名的 index 字段被序号覆盖）
+        并产生路径，否则产生 .docx 字节。
+
+        workers 不为 1 时在进程池中执行，每个工作进程只解析一次模板。
+        """
+        if out_dir is not None:
+            os.makedirs(out_dir, exist_ok=True)
+        tasks = (
+            (record, os.path.join(out_dir, filename.format_map({**record, 'index': index})) if out_dir is not None else None)
+            for index, record in enumerate(records)
+        )
+        if workers == 1:
+            for task in tasks:
+                yield _render_task(self, task)
+            return
+        with concurrent.futures.ProcessPoolExecutor(
+                max_workers=workers, initializer=_init_worker, initargs=(self._data, self.pattern)) as pool:
+            yield from pool.map(_render_in_worker, tasks, chunksize=chunksize)
+
+    def close(self):
+        self._docx.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _render_task(template: Template, task):
+    values, path = task
+    if path is None:
+        return template.render(values)
+    template.render(values, path)
+    return path
+
+
+def _init_worker(data: bytes, pattern):
+    global _worker_template
+    _worker_template = Template(data, pattern)
+
+
+def _render_in_worker(task):
+    return _render_task(_worker_template, task)
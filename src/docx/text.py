@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from . import xml_engine
+
+from . import instrumentation
+from .tags import W_T, XML_SPACE
+
+
+class Text:
+    """
+    w:t 元素的包装对象。
+
+    对象直接持有 w:t 元素，所有修改都在元素上原地进行，
+    只有在访问 ``xml`` 时才会序列化。
+    """
+
+    def __init__(self, text: str = "", preserve_space: bool = False, element: xml_engine.Element = None):
+        if element is None:
+            element = xml_engine.Element(W_T)
+            element.text = text
+            if preserve_space:
+                element.set(XML_SPACE, 'preserve')
+            instrumentation.record_created('Text.__init__', element)
+        self._element: xml_engine.Element = element
+
+    @property
+    def element(self) -> xml_engine.Element:
+        return self._element
+
+    @property
+    def text(self) -> str:
+        value = self._element.text or ""
+        if self.preserve_space:
+            return value
+        else:
+            return value.strip()
+
+    @text.setter
+    def text(self, value: str):
+        self._element.text = value
+
+    @property
+    def preserve_space(self) -> bool:
+        return self._element.get(XML_SPACE) == 'preserve'
+
+    @preserve_space.setter
+    def preserve_space(self, value: bool):
+        if value:
+            self._element.set(XML_SPACE, 'preserve')
+        elif XML_SPACE in self._element.attrib:
+            del self._element.attrib[XML_SPACE]
+
+    @property
+    def xml(self) -> str:
+        return instrumentation.tostring(self._element, 'Text.xml')
+
+    @xml.setter
+    def xml(self, value: str):
+        # 原地替换元素内容，保证文档树中的引用依然有效
+        element = instrumentation.fromstring(value, 'Text.xml')
+        tail = self._element.tail
+        self._element.clear()
+        self._element.tag = element.tag
+        self._element.attrib.update(element.attrib)
+        self._element.text = element.text
+        self._element.extend(list(element))
+        self._element.tail = tail
+
+    def to_xml(self) -> xml_engine.Element:
+        return self._element
+
+    @classmethod
+    def load_from_xml(cls, element: xml_engine.Element):
+        return cls(element=element)
+
+    @classmethod
+    def from_xml_str(cls, xml: str):
+        return cls(element=instrumentation.fromstring(xml, 'Text.from_xml_str'))
@@ -0,0 +1,14 @@
+
+from .. import xml_engine
+
+def is_namespace_registered(prefix: str) -> bool:
+    """
+    Check if the provided namespace prefix is registered.
+    """
+    return xml_engine.is_namespace_registered(prefix)
+
+def register_namespace(prefix: str, uri: str):
+    """
+    Register a new namespace.
+    """
+    xml_engine.register_namespace(prefix, uri)
@@ -0,0 +1,160 @@
+
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+# w14:paraId / w14:textId 取值必须小于 0x80000000
+MIN_ID = 0x00000001
+MAX_ID = 0x7FFFFFFF
+
+_STATE_MAGIC = b'UIDG'
+_STATE_HEADER = struct.Struct('<4sBIII')
+_STATE_VERSION = 1
+
+
+def _parse_id(value) -> int:
+    if isinstance(value, int):
+        number = value
+    else:
+        try:
+            number = int(value, 16)
+        except (TypeError, ValueError):
+            return None
+    if MIN_ID <= number <= MAX_ID:
+        return number
+    return None
+
+
+def format_id(value: int) -> str:
+    return '%08X' % value
+
+
+class UniqueIDGenerator:
+    """
+    31 位十六进制 ID（w14:paraId / w14:textId）分配器。
+
+    已使用的 ID 保存在有序的 ``array('I')`` 中（每个 ID 4 字节），
+    新 ID 由一个只向前移动的游标依次产生，遇到已使用的 ID 直接跳过，
+    因此分配是摊还 O(1) 的，不需要随机重试。
+    """
+
+    def __init__(self, existing_ids=(), start: int = MIN_ID):
+        if not MIN_ID <= start <= MAX_ID:
+            raise ValueError("start must be within [0x%08X, 0x%08X]" % (MIN_ID, MAX_ID))
+        numbers = {n for n in map(_parse_id, existing_ids) if n is not None}
+        self._used = array('I', sorted(numbers))
+        self._start = start
+        self._cursor = start
+        self._index = bisect_left(self._used, start)
+
+    def __len__(self):
+        """已使用（已存在或已分配）的 ID 数量"""
+        skipped = self._index - bisect_left(self._used, self._start)
+        return len(self._used) + (self._cursor - self._start - skipped)
+
+    def __contains__(self, value) -> bool:
+        number = _parse_id(value)
+        if number is None:
+            return False
+        if self._start <= number < self._cursor:
+            return True
+        i = bisect_left(self._used, number)
+        return i < len(self._used) and self._used[i] == number
+
+    def _next(self) -> int:
+        used, cursor, i = self._used, self._cursor, self._index
+        while i < len(used) and used[i] == cursor:
+            cursor += 1
+            i += 1
+        if cursor > MAX_ID:
+            raise RuntimeError("ID space exhausted")
+        self._cursor = cursor + 1
+        self._index = i
+        return cursor
+
+    def generate_unique_id(self) -> str:
+        return format_id(self._next())
+
+    def reserve(self, n: int) -> list[str]:
+        """
+        一次性预留 n 个 ID，按已使用 ID 之间的空隙整段分配。
+        """
+        result = []
+        used, cursor, i = self._used, self._cursor, self._index
+        while len(result) < n:
+            limit = used[i] if i < len(used) else MAX_ID + 1
+            if cursor == limit:
+                cursor += 1
+                i += 1
+                continue
+            count = min(n - len(result), limit - cursor)
+            if count <= 0:
+                raise RuntimeError("ID space exhausted")
+            result.extend(map(format_id, range(cursor, cursor + count)))
+            cursor += count
+        self._cursor = cursor
+        self._index = i
+        return result
+
+    def add(self, value):
+        """
+        登记一个在其他地方产生的 ID，保证之后不会再分配它。
+        每次登记需要 O(n) 的插入，批量登记请用 ``update``。
+        """
+        number = _parse_id(value)
+        if number is None or self._start <= number < self._cursor:
+            return
+        i = bisect_left(self._used, number)
+        if i == len(self._used) or self._used[i] != number:
+            self._used.insert(i, number)
+            # 小于起点的 ID 插在游标位置之前，游标对应的下标随之后移
+            if number < self._start:
+                self._index += 1
+
+    def update(self, values):
+        """
+        批量登记 ID：与已使用的 ID 合并后只排序一次，O((n + m) log(n + m))。
+        """
+        numbers = {
+            number for number in map(_parse_id, values)
+            if number is not None and not self._start <= number < self._cursor
+        }
+        if not numbers:
+            return
+        numbers.update(self._used)
+        self._used = array('I', sorted(numbers))
+        self._index = bisect_left(self._used, self._cursor)
+
+    def reset(self):
+        """
+        丢弃已分配的 ID，游标回到起点；已存在的 ID 仍然保留。
+        """
+        self._cursor = self._start
+        self._index = bisect_left(self._used, self._start)
+
+    def to_bytes(self) -> bytes:
+        """
+        导出分配器状态，配合 ``from_bytes`` 可在长时间的编辑会话中免去重新扫描。
+        """
+        used = self._used
+        if sys.byteorder != 'little':
+            used = array('I', used)
+            used.byteswap()
+        header = _STATE_HEADER.pack(_STATE_MAGIC, _STATE_VERSION, self._start, self._cursor, len(used))
+        return header + used.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data: bytes):
+        magic, version, start, cursor, count = _STATE_HEADER.unpack_from(data)
+        if magic != _STATE_MAGIC or version != _STATE_VERSION:
+            raise ValueError("Unsupported UniqueIDGenerator state")
+        used = array('I')
+        used.frombytes(data[_STATE_HEADER.size:_STATE_HEADER.size + count * used.itemsize])
+        if sys.byteorder != 'little':
+            used.byteswap()
+        generator = cls(start=start)
+        generator._used = used
+        generator._cursor = cursor
+        generator._index = bisect_left(used, cursor)
+        return generator
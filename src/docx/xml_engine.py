@@ -0,0 +1,187 @@
+"""
+XML 引擎：所有解析、序列化、创建元素和流式读取都经由这里。
+
+安装了 lxml 时使用 lxml（C 实现的解析器，iterparse 支持按 tag 过滤），
+否则使用标准库 ElementTree。可以用环境变量强制指定：
+
+    DOCX_XML_ENGINE=stdlib python ...
+    DOCX_XML_ENGINE=lxml python ...
+
+引擎在首次使用时确定，之后不能切换（两种引擎的元素不能混用）。
+"""
+import os
+import re
+import threading
+import xml.etree.ElementTree as _ET
+
+from .golbal import NAMESPACES
+
+ENGINE_ENV = 'DOCX_XML_ENGINE'
+
+# LxmlEngine.write 展开到这一层为止（根元素、w:body），更深的子树逐个整体序列化
+_STREAM_DEPTH = 2
+_XMLNS_RE = re.compile(r' xmlns(?::([\w.-]+))?="([^"]*)"')
+_XMLNS_RUN_RE = re.compile(r'(?: xmlns(?::[\w.-]+)?="[^"]*")+')
+_TEXT_ESCAPES = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;', '\r': '&#13;'})
+
+
+class StdlibEngine:
+    """标准库 xml.etree.ElementTree"""
+    name = 'stdlib'
+    ParseError = _ET.ParseError
+    Element = _ET.Element
+    SubElement = _ET.SubElement
+
+    def __init__(self):
+        self._registered: dict[str, str] = {'xml': 'http://www.w3.org/XML/1998/namespace'}
+
+    def fromstring(self, data):
+        return _ET.fromstring(data)
+
+    def tostring(self, element, encoding: str = 'unicode'):
+        return _ET.tostring(element, encoding=encoding)
+
+    def write(self, element, writer):
+        """把整棵树以文本写入 writer，不带 XML 声明"""
+        _ET.ElementTree(element).write(writer, encoding='unicode', xml_declaration=False)
+
+    def iterparse(self, source, events=('end',), tag=None):
+        """标准库不支持 tag 过滤，调用方仍需自行判断 element.tag"""
+        return _ET.iterparse(source, events=events)
+
+    def register_namespace(self, prefix: str, uri: str):
+        _ET.register_namespace(prefix, uri)
+        self._registered[prefix] = uri
+
+    def is_namespace_registered(self, prefix: str) -> bool:
+        return prefix in self._registered
+
+
+class LxmlEngine(StdlibEngine):
+    """lxml.etree"""
+    name = 'lxml'
+
+    def __init__(self):
+        from lxml import etree
+        super().__init__()
+        self._etree = etree
+        self._parser = etree.XMLParser(resolve_entities=False, huge_tree=True, remove_blank_text=False)
+        self.ParseError = etree.ParseError
+        self.Element = etree.Element
+        self.SubElement = etree.SubElement
+
+    def fromstring(self, data):
+        return self._etree.fromstring(data, self._parser)
+
+    def tostring(self, element, encoding: str = 'unicode'):
+        if encoding is None:
+            encoding = 'us-ascii'
+        return self._etree.tostring(element, encoding=encoding)
+
+    def write(self, element, writer):
+        """
+        逐块写出整棵树：前两层只写起止标签和文本，更深的子树（段落、表格）逐个序列化，
+        内存中同时只有一个子树的文本。输出与一次性 tostring 相同。
+        """
+        self._write(element, writer, {}, 0)
+
+    def _write(self, element, writer, inherited: dict, depth: int, redundant: list = None):
+        if depth >= _STREAM_DEPTH or not len(element) or not isinstance(element.tag, str):
+            xml = self._etree.tostring(element, encoding='unicode', with_tail=depth > 0)
+            writer.write(_strip_inherited(xml, inherited, redundant))
+            return
+        shallow = self._etree.Element(element.tag, dict(element.attrib), nsmap=element.nsmap)
+        writer.write(_strip_inherited(self._etree.tostring(shallow, encoding='unicode')[:-2] + '>', inherited))
+        if element.text:
+            writer.write(element.text.translate(_TEXT_ESCAPES))
+        # 兄弟元素重复的声明串相同，记下第一次的结果供之后直接切除
+        redundant = [None]
+        for child in element:
+            self._write(child, writer, element.nsmap, depth + 1, redundant)
+        localname = self._etree.QName(element).localname
+        writer.write('</%s:%s>' % (element.prefix, localname) if element.prefix else '</%s>' % localname)
+        if element.tail and depth:
+            writer.write(element.tail.translate(_TEXT_ESCAPES))
+
+    def iterparse(self, source, events=('end',), tag=None):
+        return self._etree.iterparse(source, events=events, tag=tag,
+                                     resolve_entities=False, huge_tree=True)
+
+    def register_namespace(self, prefix: str, uri: str):
+        self._etree.register_namespace(prefix, uri)
+        self._registered[prefix] = uri
+
+
+def _strip_inherited(xml: str, inherited: dict, redundant: list = None) -> str:
+    """
+    单独序列化子树时 lxml 会在起始标签上重复声明祖先的全部命名空间，去掉与祖先相同的声明。
+    redundant 为兄弟元素共用的 [声明串]，声明串相同时直接切除，不再逐个匹配。
+    """
+    if not inherited:
+        return xml
+    space = xml.find(' ')
+    known = redundant[0] if redundant is not None else None
+    if known and xml.startswith(known, space):
+        return xml[:space] + xml[space + len(known):]
+    end = xml.find('>')
+    if redundant is not None and 0 < space < end:
+        run = _XMLNS_RUN_RE.match(xml, space, end)
+        if run and all(inherited.get(m.group(1)) == m.group(2) for m in _XMLNS_RE.finditer(run.group())):
+            redundant[0] = run.group()
+    head = _XMLNS_RE.sub(lambda m: '' if inherited.get(m.group(1)) == m.group(2) else m.group(), xml[:end])
+    return head + xml[end:]
+
+
+def _select_engine(name: str = None) -> StdlibEngine:
+    name = (name or os.environ.get(ENGINE_ENV, '')).strip().lower() or 'auto'
+    if name not in ('auto', 'lxml', 'stdlib'):
+        raise ValueError("%s must be 'lxml', 'stdlib' or 'auto', got %r" % (ENGINE_ENV, name))
+    if name == 'stdlib':
+        return StdlibEngine()
+    try:
+        return LxmlEngine()
+    except ImportError:
+        if name == 'lxml':
+            raise
+        return StdlibEngine()
+
+
+# 引擎在第一次使用时才确定（此时才导入 lxml），之后以下名称直接绑定到引擎
+_ENGINE_NAMES = (
+    'ParseError', 'Element', 'SubElement', 'fromstring', 'tostring', 'write', 'iterparse',
+    'register_namespace', 'is_namespace_registered',
+)
+_lock = threading.Lock()
+
+
+def select(name: str = None) -> StdlibEngine:
+    """
+    立即选择引擎（name 为 None 时按环境变量）并绑定模块级名称。
+
+    切换前创建的元素和缓存（例如 run_properties.clear_intern_cache 清理的部分）
+    不能与新引擎混用，因此只用于测试和基准，正常使用时引擎在首次访问时自动确定。
+    """
+    with _lock:
+        return _bind(_select_engine(name))
+
+
+def _bind(selected: StdlibEngine) -> StdlibEngine:
+    # 注册常用前缀，避免序列化时出现 ns0/ns1
+    for prefix, uri in NAMESPACES.items():
+        if not selected.is_namespace_registered(prefix):
+            selected.register_namespace(prefix, uri)
+    namespace = globals()
+    for alias in _ENGINE_NAMES:
+        namespace[alias] = getattr(selected, alias)
+    namespace['engine'] = selected
+    return selected
+
+
+def __getattr__(name: str):
+    if name != 'engine' and name not in _ENGINE_NAMES:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
+    namespace = globals()
+    with _lock:
+        if 'engine' not in namespace:
+            _bind(_select_engine())
+    return namespace[name]
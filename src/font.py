@@ -1,10 +0,0 @@
-    
-
-from dataclasses import dataclass
-
-@dataclass
-class Font:
-    ascii: str = ""
-    hAnsi: str = ""
-    eastAsia: str = ""
-    hint: str = ""
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+单元测试，每个测试在 stdlib 和 lxml 两种 XML 引擎下各运行一次。
+
+    python -m pytest tests
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import factory  # noqa: E402
+from docx import run_properties, xml_engine  # noqa: E402
+
+ENGINES = ['stdlib', 'lxml']
+
+
+@pytest.fixture(autouse=True, params=ENGINES)
+def engine(request, monkeypatch):
+    """每个测试分别在两种 XML 引擎下运行，没有安装 lxml 时跳过 lxml"""
+    if request.param == 'lxml':
+        pytest.importorskip('lxml')
+    previous = xml_engine.engine.name
+    # 进程池中的工作进程按环境变量选择引擎
+    monkeypatch.setenv(xml_engine.ENGINE_ENV, request.param)
+    run_properties.clear_intern_cache()
+    yield xml_engine.select(request.param)
+    run_properties.clear_intern_cache()
+    xml_engine.select(previous)
+
+
+@pytest.fixture
+def make_docx(tmp_path):
+    """make_docx(body, name='doc.docx', **parts) -> 路径"""
+    def make(body: str = None, name: str = 'doc.docx', **kwargs):
+        if body is None:
+            body = factory.paragraph('Hello world', '00000001') + factory.paragraph('Second paragraph', '00000002')
+        path = tmp_path / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        return str(factory.build_docx(path, body, **kwargs))
+    return make
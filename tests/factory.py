@@ -0,0 +1,69 @@
+"""
+测试用的最小 .docx：正文、一个页眉、一张图片，可选 styles.xml 和 numbering.xml。
+"""
+import zipfile
+
+W_NS = 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'
+W14_NS = 'http://schemas.microsoft.com/office/word/2010/wordml'
+
+_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_ROOT_NAMESPACES = (
+    'xmlns:w="%s" xmlns:w14="%s" xmlns:w15="http://schemas.microsoft.com/office/word/2012/wordml" '
+    'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006" mc:Ignorable="w14 w15"'
+    % (W_NS, W14_NS)
+)
+_CT = 'application/vnd.openxmlformats-officedocument.wordprocessingml.'
+_RT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/'
+
+IMAGE = b'\x89PNG' + bytes(range(256)) * 64
+
+
+def paragraph(text: str, para_id: str = None, ppr: str = '', rpr: str = '') -> str:
+    """一个只有一个 Run 的段落"""
+    attrs = ' w14:paraId="%s"' % para_id if para_id else ''
+    run = '<w:r>%s<w:t xml:space="preserve">%s</w:t></w:r>' % (rpr and '<w:rPr>%s</w:rPr>' % rpr, text) if text else ''
+    return '<w:p%s>%s%s</w:p>' % (attrs, ppr and '<w:pPr>%s</w:pPr>' % ppr, run)
+
+
+def build_docx(path, body: str, header: str = None, styles: str = None, numbering: str = None):
+    """写出一个 .docx，body 为 w:body 的内容，styles / numbering 为对应部件根元素的内容"""
+    overrides = [('/word/document.xml', _CT + 'document.main+xml'), ('/word/header1.xml', _CT + 'header+xml')]
+    rels = [('rId1', 'header', 'header1.xml'), ('rId2', 'image', 'media/image1.png')]
+    parts = {
+        'word/document.xml': '<w:document %s><w:body>%s</w:body></w:document>' % (_ROOT_NAMESPACES, body),
+        'word/header1.xml': '<w:hdr %s>%s</w:hdr>' % (
+            _ROOT_NAMESPACES, header if header is not None else paragraph('Head', '7F000001')),
+    }
+    if styles is not None:
+        overrides.append(('/word/styles.xml', _CT + 'styles+xml'))
+        rels.append(('rId3', 'styles', 'styles.xml'))
+        parts['word/styles.xml'] = '<w:styles %s>%s</w:styles>' % (_ROOT_NAMESPACES, styles)
+    if numbering is not None:
+        overrides.append(('/word/numbering.xml', _CT + 'numbering+xml'))
+        rels.append(('rId4', 'numbering', 'numbering.xml'))
+        parts['word/numbering.xml'] = '<w:numbering %s>%s</w:numbering>' % (_ROOT_NAMESPACES, numbering)
+    content_types = (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Default Extension="png" ContentType="image/png"/>%s</Types>'
+        % ''.join('<Override PartName="%s" ContentType="%s"/>' % item for item in overrides)
+    )
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as z:
+        z.writestr('[Content_Types].xml', _DECLARATION + content_types)
+        z.writestr('_rels/.rels', _DECLARATION + _relationships([('rId1', 'officeDocument', 'word/document.xml')]))
+        z.writestr('word/_rels/document.xml.rels', _DECLARATION + _relationships(rels))
+        for name, xml in parts.items():
+            z.writestr(name, _DECLARATION + xml)
+        z.writestr('word/media/image1.png', IMAGE)
+    return path
+
+
+def _relationships(rels) -> str:
+    return '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">%s</Relationships>' % ''.join(
+        '<Relationship Id="%s" Type="%s%s" Target="%s"/>' % (rid, _RT, reltype, target) for rid, reltype, target in rels)
+
+
+def member_crcs(path) -> dict[str, int]:
+    with zipfile.ZipFile(path) as z:
+        return {info.filename: info.CRC for info in z.infolist()}
@@ -0,0 +1,181 @@
+import asyncio
+import io
+import os
+import threading
+
+import pytest
+
+from docx import Docx, aio
+from factory import paragraph
+
+
+class AsyncReader:
+    def __init__(self, data: bytes):
+        self._buffer = io.BytesIO(data)
+
+    async def read(self, size=-1):
+        await asyncio.sleep(0)
+        return self._buffer.read(size)
+
+
+class AsyncWriter:
+    def __init__(self):
+        self.data = bytearray()
+
+    async def write(self, chunk):
+        await asyncio.sleep(0)
+        self.data += chunk
+
+
+class StreamWriter:
+    """asyncio.StreamWriter 的形式：同步 write 加 async drain"""
+
+    def __init__(self):
+        self.data = bytearray()
+        self.drains = 0
+
+    def write(self, chunk):
+        self.data += chunk
+
+    async def drain(self):
+        self.drains += 1
+
+
+async def chunks(data: bytes, size: int = 100):
+    for start in range(0, len(data), size):
+        await asyncio.sleep(0)
+        yield data[start:start + size]
+
+
+def texts(source):
+    with Docx.open(source) as docx:
+        return [p.text for p in docx.paragraphs]
+
+
+@pytest.fixture
+def data(make_docx):
+    with open(make_docx(), 'rb') as fh:
+        return fh.read()
+
+
+@pytest.mark.parametrize('wrap', [bytes, AsyncReader, chunks, io.BytesIO])
+def test_open_async_sources(data, wrap):
+    async def main():
+        docx = await Docx.open_async(wrap(data))
+        with docx:
+            assert docx.document.loaded
+            return [p.text for p in docx.paragraphs]
+
+    assert asyncio.run(main()) == ['Hello world', 'Second paragraph']
+
+
+@pytest.mark.parametrize('wrap', [bytes, AsyncReader, chunks])
+def test_open_async_closes_its_own_source(data, wrap, monkeypatch):
+    sources = []
+    open_parsed = Docx._open_parsed.__func__
+
+    def capture(cls, source, *args):
+        sources.append(source)
+        return open_parsed(cls, source, *args)
+
+    monkeypatch.setattr(Docx, '_open_parsed', classmethod(capture))
+
+    async def main():
+        with await Docx.open_async(wrap(data)) as docx:
+            assert docx.package.is_source(sources[0])
+            assert not sources[0].closed
+        with pytest.raises(Exception):
+            await Docx.open_async(wrap(b'not a zip'))
+
+    asyncio.run(main())
+    assert [source.closed for source in sources] == [True, True]
+
+
+def test_open_async_leaves_caller_file_open(data):
+    source = io.BytesIO(data)
+
+    async def main():
+        with await Docx.open_async(source):
+            pass
+
+    asyncio.run(main())
+    assert not source.closed
+
+
+def test_open_async_without_parsing(make_docx):
+    async def main():
+        with await Docx.open_async(make_docx(), parse=False) as docx:
+            return docx.document.loaded
+
+    assert asyncio.run(main()) is False
+
+
+def test_save_async_in_place(make_docx):
+    path = make_docx()
+
+    async def main():
+        with await Docx.open_async(path) as docx:
+            docx.paragraphs[0].set_text('Saved')
+            await docx.save_async(path)
+
+    asyncio.run(main())
+    assert texts(path) == ['Saved', 'Second paragraph']
+    assert os.listdir(os.path.dirname(path)) == ['doc.docx']
+
+
+@pytest.mark.parametrize('writer', [AsyncWriter, StreamWriter])
+def test_save_async_to_stream(data, writer):
+    target = writer()
+
+    async def main():
+        with await Docx.open_async(data) as docx:
+            await docx.save_async(target)
+
+    asyncio.run(main())
+    assert texts(io.BytesIO(bytes(target.data))) == ['Hello world', 'Second paragraph']
+
+
+def test_save_async_into_source_is_rejected(data):
+    async def main():
+        source = io.BytesIO(data)
+        with await Docx.open_async(source) as docx:
+            await docx.save_async(source)
+
+    with pytest.raises(ValueError):
+        asyncio.run(main())
+
+
+def test_cancelled_save_keeps_target(make_docx):
+    path = make_docx(paragraph('Original'))
+    with open(path, 'rb') as fh:
+        before = fh.read()
+    cancel = threading.Event()
+    cancel.set()
+    with Docx.open(make_docx(name='other.docx')) as docx:
+        with pytest.raises(aio.SaveCancelled):
+            aio.save_to(docx.package.save, path, cancel)
+    with open(path, 'rb') as fh:
+        assert fh.read() == before
+    assert sorted(os.listdir(os.path.dirname(path))) == ['doc.docx', 'other.docx']
+
+
+def test_in_flight_limit():
+    active = peak = 0
+
+    async def job():
+        nonlocal active, peak
+        async with aio.in_flight():
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+
+    async def main():
+        await asyncio.gather(*(job() for _ in range(6)))
+
+    aio.configure(max_in_flight=2)
+    try:
+        asyncio.run(main())
+    finally:
+        aio.configure(max_in_flight=aio.DEFAULT_MAX_IN_FLIGHT)
+    assert peak == 2
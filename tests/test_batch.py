@@ -0,0 +1,124 @@
+import io
+import json
+import os
+import shutil
+import time
+
+from docx import Docx, Font, Run, batch
+from docx.tags import W_RPR
+from factory import W_NS, paragraph
+
+FORMATTED = paragraph('styled', '00000001', rpr=(
+    '<w:rStyle w:val="Emphasis"/><w:rFonts w:ascii="Arial" w:cs="Arial"/><w:i/>'
+    '<w:color w:val="FF0000"/><w:u w:val="single"/><w:lang w:val="en-US"/>'))
+
+
+def rpr_children(run) -> list[str]:
+    return [child.tag.split('}')[1] for child in run.element.find(W_RPR)]
+
+
+def test_update_rpr_keeps_unmodelled_children():
+    run = Run.from_xml_str('<w:r xmlns:w="%s"><w:rPr><w:rStyle w:val="Emphasis"/><w:rFonts w:asciiTheme="minorHAnsi" '
+                           'w:cs="Arial"/><w:i/><w:u w:val="single"/><w:lang w:val="en-US"/></w:rPr>'
+                           '<w:t>x</w:t></w:r>' % W_NS)
+    run.update_rpr(bold=True, italic=None, size=24, font=Font('Arial'))
+    assert rpr_children(run) == ['rStyle', 'rFonts', 'b', 'sz', 'u', 'lang']
+    assert run.rpr.bold is True and run.rpr.italic is None and run.rpr.size == 24
+    rfonts = run.element.find(W_RPR)[1]
+    assert rfonts.get('{%s}ascii' % W_NS) == 'Arial'
+    assert rfonts.get('{%s}cs' % W_NS) == 'Arial'
+    assert rfonts.get('{%s}asciiTheme' % W_NS) is None
+    assert Run(run.element).rpr == run.rpr
+
+
+def test_update_rpr_creates_rpr():
+    run = Run.from_xml_str('<w:r xmlns:w="%s"><w:t>x</w:t></w:r>' % W_NS)
+    run.update_rpr(italic=True)
+    assert rpr_children(run) == ['i']
+    assert run.element[0].tag == W_RPR
+
+
+def test_apply_run_format_preserves_other_properties(make_docx, tmp_path):
+    source = tmp_path / 'drop'
+    make_docx(FORMATTED, name='drop/a.docx')
+    out = io.StringIO()
+    stats = batch.run_batch(str(source), 'apply-run-format', workers=1,
+                            options={'out_dir': str(tmp_path / 'out'), 'format': {'bold': True}}, output=out)
+    assert stats['failed'] == 0
+    with Docx.open(tmp_path / 'out' / 'a.docx') as docx:
+        run = docx.paragraphs[0].runs[0]
+        assert rpr_children(run) == ['rStyle', 'rFonts', 'b', 'i', 'color', 'u', 'lang']
+
+
+def test_outputs_keep_relative_paths(make_docx, tmp_path):
+    make_docx(paragraph('top', '00000001'), name='drop/x.docx')
+    make_docx(paragraph('nested', '00000001') + paragraph('dup', '00000001'), name='drop/sub/x.docx')
+    out = io.StringIO()
+    stats = batch.run_batch(str(tmp_path / 'drop'), 'rewrite-para-ids', workers=2,
+                            options={'out_dir': str(tmp_path / 'out')}, output=out)
+    assert stats['documents'] == 2 and stats['failed'] == 0
+    with Docx.open(tmp_path / 'out' / 'x.docx') as docx:
+        assert [p.text for p in docx.paragraphs] == ['top']
+    with Docx.open(tmp_path / 'out' / 'sub' / 'x.docx') as docx:
+        ids = [p.para_id for p in docx.paragraphs]
+        assert len(set(ids)) == 2
+    records = {os.path.relpath(r['path'], tmp_path): r for r in map(json.loads, out.getvalue().splitlines())}
+    assert records[os.path.join('drop', 'sub', 'x.docx')]['result']['rewritten'] == 1
+
+
+def test_failures_are_reported_per_file(make_docx, tmp_path):
+    make_docx(name='drop/good.docx')
+    (tmp_path / 'drop' / 'bad.docx').write_bytes(b'not a zip')
+    manifest = tmp_path / 'manifest.jsonl'
+    manifest.write_text('\n'.join(json.dumps({'path': str(tmp_path / 'drop' / name)})
+                                  for name in ('good.docx', 'bad.docx')))
+    out = io.StringIO()
+    stats = batch.run_batch(str(manifest), 'extract-text', workers=2, output=out)
+    records = {os.path.basename(r['path']): r for r in map(json.loads, out.getvalue().splitlines())}
+    assert stats['failed'] == 1
+    assert records['good.docx']['result']['text'] == 'Hello world\nSecond paragraph'
+    assert records['bad.docx']['error'].startswith('BadZipFile')
+
+
+def sleepy_op(path, options):
+    if os.path.basename(path) == 'a.docx':
+        time.sleep(1.0)
+    return {}
+
+
+def test_results_are_written_as_they_complete(make_docx, tmp_path):
+    first = make_docx(name='drop/a.docx')
+    for name in 'bcd':
+        shutil.copy(first, tmp_path / 'drop' / ('%s.docx' % name))
+    out = io.StringIO()
+    batch.run_batch(str(tmp_path / 'drop'), __name__ + ':sleepy_op', workers=2, output=out)
+    order = [os.path.basename(json.loads(line)['path']) for line in out.getvalue().splitlines()]
+    assert sorted(order) == ['a.docx', 'b.docx', 'c.docx', 'd.docx']
+    assert order[-1] == 'a.docx'
+
+
+def crashing_op(path, options):
+    if os.path.basename(path) == 'crash.docx':
+        os._exit(1)
+    return {'name': os.path.basename(path)}
+
+
+def test_worker_crash_fails_only_its_chunk(make_docx, tmp_path):
+    first = make_docx(name='drop/a.docx')
+    for name in ('b', 'c', 'crash', 'd', 'e', 'f'):
+        shutil.copy(first, tmp_path / 'drop' / ('%s.docx' % name))
+    out = io.StringIO()
+    stats = batch.run_batch(str(tmp_path / 'drop'), __name__ + ':crashing_op', workers=2, output=out)
+    records = {os.path.basename(r['path']): r for r in map(json.loads, out.getvalue().splitlines())}
+    assert sorted(records) == ['a.docx', 'b.docx', 'c.docx', 'crash.docx', 'd.docx', 'e.docx', 'f.docx']
+    assert stats['documents'] == 7 and stats['failed'] == 1
+    assert records['crash.docx']['error'].startswith('BrokenProcessPool')
+    assert all(r['ok'] for name, r in records.items() if name != 'crash.docx')
+
+
+def test_cli(make_docx, tmp_path, capsys):
+    make_docx(name='drop/a.docx')
+    assert batch.main(['batch', str(tmp_path / 'drop'), '--op', 'scan-para-ids', '--workers', '1']) == 0
+    captured = capsys.readouterr()
+    assert json.loads(captured.out)['result']['ids'] == 3
+    assert '1 documents, 0 failed' in captured.err
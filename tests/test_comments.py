@@ -0,0 +1,151 @@
+import zipfile
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from docx import CommentAnchor, CommentWriter, Docx, xml_engine
+from docx.golbal import NAMESPACES
+from docx.tags import W_COMMENT, W_COMMENT_RANGE_START, W_COMMENT_REFERENCE, W_ID, W_P, W14_PARA_ID
+from factory import paragraph
+
+W15_PARA_ID = '{http://schemas.microsoft.com/office/word/2012/wordml}paraId'
+DATE = datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc)
+
+
+def read_xml(path, name):
+    with zipfile.ZipFile(path) as z:
+        return xml_engine.fromstring(z.read(name))
+
+
+def test_comments_round_trip(make_docx, tmp_path):
+    target = tmp_path / 'out.docx'
+    with Docx.open(make_docx()) as docx:
+        writer = CommentWriter(docx, 'Reviewer', 'R', DATE)
+        assert writer.add_many([(CommentAnchor(0), 'first'), (CommentAnchor('00000002', start_run=0), 'a\nb')]) == [0, 1]
+        writer.flush()
+        docx.save(target)
+
+    comments = read_xml(target, 'word/comments.xml').findall(W_COMMENT)
+    assert [c.get(W_ID) for c in comments] == ['0', '1']
+    assert [len(c.findall(W_P)) for c in comments] == [1, 2]
+    document = read_xml(target, 'word/document.xml')
+    assert [e.get(W_ID) for e in document.iter(W_COMMENT_RANGE_START)] == ['0', '1']
+    assert [e.get(W_ID) for e in document.iter(W_COMMENT_REFERENCE)] == ['0', '1']
+    with zipfile.ZipFile(target) as z:
+        assert 'word/commentsExtended.xml' in z.namelist()
+
+
+def test_writers_on_one_docx_share_ids(make_docx, tmp_path):
+    target = tmp_path / 'out.docx'
+    with Docx.open(make_docx()) as docx:
+        first = CommentWriter(docx, 'A', date=DATE)
+        first.add(CommentAnchor(0), 'one')
+        first.flush()
+        second = CommentWriter(docx, 'B', date=DATE)
+        third = CommentWriter(docx, 'C', date=DATE)
+        second.add(CommentAnchor(1), 'two')
+        third.add(CommentAnchor(1), 'three')
+        first.add(CommentAnchor(0), 'four')
+        third.flush()
+        second.flush()
+        first.flush()
+        docx.save(target)
+
+    comments = read_xml(target, 'word/comments.xml')
+    assert sorted(int(c.get(W_ID)) for c in comments.iter(W_COMMENT)) == [0, 1, 2, 3]
+    para_ids = [p.get(W14_PARA_ID) for p in comments.iter(W_P)]
+    para_ids += [p.get(W14_PARA_ID) for p in read_xml(target, 'word/document.xml').iter(W_P)]
+    assert len(para_ids) == len(set(para_ids)) == 6
+    extended = [e.get(W15_PARA_ID) for e in read_xml(target, 'word/commentsExtended.xml').iter()
+                if e.get(W15_PARA_ID)]
+    assert len(extended) == len(set(extended)) == 4
+
+
+def test_ids_continue_after_saved_comments(make_docx, tmp_path):
+    first = tmp_path / 'first.docx'
+    with Docx.open(make_docx()) as docx:
+        writer = CommentWriter(docx, 'A', date=DATE)
+        writer.add(CommentAnchor(0), 'one')
+        writer.flush()
+        docx.save(first)
+    with Docx.open(first) as docx:
+        writer = CommentWriter(docx, 'A', date=DATE)
+        assert writer.add(CommentAnchor(1), 'two') == 1
+
+
+def test_unknown_anchor_is_rejected(make_docx):
+    with Docx.open(make_docx(paragraph('only', '00000001'))) as docx:
+        writer = CommentWriter(docx, 'A', date=DATE)
+        writer.add(CommentAnchor('0000ABCD'), 'missing')
+        with pytest.raises(ValueError):
+            writer.flush()
+
+
+def document_state(docx):
+    return docx.document.dirty, xml_engine.tostring(docx.document.readonly_element)
+
+
+@pytest.mark.parametrize('anchor', [
+    CommentAnchor(0, start_run=1),
+    CommentAnchor(1, end_run=-1),
+    CommentAnchor(1, end_paragraph=0),
+    CommentAnchor(0, start_run=0, end_run=None, end_paragraph='0000ABCD'),
+], ids=['start-run-out-of-range', 'negative-end-run', 'start-after-end', 'unknown-end'])
+def test_failed_flush_leaves_document_unchanged(make_docx, anchor):
+    with Docx.open(make_docx()) as docx:
+        before = document_state(docx)
+        para_ids = docx.para_ids.to_bytes()
+        writer = CommentWriter(docx, 'A', date=DATE)
+        writer.add(CommentAnchor(0), 'valid')
+        writer.add(anchor, 'invalid')
+        with pytest.raises(ValueError):
+            writer.flush()
+        assert document_state(docx) == before
+        assert docx.para_ids.to_bytes() == para_ids
+        assert docx.comments is None
+
+
+def test_run_order_within_one_paragraph(make_docx):
+    body = '<w:p w14:paraId="00000001"><w:r><w:t>a</w:t></w:r><w:r><w:t>b</w:t></w:r></w:p>'
+    with Docx.open(make_docx(body)) as docx:
+        writer = CommentWriter(docx, 'A', date=DATE)
+        writer.add(CommentAnchor(0, start_run=1, end_run=0), 'backwards')
+        with pytest.raises(ValueError, match='starts after it ends'):
+            writer.flush()
+        assert not docx.document.dirty
+        writer = CommentWriter(docx, 'A', date=DATE)
+        writer.add(CommentAnchor(0, start_run=1, end_run=1), 'one run')
+        writer.add(CommentAnchor(0, start_run=1), 'to the end')
+        writer.flush()
+        assert len(list(docx.document.readonly_element.iter(W_COMMENT_RANGE_START))) == 2
+
+
+def test_comments_part_without_namespaces_is_rejected_before_changes(make_docx):
+    from docx.comments import CT_COMMENTS
+    from docx.package import RT_COMMENTS
+
+    with Docx.open(make_docx()) as docx:
+        docx.package.add_part('/word/comments.xml', CT_COMMENTS,
+                              b'<w:comments xmlns:w="%s"/>' % NAMESPACES['w'].encode(),
+                              docx.document, RT_COMMENTS)
+        before = document_state(docx)
+        writer = CommentWriter(docx, 'A', date=DATE)
+        writer.add(CommentAnchor(0), 'one')
+        with pytest.raises(ValueError, match='w14'):
+            writer.flush()
+        assert document_state(docx) == before
+
+
+@pytest.mark.parametrize('date', [
+    datetime(2024, 1, 2, 11, 4, 5, tzinfo=timezone(timedelta(hours=8))),
+    datetime(2024, 1, 2, 3, 4, 5),
+], ids=['aware', 'naive'])
+def test_comment_dates_are_written_in_utc(make_docx, tmp_path, date):
+    target = tmp_path / 'out.docx'
+    with Docx.open(make_docx()) as docx:
+        writer = CommentWriter(docx, 'A')
+        writer.add(CommentAnchor(0), 'one', date=date)
+        writer.flush()
+        docx.save(target)
+    comment = read_xml(target, 'word/comments.xml').find(W_COMMENT)
+    assert comment.get('{%s}date' % NAMESPACES['w']) == '2024-01-02T03:04:05Z'
@@ -0,0 +1,82 @@
+from docx import Docx, diff_documents
+from docx.compare import DELETED, INSERTED, MODIFIED, MOVED
+from docx.run_properties import RunProperties
+from factory import paragraph
+
+
+def changes(make_docx, a_body, b_body):
+    a = make_docx(a_body, name='a.docx')
+    b = make_docx(b_body, name='b.docx')
+    return [(c.kind, c.a_index, c.b_index, c.old_text, c.new_text) for c in diff_documents(a, b)]
+
+
+def doc(*texts, ids=True):
+    return ''.join(paragraph(text, '%08X' % (n + 1) if ids else None) for n, text in enumerate(texts))
+
+
+def test_identical_documents(make_docx):
+    body = doc('Alpha', 'Beta', 'Beta')
+    assert changes(make_docx, body, body) == []
+
+
+def test_paragraphs_matched_by_para_id(make_docx):
+    a = doc('Alpha', 'Beta', 'Gamma')
+    b = paragraph('Alpha', '00000001') + paragraph('New', '0000000A') + paragraph('Gamma!', '00000003')
+    assert changes(make_docx, a, b) == [
+        (MODIFIED, 1, 1, 'Beta', 'New'),
+        (MODIFIED, 2, 2, 'Gamma', 'Gamma!'),
+    ]
+
+
+def test_inserted_and_deleted_by_content(make_docx):
+    a = doc('Alpha', 'Beta', 'Gamma', ids=False)
+    b = doc('Alpha', 'Gamma', 'Delta', ids=False)
+    assert changes(make_docx, a, b) == [
+        (DELETED, 1, None, 'Beta', None),
+        (INSERTED, None, 2, None, 'Delta'),
+    ]
+
+
+def test_moved_paragraph(make_docx):
+    a = doc('Alpha', 'Beta', 'Gamma', 'Delta')
+    b = paragraph('Alpha', '00000001') + paragraph('Gamma', '00000003') + paragraph('Delta', '00000004') \
+        + paragraph('Beta', '00000002')
+    assert changes(make_docx, a, b) == [(MOVED, 1, 3, 'Beta', 'Beta')]
+
+
+def test_run_changes(make_docx):
+    a = paragraph('The quick fox', '00000001')
+    b = ('<w:p w14:paraId="00000001"><w:r><w:t xml:space="preserve">The </w:t></w:r>'
+         '<w:r><w:rPr><w:b/></w:rPr><w:t>quick</w:t></w:r><w:r><w:t xml:space="preserve"> brown fox</w:t></w:r></w:p>')
+    change, = diff_documents(make_docx(a, name='a.docx'), make_docx(b, name='b.docx'))
+    assert change.kind == MODIFIED
+    assert [(r.kind, r.a_start, r.a_end, r.b_start, r.b_end, r.new_text) for r in change.runs] == [
+        ('format', 4, 9, 4, 9, ''),
+        ('insert', 10, 10, 10, 16, 'brown '),
+    ]
+    assert change.runs[0].old_rpr is None
+    assert change.runs[0].new_rpr == RunProperties(bold=True)
+
+
+def test_run_splits_are_not_changes(make_docx):
+    a = paragraph('Hello world', '00000001')
+    b = ('<w:p w14:paraId="00000001"><w:r><w:t>Hello</w:t></w:r>'
+         '<w:r><w:t xml:space="preserve"> wor</w:t></w:r><w:r><w:t>ld</w:t></w:r></w:p>')
+    assert changes(make_docx, a, b) == []
+
+
+def test_empty_rpr_is_not_a_format_change(make_docx):
+    a = paragraph('Hello world', '00000001') + paragraph('Second', '00000002')
+    b = ('<w:p w14:paraId="00000001"><w:r><w:rPr/><w:t>Hello</w:t></w:r>'
+         '<w:r><w:t xml:space="preserve"> world</w:t></w:r></w:p>' + paragraph('Second!', '00000002'))
+    change, = diff_documents(make_docx(a, name='a.docx'), make_docx(b, name='b.docx'))
+    assert change.a_index == 1
+    assert [r.kind for r in change.runs] == ['insert']
+
+
+def test_docx_diff_accepts_open_documents(make_docx):
+    a = make_docx(doc('Alpha', 'Beta'), name='a.docx')
+    b = make_docx(doc('Alpha', 'Beta!'), name='b.docx')
+    with Docx.open(a) as a_doc, Docx.open(b) as b_doc:
+        assert [(c.kind, c.para_id) for c in a_doc.diff(b_doc)] == [(MODIFIED, '00000002')]
+        assert a_doc.paragraphs[1].text == 'Beta'
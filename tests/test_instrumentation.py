@@ -0,0 +1,77 @@
+import logging
+
+import pytest
+
+from docx import Paragraph, instrumentation
+from factory import W_NS
+
+XML = '<w:p xmlns:w="%s"><w:r><w:t>text</w:t></w:r></w:p>' % W_NS
+
+
+def test_counters_stay_at_zero_when_collection_is_off():
+    assert instrumentation.current() is None
+    Paragraph.from_xml_str(XML)
+    with instrumentation.collect() as stats:
+        pass
+    assert stats.snapshot() == {}
+    assert instrumentation.current() is None
+
+
+def test_counters_count_inside_collect():
+    paragraph = Paragraph.from_xml_str(XML)
+    with instrumentation.collect('scope') as stats:
+        assert instrumentation.current() is stats
+        xml = paragraph.xml
+        Paragraph.from_xml_str(xml)
+        Paragraph.from_xml_str(xml)
+    assert stats.get('Paragraph.xml', instrumentation.SERIALIZE).count == 1
+    parse = stats.get('Paragraph.from_xml_str', instrumentation.PARSE)
+    assert parse.count == 2
+    assert parse.elements > 0
+    assert stats.totals()[instrumentation.PARSE].count >= 2
+    # 作用域结束后不再计数
+    Paragraph.from_xml_str(xml)
+    assert stats.get('Paragraph.from_xml_str', instrumentation.PARSE).count == 2
+
+
+@pytest.fixture
+def exporters():
+    added = []
+
+    def add(exporter):
+        instrumentation.add_exporter(exporter)
+        added.append(exporter)
+
+    yield add
+    for exporter in added:
+        instrumentation.remove_exporter(exporter)
+
+
+def test_exporters_run_when_the_body_raises(exporters):
+    exported = []
+    exporters(lambda name, snapshot: exported.append((name, snapshot)))
+    with pytest.raises(KeyError):
+        with instrumentation.collect('failing'):
+            Paragraph.from_xml_str(XML)
+            raise KeyError('body')
+    assert [name for name, _ in exported] == ['failing']
+    assert exported[0][1]['Paragraph.from_xml_str']['parse']['count'] == 1
+    assert instrumentation.current() is None
+
+
+def test_failing_exporter_does_not_hide_the_original_exception(exporters, caplog):
+    exported = []
+
+    def broken(name, snapshot):
+        raise RuntimeError('exporter')
+
+    exporters(broken)
+    exporters(lambda name, snapshot: exported.append(name))
+    with caplog.at_level(logging.ERROR, logger='docx.instrumentation'):
+        with pytest.raises(KeyError, match='body'):
+            with instrumentation.collect('failing'):
+                raise KeyError('body')
+        with instrumentation.collect('ok'):
+            pass
+    assert exported == ['failing', 'ok']
+    assert len(caplog.records) == 2
@@ -0,0 +1,96 @@
+import zipfile
+
+from docx import Docx
+from docx.numbering import format_number, set_list
+from factory import W_NS, paragraph
+
+
+def lvl(ilvl, fmt, text, extra=''):
+    return ('<w:lvl w:ilvl="%d"><w:start w:val="1"/><w:numFmt w:val="%s"/><w:lvlText w:val="%s"/>%s</w:lvl>'
+            % (ilvl, fmt, text, extra))
+
+
+DECIMAL = lvl(0, 'decimal', '%1.') + lvl(1, 'lowerLetter', '%1.%2)')
+
+
+def num_pr(num_id, ilvl=None):
+    ilvl = '' if ilvl is None else '<w:ilvl w:val="%d"/>' % ilvl
+    return '<w:numPr>%s<w:numId w:val="%d"/></w:numPr>' % (ilvl, num_id)
+
+
+def item(text, num_id=None, ilvl=None, style=None):
+    ppr = ('<w:pStyle w:val="%s"/>' % style if style else '') + (num_pr(num_id, ilvl) if num_id is not None else '')
+    return paragraph(text, ppr=ppr)
+
+
+def style(style_id, type_='paragraph', ppr='', based_on=None):
+    based_on = '<w:basedOn w:val="%s"/>' % based_on if based_on else ''
+    return '<w:style w:type="%s" w:styleId="%s">%s%s</w:style>' % (
+        type_, style_id, based_on, ppr and '<w:pPr>%s</w:pPr>' % ppr)
+
+
+def test_format_number():
+    assert [format_number(n, 'lowerLetter') for n in (1, 26, 27)] == ['a', 'z', 'aa']
+    assert format_number(14, 'upperRoman') == 'XIV'
+    assert format_number(3, 'decimalZero') == '03'
+
+
+def test_levels_and_restart(make_docx):
+    numbering = ('<w:abstractNum w:abstractNumId="0">%s</w:abstractNum>' % DECIMAL
+                 + '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+                 + '<w:num w:numId="2"><w:abstractNumId w:val="0"/>'
+                   '<w:lvlOverride w:ilvl="0"><w:startOverride w:val="5"/></w:lvlOverride></w:num>')
+    body = (item('a', 1, 0) + item('b', 1, 1) + item('c', 1, 1) + item('plain')
+            + item('d', 1, 0) + item('e', 1, 1) + item('f', 2, 0))
+    with Docx.open(make_docx(body, numbering=numbering)) as docx:
+        assert docx.list_labels().labels == ['1.', '1.a)', '1.b)', None, '2.', '2.a)', '5.']
+
+
+def test_num_style_link_resolves_to_linked_abstract(make_docx):
+    numbering = ('<w:abstractNum w:abstractNumId="0"><w:styleLink w:val="Outline"/>%s</w:abstractNum>' % DECIMAL
+                 + '<w:abstractNum w:abstractNumId="1"><w:numStyleLink w:val="Outline"/></w:abstractNum>'
+                 + '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>'
+                 + '<w:num w:numId="2"><w:abstractNumId w:val="1"/></w:num>')
+    styles = style('Outline', 'numbering', num_pr(1))
+    body = item('a', 2, 0) + item('b', 2, 1) + item('c', 1, 0)
+    with Docx.open(make_docx(body, styles=styles, numbering=numbering)) as docx:
+        assert docx.lists.abstract_id(2) == 0
+        assert docx.list_labels().labels == ['1.', '1.a)', '2.']
+
+
+def test_style_numbering_is_inherited_and_merged(make_docx):
+    numbering = ('<w:abstractNum w:abstractNumId="0">%s%s</w:abstractNum>' % (
+                     lvl(0, 'decimal', '%1', '<w:pStyle w:val="Heading1"/>'),
+                     lvl(1, 'decimal', '%1.%2', '<w:pStyle w:val="Heading2"/>'))
+                 + '<w:num w:numId="1"><w:abstractNumId w:val="0"/></w:num>')
+    styles = (style('Heading1', ppr=num_pr(1, 0)) + style('Heading2', ppr=num_pr(1))
+              + style('Chapter', based_on='Heading1'))
+    body = (item('a', style='Heading1') + item('b', style='Heading2') + item('c', style='Chapter')
+            + item('d', style='Heading1', num_id=1, ilvl=1) + item('e', style='Heading1', num_id=0)
+            + item('f', style='Heading2'))
+    with Docx.open(make_docx(body, styles=styles, numbering=numbering)) as docx:
+        assert docx.list_labels().labels == ['1', '1.1', '2', '2.1', None, '2.2']
+
+
+def test_add_list_clones_only_the_requested_prototype(make_docx, tmp_path):
+    target = tmp_path / 'out.docx'
+    with Docx.open(make_docx(item('a') + item('b') + item('c'))) as docx:
+        num_id = docx.lists.add_list('bullet')
+        restarted = docx.lists.add_list('decimal', start=3)
+        paragraphs = [p.element for p in docx.paragraphs]
+        set_list(paragraphs[0], num_id)
+        set_list(paragraphs[1], restarted)
+        set_list(paragraphs[2], restarted)
+        docx.document.mark_dirty()
+        assert docx.list_labels().labels[1:] == ['3.', '4.']
+        docx.save(target)
+
+    with zipfile.ZipFile(target) as z:
+        xml = z.read('word/numbering.xml').decode('utf-8')
+    assert xml.count('<w:abstractNum ') == 2
+    assert xml.count('<w:num ') == 2
+    with Docx.open(target) as docx:
+        assert sorted(docx.lists.abstract_nums) == [0, 1]
+        labels = docx.list_labels().labels
+        assert labels[0] and labels[1:] == ['3.', '4.']
+        assert docx.numbering.readonly_element.find('{%s}abstractNum/{%s}nsid' % (W_NS, W_NS)) is not None
@@ -0,0 +1,91 @@
+import io
+import zipfile
+
+import pytest
+
+from docx import Docx, package
+from factory import IMAGE, member_crcs
+
+
+def test_save_round_trip_copies_untouched_members(make_docx, tmp_path):
+    path = make_docx()
+    target = tmp_path / 'out.docx'
+    with Docx.open(path) as docx:
+        docx.paragraphs[0].runs[0].text = 'Changed'
+        docx.save(target)
+    before, after = member_crcs(path), member_crcs(target)
+    assert list(after) == list(before)
+    assert after['word/document.xml'] != before['word/document.xml']
+    assert {name: crc for name, crc in after.items() if name != 'word/document.xml'} == \
+        {name: crc for name, crc in before.items() if name != 'word/document.xml'}
+    with Docx.open(target) as docx:
+        assert [p.text for p in docx.paragraphs] == ['Changed', 'Second paragraph']
+
+
+def test_save_in_place(make_docx):
+    path = make_docx()
+    with Docx.open(path) as docx:
+        docx.paragraphs[1].runs[0].text = 'In place'
+        docx.save(path)
+    with zipfile.ZipFile(path) as z:
+        assert z.testzip() is None
+        assert z.read('word/media/image1.png') == IMAGE
+    with Docx.open(path) as docx:
+        assert [p.text for p in docx.paragraphs] == ['Hello world', 'In place']
+
+
+def test_failed_save_leaves_target_untouched(make_docx, tmp_path, monkeypatch):
+    path = make_docx()
+    original = open(path, 'rb').read()
+
+    def fail(*args):
+        raise OSError('disk full')
+
+    monkeypatch.setattr(package, 'copy_member', fail)
+    with Docx.open(path) as docx:
+        with pytest.raises(OSError):
+            docx.save(path)
+    assert open(path, 'rb').read() == original
+    assert sorted(p.name for p in tmp_path.iterdir()) == ['doc.docx']
+
+
+def test_save_into_source_file_object_is_rejected(make_docx):
+    source = io.BytesIO(open(make_docx(), 'rb').read())
+    with Docx.open(source) as docx:
+        with pytest.raises(ValueError):
+            docx.save(source)
+
+
+def test_read_only_access_does_not_dirty_parts(make_docx, tmp_path):
+    path = make_docx()
+    target = tmp_path / 'out.docx'
+    with Docx.open(path) as docx:
+        assert [m.text for m in docx.find('Head')] == ['Head']
+        docx.xml
+        docx.list_labels()
+        assert not any(part.dirty for part in docx.story_parts)
+        docx.save(target)
+    assert member_crcs(target) == member_crcs(path)
+
+
+def test_replace_dirties_only_matching_parts(make_docx, tmp_path):
+    path = make_docx()
+    target = tmp_path / 'out.docx'
+    with Docx.open(path) as docx:
+        assert docx.replace('Head', 'Header') == 1
+        assert not docx.document.dirty
+        docx.save(target)
+    before, after = member_crcs(path), member_crcs(target)
+    assert after['word/document.xml'] == before['word/document.xml']
+    assert after['word/header1.xml'] != before['word/header1.xml']
+
+
+def test_copy_without_zipfile_internals(make_docx, tmp_path, monkeypatch):
+    monkeypatch.setattr(package, '_RAW_COPY', False)
+    path = make_docx()
+    target = tmp_path / 'out.docx'
+    with Docx.open(path) as docx:
+        docx.save(target)
+    assert member_crcs(target) == member_crcs(path)
+    with zipfile.ZipFile(target) as z:
+        assert z.testzip() is None
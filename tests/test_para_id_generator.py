@@ -0,0 +1,42 @@
+import copy
+
+import pytest
+
+from docx import Docx, ParaIdGenerator, UniqueIDGenerator
+from docx.package import RT_COMMENTS
+from docx.tags import W14_PARA_ID
+from factory import paragraph
+
+CT_COMMENTS = 'application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml'
+COMMENTS = (
+    b'<w:comments xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+    b'xmlns:w14="http://schemas.microsoft.com/office/word/2010/wordml">'
+    b'<w:comment w:id="0"><w:p w14:paraId="00000004"/></w:comment></w:comments>'
+)
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_scans_zip_and_directory(make_docx, tmp_path, workers):
+    path = make_docx(paragraph('a', '00000001') + paragraph('b', '00000003'))
+    generator = ParaIdGenerator(path, workers=workers)
+    assert set(generator.part_stats) == {'word/document.xml', 'word/header1.xml'}
+    assert generator.reserve(3) == ['00000002', '00000004', '00000005']
+
+
+@pytest.mark.parametrize('workers', [1, 4])
+def test_scans_live_parts(make_docx, workers):
+    with Docx.open(make_docx(paragraph('a', '00000001'))) as docx:
+        docx.document.append_xml(b'<w:p w14:paraId="00000002"/>')
+        header = docx.headers[0].element
+        header.append(copy.deepcopy(header[0]))
+        header[-1].set(W14_PARA_ID, '00000003')
+        docx.package.add_part('/word/comments.xml', CT_COMMENTS, COMMENTS, docx.document, RT_COMMENTS)
+        generator = ParaIdGenerator(docx, workers=workers)
+        assert generator.part_stats['word/comments.xml'].count == 1
+        assert generator.generate_unique_id() == '00000005'
+
+
+def test_round_trips_state():
+    generator = ParaIdGenerator.from_bytes(UniqueIDGenerator(['00000001']).to_bytes())
+    assert generator.generate_unique_id() == '00000002'
+    assert ParaIdGenerator.from_bytes(generator.to_bytes()).generate_unique_id() == '00000003'
@@ -0,0 +1,82 @@
+import pytest
+
+from docx import Paragraph
+from docx.tags import W_T, XML_SPACE
+from factory import W_NS
+
+RUNS = (
+    '<w:p xmlns:w="%s">'
+    '<w:r><w:rPr><w:b/></w:rPr><w:t>Hello</w:t></w:r>'
+    '<w:hyperlink><w:r><w:t xml:space="preserve"> big </w:t></w:r></w:hyperlink>'
+    '<w:r><w:t>wor</w:t><w:t>ld</w:t></w:r>'
+    '</w:p>' % W_NS
+)
+
+
+def make():
+    return Paragraph.from_xml_str(RUNS)
+
+
+def test_text_and_length():
+    paragraph = make()
+    assert paragraph.text == 'Hello big world'
+    assert len(paragraph) == 15
+
+
+@pytest.mark.parametrize('offset, expected', [
+    (0, ('Hello', 0)), (4, ('Hello', 4)), (5, (' big ', 0)), (10, ('wor', 0)), (13, ('ld', 0)), (15, ('ld', 2)),
+])
+def test_locate(offset, expected):
+    _, text, inner = make().locate(offset)
+    assert (text.text, inner) == expected
+
+
+def test_locate_out_of_range():
+    with pytest.raises(IndexError):
+        make().locate(16)
+    with pytest.raises(IndexError):
+        Paragraph().locate(0)
+
+
+def test_replace_within_one_text():
+    paragraph = make()
+    paragraph.replace_range(1, 4, 'ipp')
+    assert paragraph.text == 'Hippo big world'
+    assert [t.text for t in paragraph.texts] == ['Hippo', ' big ', 'wor', 'ld']
+
+
+def test_replace_across_runs_keeps_first_format_and_index():
+    paragraph = make()
+    paragraph.replace_range(3, 11, 'p! W')
+    assert paragraph.text == 'Help! World'
+    assert [t.text for t in paragraph.texts] == ['Help! W', 'or', 'ld']
+    # 增量更新后的索引与重新计算的一致
+    fresh = Paragraph(paragraph.element)
+    for offset in range(len(fresh) + 1):
+        assert paragraph.locate(offset)[1].element is fresh.locate(offset)[1].element
+        assert paragraph.locate(offset)[2] == fresh.locate(offset)[2]
+    paragraph.replace_range(8, 11, 'RLD')
+    assert paragraph.text == Paragraph(paragraph.element).text == 'Help! WoRLD'
+
+
+def test_replace_at_fragment_boundary_touches_one_run():
+    paragraph = make()
+    paragraph.replace_range(0, 5, 'Bye ')
+    assert [t.text for t in paragraph.texts] == ['Bye ', ' big ', 'wor', 'ld']
+    first = paragraph.element.find('.//' + W_T)
+    assert first.get(XML_SPACE) == 'preserve'
+
+
+def test_replace_in_empty_paragraph():
+    paragraph = Paragraph()
+    paragraph.replace_range(0, 0, 'new')
+    assert paragraph.text == 'new'
+    with pytest.raises(IndexError):
+        paragraph.replace_range(2, 5, 'x')
+
+
+def test_set_text():
+    paragraph = make()
+    paragraph.set_text('')
+    assert paragraph.text == ''
+    assert len(paragraph) == 0
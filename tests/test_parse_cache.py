@@ -0,0 +1,80 @@
+import os
+
+from docx import Docx, ParseCache
+from docx import parse_cache
+from factory import paragraph
+
+STYLES = '<w:style w:type="paragraph" w:styleId="Heading1"><w:rPr><w:b/><w:sz w:val="32"/></w:rPr></w:style>'
+BODY = (paragraph('Hello', '00000001', ppr='<w:pStyle w:val="Heading1"/>')
+        + paragraph('bold world', '00000002', rpr='<w:b/><w:color w:val="FF0000"/>'))
+
+
+def read(path, cache):
+    with Docx.open(path, cache=cache) as docx:
+        views = list(docx.iter_paragraphs())
+        title = docx.style_sheet.resolve('Heading1')
+    return views, title
+
+
+def test_second_open_hits(make_docx, tmp_path):
+    path = make_docx(BODY, styles=STYLES)
+    cache = ParseCache(tmp_path / 'cache')
+    uncached = read(path, False)
+    assert read(path, cache) == uncached
+    assert (cache.hits, cache.misses) == (0, 2)
+    assert len(os.listdir(cache.directory)) == 2
+    assert read(path, cache) == uncached
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_changed_part_misses(make_docx, tmp_path):
+    cache = ParseCache(tmp_path / 'cache')
+    read(make_docx(BODY, styles=STYLES), cache)
+    views, _ = read(make_docx(paragraph('Changed', '00000001'), name='other.docx', styles=STYLES), cache)
+    assert [view.text for view in views] == ['Changed']
+    # styles.xml 没变，只有正文未命中
+    assert (cache.hits, cache.misses) == (1, 3)
+
+
+def test_modified_part_bypasses_cache(make_docx, tmp_path):
+    path = make_docx(BODY)
+    cache = ParseCache(tmp_path / 'cache')
+    read(path, cache)
+    with Docx.open(path, cache=cache) as docx:
+        docx.paragraphs[0].set_text('Edited')
+        assert docx.document.zip_info is None
+        assert [view.text for view in docx.iter_paragraphs()] == ['Edited', 'bold world']
+    assert cache.hits == 0
+
+
+def test_corrupt_entry_is_dropped(make_docx, tmp_path):
+    path = make_docx(BODY)
+    cache = ParseCache(tmp_path / 'cache')
+    expected, _ = read(path, cache)
+    entry, = (os.path.join(cache.directory, name) for name in os.listdir(cache.directory))
+    with open(entry, 'wb') as fh:
+        fh.write(b'DXPC\x00garbage')
+    views, _ = read(path, cache)
+    assert views == expected
+    assert cache.hits == 0
+    assert os.path.getsize(entry) > 16
+
+
+def test_eviction_keeps_total_size_bounded(tmp_path):
+    cache = ParseCache(tmp_path / 'cache', max_bytes=300)
+    for n in range(5):
+        cache.put('k%d' % n, 'x' * 100)
+    assert cache.size <= 300
+    assert cache.get('k4') == 'x' * 100
+    assert cache.get('k0') is None
+    cache.clear()
+    assert cache.size == 0
+
+
+def test_resolve(tmp_path, monkeypatch):
+    monkeypatch.delenv(parse_cache.CACHE_ENV, raising=False)
+    assert parse_cache.resolve(None) is None
+    assert parse_cache.resolve(False) is None
+    monkeypatch.setenv(parse_cache.CACHE_ENV, str(tmp_path / 'env'))
+    assert parse_cache.resolve(None) is parse_cache.resolve(None)
+    assert parse_cache.resolve(tmp_path / 'dir').directory == str(tmp_path / 'dir')
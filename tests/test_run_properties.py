@@ -0,0 +1,34 @@
+from docx import font, run_properties, xml_engine
+from docx.font import Font
+from docx.run_properties import RunProperties
+
+
+def test_equal_formats_share_an_instance():
+    rpr = RunProperties(Font('Arial'), size=20, bold=True)
+    assert rpr.intern() is RunProperties(Font('Arial'), size=20, bold=True).intern()
+    assert rpr.intern().font is Font('Arial').intern()
+
+
+def test_intern_tables_are_bounded(monkeypatch):
+    monkeypatch.setattr(run_properties, 'MAX_INTERNED', 8)
+    monkeypatch.setattr(font, 'MAX_INTERNED', 8)
+    for size in range(1, 101):
+        rpr = RunProperties(Font(str(size)), size=size).intern()
+        rpr.to_xml_bytes()
+        rpr.to_xml_element()
+    for table in (run_properties._interned, run_properties._element_cache, run_properties._bytes_cache,
+                  font._interned):
+        assert 0 < len(table) <= 8
+    # 被丢弃的格式重新进入表，仍然与原来的实例相等
+    first = RunProperties(Font('1'), size=1)
+    assert first.intern() == first
+    assert xml_engine.fromstring(first.to_xml_bytes()).find('.//{%s}sz' % run_properties.W_NS) is not None
+
+
+def test_patch_keeps_unmodelled_children():
+    rpr = xml_engine.fromstring(
+        '<w:rPr xmlns:w="%s"><w:rStyle w:val="Emphasis"/><w:b/><w:u w:val="single"/></w:rPr>' % run_properties.W_NS)
+    RunProperties(bold=False, size=24).patch(rpr, ('bold', 'size'))
+    names = [child.tag.split('}')[1] for child in rpr]
+    assert names == ['rStyle', 'b', 'sz', 'u']
+    assert RunProperties.load_from_xml(rpr) == RunProperties(size=24, bold=False)
@@ -0,0 +1,138 @@
+import re
+
+import pytest
+
+from docx import Docx, Searcher
+from factory import W_NS, paragraph
+
+SPLIT = (
+    '<w:p w14:paraId="00000001"><w:r><w:rPr><w:b/></w:rPr><w:t>The quick br</w:t></w:r>'
+    '<w:r><w:t>own fox</w:t></w:r></w:p>' + paragraph('a bb and a cc', '00000002')
+)
+
+
+def spans(searcher, text):
+    return [(start, end, pattern) for start, end, pattern, _ in searcher.finditer(text)]
+
+
+def test_literals_prefer_longest_at_same_position():
+    searcher = Searcher(['fox', 'fo', 'brown', 'b'])
+    assert spans(searcher, 'brown fox') == [(0, 5, 'brown'), (6, 9, 'fox')]
+
+
+def test_literals_ignore_case():
+    searcher = Searcher(['Fox'], flags=re.IGNORECASE)
+    assert spans(searcher, 'FOX fox') == [(0, 3, 'Fox'), (4, 7, 'Fox')]
+
+
+def test_literals_ignore_case_use_re_case_folding():
+    searcher = Searcher(['\u017f', 'K'], flags=re.IGNORECASE)
+    assert spans(searcher, 'sk') == [(0, 1, '\u017f'), (1, 2, 'K')]
+    assert spans(Searcher(['i'], flags=re.IGNORECASE), '\u0130\u0131') == [(0, 1, 'i'), (1, 2, 'i')]
+
+
+@pytest.mark.parametrize('patterns', [['Foo', 'foo'], ['s', '\u017f'], ['i', '\u0131']])
+def test_literals_that_collide_when_ignoring_case_are_rejected(patterns):
+    with pytest.raises(ValueError, match='match the same text'):
+        Searcher(patterns, flags=re.IGNORECASE)
+    Searcher(patterns + patterns)
+
+
+def test_duplicate_literals_report_the_first():
+    assert spans(Searcher(['ab', 'ab'], flags=re.IGNORECASE), 'AB') == [(0, 2, 'ab')]
+
+
+def test_long_literal_does_not_recurse():
+    searcher = Searcher(['x' * 5000, 'x' * 4999 + 'y'])
+    assert spans(searcher, 'x' * 4999 + 'y')[0][:2] == (0, 5000)
+
+
+def test_regex_backreferences_in_several_patterns():
+    searcher = Searcher([r'(a)\1', r'(b)\1'], regex=True)
+    found = [(start, end, m.groups()) for start, end, _, m in searcher.finditer('xaabbab')]
+    assert found == [(1, 3, ('a',)), (3, 5, ('b',))]
+
+
+def test_regex_duplicate_group_names():
+    searcher = Searcher([r'(?P<n>a)x', r'(?P<n>b)y'], regex=True)
+    assert [m.group('n') for *_, m in searcher.finditer('axby')] == ['a', 'b']
+
+
+def test_regex_pattern_order_matches_alternation():
+    patterns = [r'b(?=c)', r'(a)b', r'ab(c)']
+    separate = Searcher(patterns + [r'(z)\1'], regex=True)
+    combined = Searcher(patterns, regex=True)
+    text = 'abcabxab'
+    assert spans(separate, text)[:3] == spans(combined, text) == [(0, 2, '(a)b'), (3, 5, '(a)b'), (6, 8, '(a)b')]
+
+
+def test_find_across_runs(make_docx):
+    with Docx.open(make_docx(SPLIT)) as docx:
+        matches = docx.find(['brown', 'Head'])
+    assert [(m.part, m.paragraph, m.para_id, m.start, m.end, m.text) for m in matches] == [
+        ('word/document.xml', 0, '00000001', 10, 15, 'brown'),
+        ('word/header1.xml', 0, '7F000001', 0, 4, 'Head'),
+    ]
+
+
+def test_matches_do_not_cross_paragraphs(make_docx):
+    with Docx.open(make_docx(SPLIT)) as docx:
+        assert docx.find('fox\na') == []
+        assert docx.find(r'fox\sa', regex=True) == []
+
+
+GREEDY = paragraph('Total: 12 ', '00000001') + paragraph('34 items', '00000002')
+
+
+@pytest.mark.parametrize('pattern, expected', [
+    (r'\d+\s*', [(0, 7, 10, '12 '), (1, 0, 3, '34 ')]),
+    (r'^\d+', [(1, 0, 2, '34')]),
+    (r'\d+\s*$', [(0, 7, 10, '12 ')]),
+    (r'[^:]+', [(0, 0, 5, 'Total'), (0, 6, 10, ' 12 '), (1, 0, 8, '34 items')]),
+    (r'(?<=s)\b', []),
+    (r'(?<![a-z] )\d+', [(0, 7, 9, '12'), (1, 0, 2, '34')]),
+], ids=['greedy', 'start-anchor', 'end-anchor', 'negated-class', 'empty', 'lookbehind'])
+def test_regex_matches_each_paragraph(make_docx, pattern, expected):
+    with Docx.open(make_docx(GREEDY)) as docx:
+        matches = [m for m in docx.find(pattern, regex=True) if m.part == 'word/document.xml']
+    assert [(m.paragraph, m.start, m.end, m.text) for m in matches] == expected
+
+
+def test_replace_greedy_and_anchored_regex(make_docx):
+    with Docx.open(make_docx(GREEDY)) as docx:
+        assert docx.replace({r'^\w+': r'<\g<0>>', r'\d+\s*$': '#'}, regex=True, parts=[docx.document]) == 3
+        assert [p.text for p in docx.paragraphs] == ['<Total>: #', '<34> items']
+
+
+def test_replace_literals_ignoring_case_uses_each_replacement(make_docx):
+    with Docx.open(make_docx(paragraph('FOO bar Bar', '00000001'))) as docx:
+        assert docx.replace({'foo': 'x', 'BAR': 'y'}, flags=re.IGNORECASE) == 3
+        assert docx.paragraphs[0].text == 'x y y'
+        with pytest.raises(ValueError):
+            docx.replace({'Foo': 'A', 'foo': 'B'}, flags=re.IGNORECASE)
+
+
+def test_replace_with_lookbehind_and_backreference(make_docx):
+    with Docx.open(make_docx(SPLIT)) as docx:
+        assert docx.replace(r'(?<=a )(b)b', r'[\1]', regex=True) == 1
+        assert docx.paragraphs[1].text == 'a [b] and a cc'
+
+
+def test_replace_several_regexes_with_backreferences(make_docx):
+    with Docx.open(make_docx(SPLIT)) as docx:
+        assert docx.replace({r'(b)\1': r'<\1>', r'(c)\1': r'{\1}'}, regex=True) == 2
+        assert docx.paragraphs[1].text == 'a <b> and a {c}'
+
+
+def test_replace_literals_keeps_first_run_format(make_docx):
+    with Docx.open(make_docx(SPLIT)) as docx:
+        assert docx.replace({'quick brown': 'slow red', 'Head': lambda m: m.text.upper()}) == 2
+        runs = docx.paragraphs[0].runs
+        assert [r.text for r in runs] == ['The slow red', ' fox']
+        assert runs[0].rpr.bold is True
+        assert docx.headers[0].readonly_element.find('.//{%s}t' % W_NS).text == 'HEAD'
+
+
+def test_empty_patterns_are_rejected():
+    with pytest.raises(ValueError):
+        Searcher([''])
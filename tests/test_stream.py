@@ -0,0 +1,53 @@
+import io
+
+from docx import Docx, ParseCache
+from docx.stream import iter_paragraphs
+from factory import paragraph
+
+WPS = 'http://schemas.microsoft.com/office/word/2010/wordprocessingShape'
+
+
+def text_box(*paragraphs):
+    return ('<w:r><w:drawing><wps:txbx xmlns:wps="%s"><w:txbxContent>%s</w:txbxContent></wps:txbx></w:drawing></w:r>'
+            % (WPS, ''.join(paragraphs)))
+
+
+BODY = (
+    paragraph('Before', '00000001')
+    + '<w:p w14:paraId="00000002"><w:r><w:t>Outer</w:t></w:r>%s<w:r><w:t xml:space="preserve"> end</w:t></w:r></w:p>'
+    % text_box(paragraph('Box one', '00000003'),
+               '<w:p w14:paraId="00000004"><w:r><w:t>Box two</w:t></w:r>%s</w:p>' % text_box(paragraph('Inner', '00000005')))
+    + paragraph('After', '00000006')
+)
+EXPECTED = [(0, '00000001', 'Before'), (1, '00000002', 'Outer end'), (2, '00000003', 'Box one'),
+            (3, '00000004', 'Box two'), (4, '00000005', 'Inner'), (5, '00000006', 'After')]
+
+
+def rows(views):
+    return [(view.index, view.para_id, view.text) for view in views]
+
+
+def test_streamed_paragraphs_in_document_order(make_docx):
+    with Docx.open(make_docx(BODY), cache=False) as docx:
+        assert not docx.document.loaded
+        assert rows(docx.iter_paragraphs()) == EXPECTED
+
+
+def test_stream_and_loaded_tree_agree(make_docx, tmp_path):
+    path = make_docx(BODY)
+    cache = ParseCache(tmp_path / 'cache')
+    for _ in range(2):
+        with Docx.open(path, cache=cache) as docx:
+            assert rows(docx.iter_paragraphs()) == EXPECTED
+    assert cache.hits == 1
+    with Docx.open(path, cache=False) as docx:
+        docx.document.readonly_element
+        assert rows(docx.iter_paragraphs()) == EXPECTED
+        assert [m.paragraph for m in docx.find('Inner')] == [4]
+
+
+def test_iter_paragraphs_without_nesting():
+    xml = ('<w:body xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+           '<w:p><w:r><w:t> a </w:t></w:r></w:p><w:tbl><w:tr><w:tc><w:p><w:r><w:t xml:space="preserve"> b </w:t></w:r></w:p>'
+           '</w:tc></w:tr></w:tbl></w:body>')
+    assert [(view.index, view.text) for view in iter_paragraphs(io.BytesIO(xml.encode()))] == [(0, 'a'), (1, ' b ')]
@@ -0,0 +1,68 @@
+from docx import Docx, StyleSheet
+from docx.font import Font
+
+STYLES = (
+    '<w:docDefaults><w:rPrDefault><w:rPr><w:rFonts w:ascii="Calibri" w:eastAsia="SimSun"/>'
+    '<w:sz w:val="21"/></w:rPr></w:rPrDefault></w:docDefaults>'
+    '<w:style w:type="paragraph" w:default="1" w:styleId="Normal"><w:rPr><w:color w:val="111111"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Heading1"><w:basedOn w:val="Normal"/>'
+    '<w:rPr><w:rFonts w:ascii="Arial"/><w:b/><w:sz w:val="32"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="Title"><w:basedOn w:val="Heading1"/><w:rPr><w:i/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="LoopA"><w:basedOn w:val="LoopB"/><w:rPr><w:kern w:val="2"/></w:rPr></w:style>'
+    '<w:style w:type="paragraph" w:styleId="LoopB"><w:basedOn w:val="LoopA"/></w:style>'
+    '<w:style w:type="character" w:styleId="Strong"><w:rPr><w:b/><w:color w:val="FF0000"/></w:rPr></w:style>'
+)
+
+
+def body():
+    return (
+        '<w:p><w:pPr><w:pStyle w:val="Title"/></w:pPr>'
+        '<w:r><w:t>plain</w:t></w:r>'
+        '<w:r><w:rPr><w:rStyle w:val="Strong"/></w:rPr><w:t>strong</w:t></w:r>'
+        '<w:r><w:rPr><w:rStyle w:val="Strong"/><w:b/><w:sz w:val="40"/></w:rPr><w:t>direct</w:t></w:r></w:p>'
+        '<w:p><w:r><w:t>normal</w:t></w:r></w:p>'
+    )
+
+
+def test_based_on_chain_and_defaults(make_docx):
+    with Docx.open(make_docx(body(), styles=STYLES), cache=False) as docx:
+        sheet = docx.style_sheet
+        title = sheet.resolve('Title')
+        assert title.font == Font('Arial', '', 'SimSun', '')
+        assert (title.bold, title.italic, title.size, title.color) == (True, True, 32, '111111')
+        assert sheet.resolve(None).color == '111111'
+        assert sheet.resolve('Missing') is sheet.resolve(None)
+
+
+def test_character_style_toggles_and_direct_format(make_docx):
+    with Docx.open(make_docx(body(), styles=STYLES), cache=False) as docx:
+        sheet = docx.style_sheet
+        plain, strong, direct = sheet.resolve_paragraph(docx.paragraphs[0].element)
+        assert plain.bold is True
+        # 段落样式和字符样式都加粗时相互抵消，直接格式为绝对值
+        assert (strong.bold, strong.color, strong.size) == (False, 'FF0000', 32)
+        assert (direct.bold, direct.size) == (True, 40)
+        normal, = sheet.resolve_paragraph(docx.paragraphs[1].element)
+        assert (normal.bold, normal.size) == (None, 21)
+
+
+def test_resolved_formats_are_shared(make_docx):
+    with Docx.open(make_docx(body() + body(), styles=STYLES), cache=False) as docx:
+        sheet = docx.style_sheet
+        first = sheet.resolve_paragraph(docx.paragraphs[0].element)
+        again = sheet.resolve_paragraph(docx.paragraphs[2].element)
+        assert all(a is b for a, b in zip(first, again))
+        assert sheet.flatten('Title') is sheet.flatten('Title')
+        sheet.clear_cache()
+        assert sheet.resolve('Title') == first[0]
+
+
+def test_based_on_cycle_terminates(make_docx):
+    with Docx.open(make_docx(body(), styles=STYLES), cache=False) as docx:
+        assert docx.style_sheet.resolve('LoopA').kern == 2
+
+
+def test_without_styles_part():
+    sheet = StyleSheet()
+    assert sheet.resolve('Heading1').bold is None
+    assert sheet.num_pr('Heading1') == (None, None)
@@ -0,0 +1,95 @@
+import io
+import zipfile
+
+import pytest
+
+from docx import Docx, Template
+from factory import member_crcs, paragraph
+
+BODY = (
+    '<w:p w14:paraId="00000001"><w:r><w:t xml:space="preserve">Dear {{na</w:t></w:r>'
+    '<w:r><w:rPr><w:b/></w:rPr><w:t>me}}, you owe {{amount}}.</w:t></w:r></w:p>'
+    + paragraph('Static text', '00000002')
+)
+HEADER = paragraph('Ref {{ref.id}}', '7F000001')
+
+
+@pytest.fixture
+def template(make_docx):
+    with Template(make_docx(BODY, header=HEADER)) as template:
+        yield template
+
+
+def texts(data):
+    with Docx.open(io.BytesIO(data)) as docx:
+        return [p.text for p in docx.paragraphs], [p.text for p in docx.iter_header_paragraphs()]
+
+
+def test_placeholders(template):
+    assert template.names == ['name', 'amount', 'ref.id']
+    name = template.placeholders[0]
+    assert (name.part, name.paragraph, name.start, name.end, name.run, name.offset) == (
+        'word/document.xml', 0, 5, 13, 0, 5)
+
+
+def test_render(template):
+    data = template.render({'name': 'Ann & Bob', 'amount': 3, 'ref.id': 'X-1'})
+    assert texts(data) == (['Dear Ann & Bob, you owe 3.', 'Static text'], ['Ref X-1'])
+    with pytest.raises(KeyError):
+        template.render({'name': 'Ann'})
+
+
+def test_missing_values_write_nothing(template, tmp_path):
+    target = tmp_path / 'out.docx'
+    with pytest.raises(KeyError, match='amount'):
+        template.render({'name': 'Ann'}, target)
+    assert not target.exists()
+    buffer = io.BytesIO()
+    with pytest.raises(KeyError):
+        template.render({'name': 'Ann', 'amount': 1}, buffer)
+    assert buffer.getvalue() == b''
+    records = [{'name': 'A', 'amount': 1, 'ref.id': 1}, {'name': 'B'}]
+    with pytest.raises(KeyError):
+        list(template.render_many(records, out_dir=str(tmp_path / 'many'), filename='{name}.docx', workers=1))
+    assert sorted(p.name for p in (tmp_path / 'many').iterdir()) == ['A.docx']
+
+
+class Unprintable:
+    def __str__(self):
+        raise RuntimeError('no text')
+
+
+def test_failed_render_keeps_existing_file(template, tmp_path):
+    target = tmp_path / 'out.docx'
+    target.write_bytes(b'previous')
+    with pytest.raises(RuntimeError):
+        template.render({'name': 'A', 'amount': Unprintable(), 'ref.id': 1}, target)
+    assert target.read_bytes() == b'previous'
+    assert not list(tmp_path.glob('.*.tmp'))
+
+
+def test_unchanged_members_are_copied(template, make_docx, tmp_path):
+    target = tmp_path / 'out.docx'
+    template.render({'name': 'A', 'amount': 1, 'ref.id': 2}, str(target))
+    crcs = member_crcs(target)
+    source = member_crcs(make_docx(BODY, header=HEADER, name='source.docx'))
+    assert crcs['word/media/image1.png'] == source['word/media/image1.png']
+    assert crcs['word/document.xml'] != source['word/document.xml']
+
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_render_many_to_files(template, tmp_path, workers):
+    records = [{'name': 'N%d' % n, 'amount': n, 'ref.id': n, 'index': 'ignored'} for n in range(5)]
+    paths = list(template.render_many(records, out_dir=str(tmp_path / 'out'),
+                                      filename='{index:02d}-{name}.docx', workers=workers, chunksize=2))
+    assert [path.rsplit('/', 1)[-1] for path in paths] == ['%02d-N%d.docx' % (n, n) for n in range(5)]
+    for n, path in enumerate(paths):
+        with open(path, 'rb') as fh:
+            assert texts(fh.read())[0][0] == 'Dear N%d, you owe %d.' % (n, n)
+
+
+def test_render_many_bytes(template):
+    records = ({'name': name, 'amount': 0, 'ref.id': ''} for name in 'xyz')
+    results = list(template.render_many(records, workers=1))
+    assert [texts(data)[0][0] for data in results] == ['Dear %s, you owe 0.' % name for name in 'xyz']
+    assert all(zipfile.is_zipfile(io.BytesIO(data)) for data in results)
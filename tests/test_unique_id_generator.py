@@ -0,0 +1,65 @@
+import pytest
+
+from docx import UniqueIDGenerator
+
+
+def test_skips_existing_ids():
+    generator = UniqueIDGenerator(['00000002', '00000003', 'zz', '80000000'])
+    assert [generator.generate_unique_id() for _ in range(3)] == ['00000001', '00000004', '00000005']
+    assert len(generator) == 5
+
+
+def test_reserve_fills_gaps():
+    generator = UniqueIDGenerator(['00000003', '00000005'])
+    assert generator.reserve(4) == ['00000001', '00000002', '00000004', '00000006']
+    assert generator.generate_unique_id() == '00000007'
+
+
+def test_add_ahead_of_cursor():
+    generator = UniqueIDGenerator()
+    generator.generate_unique_id()
+    generator.add('00000002')
+    assert generator.generate_unique_id() == '00000003'
+
+
+def test_add_below_start_keeps_cursor_consistent():
+    generator = UniqueIDGenerator(['00000011'], start=0x10)
+    assert generator.generate_unique_id() == '00000010'
+    generator.add('00000005')
+    assert '00000005' in generator
+    assert generator.generate_unique_id() == '00000012'
+    assert len(generator) == 4
+    generator.reset()
+    assert generator.generate_unique_id() == '00000010'
+
+
+def test_state_round_trip():
+    generator = UniqueIDGenerator(['00000002'])
+    generator.generate_unique_id()
+    restored = UniqueIDGenerator.from_bytes(generator.to_bytes())
+    assert restored.generate_unique_id() == '00000003'
+    with pytest.raises(ValueError):
+        UniqueIDGenerator.from_bytes(b'XXXX' + generator.to_bytes()[4:])
+
+
+def test_update_matches_repeated_add():
+    values = ['%08X' % n for n in (0x30, 0x05, 0x12, 0x12, 0x11, 0x40)] + ['zz', '00000000']
+    added = UniqueIDGenerator(['00000013'], start=0x10)
+    updated = UniqueIDGenerator(['00000013'], start=0x10)
+    for generator in (added, updated):
+        generator.generate_unique_id()
+    for value in values:
+        added.add(value)
+    updated.update(values)
+    assert updated.to_bytes() == added.to_bytes()
+    assert len(updated) == len(added)
+    assert updated.reserve(5) == added.reserve(5) == ['00000014', '00000015', '00000016', '00000017', '00000018']
+    updated.reset()
+    assert updated.generate_unique_id() == '00000010'
+
+
+def test_update_in_bulk():
+    generator = UniqueIDGenerator()
+    generator.update('%08X' % n for n in range(200_000, 0, -1))
+    assert len(generator) == 200_000
+    assert generator.generate_unique_id() == '00030D41'
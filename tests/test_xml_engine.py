@@ -0,0 +1,63 @@
+import io
+import zipfile
+
+import pytest
+
+from docx import Docx, xml_engine
+from factory import paragraph
+
+NESTED = (
+    b'<a:r xmlns:a="urn:a" xmlns:b="urn:b"><a:body>t<a:p/>x<a:p xmlns:c="urn:c"><c:q/></a:p>'
+    b'<a:p xmlns:b="urn:other"><b:q/></a:p><b:z>&amp;&lt;</b:z></a:body>\n</a:r>'
+)
+
+
+class Writes(io.StringIO):
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    def write(self, data):
+        self.calls += 1
+        return super().write(data)
+
+
+def test_engine_matches_fixture(engine):
+    assert xml_engine.engine is engine
+    assert xml_engine.fromstring(b'<a/>').tag == 'a'
+
+
+def test_write_streams_and_round_trips(engine):
+    body = ''.join(paragraph('paragraph %d' % n, '%08X' % (n + 1)) for n in range(50))
+    root = xml_engine.fromstring(('<w:document xmlns:w="urn:w" xmlns:w14="urn:w14"><w:body>%s</w:body></w:document>'
+                                  % body).encode())
+    writer = Writes()
+    xml_engine.write(root, writer)
+    if engine.name == 'lxml':
+        assert writer.calls > 50
+    assert writer.getvalue() == xml_engine.tostring(root)
+
+
+def test_write_keeps_namespace_scoping(engine):
+    root = xml_engine.fromstring(NESTED)
+    writer = io.StringIO()
+    xml_engine.write(root, writer)
+    again = xml_engine.fromstring(writer.getvalue().encode())
+    assert xml_engine.tostring(again) == xml_engine.tostring(root)
+    assert [e.tag for e in again.iter()] == [e.tag for e in root.iter()]
+
+
+def test_save_keeps_ignorable_prefixes(make_docx, tmp_path):
+    target = tmp_path / 'out.docx'
+    with Docx.open(make_docx()) as docx:
+        docx.paragraphs[0].runs[0].text = 'edited'
+        docx.save(target)
+    with zipfile.ZipFile(target) as z:
+        head = z.read('word/document.xml')[:600]
+    assert b'mc:Ignorable="w14 w15"' in head
+    assert b'xmlns:w15=' in head
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        xml_engine.select('expat')
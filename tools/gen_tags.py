@@ -0,0 +1,121 @@
+"""
+生成 src/docx/tags.py：WordprocessingML 元素名、属性名的 Clark 形式常量和预编译的查找路径。
+
+    python tools/gen_tags.py
+
+需要新的标签时在下面的表中添加，然后重新运行本脚本。
+常量名为 ``前缀_本地名``，驼峰按单词拆分，开头单个小写字母不拆：
+pStyle -> W_PSTYLE，commentRangeStart -> W_COMMENT_RANGE_START，paraId -> W14_PARA_ID。
+"""
+import os
+import re
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'src'))
+
+from docx.golbal import NAMESPACES  # noqa: E402
+
+OUTPUT = os.path.join(ROOT, 'src', 'docx', 'tags.py')
+
+EXTRA_NAMESPACES = {
+    'xml': 'http://www.w3.org/XML/1998/namespace',
+}
+
+ELEMENTS = {
+    'w': [
+        # 文档结构
+        'document', 'body', 'p', 'r', 't', 'tab', 'br', 'cr', 'instrText', 'delText',
+        'pPr', 'rPr', 'pStyle', 'rStyle', 'sectPr', 'tbl', 'tr', 'tc', 'drawing', 'txbxContent',
+        # 可以包含 w:r 的容器和修订
+        'hyperlink', 'ins', 'del', 'moveFrom', 'moveTo', 'smartTag', 'fldSimple', 'customXml',
+        'sdt', 'sdtContent', 'dir', 'bdo',
+        # 格式
+        'rFonts', 'b', 'i', 'iCs', 'color', 'spacing', 'kern', 'sz', 'szCs', 'highlight', 'ind', 'jc',
+        # 批注、脚注、页眉页脚
+        'comments', 'comment', 'commentRangeStart', 'commentRangeEnd', 'commentReference',
+        'annotationRef', 'footnote', 'endnote', 'hdr', 'ftr',
+        # 编号
+        'numbering', 'abstractNum', 'abstractNumId', 'num', 'numPr', 'numId', 'ilvl', 'lvl',
+        'start', 'numFmt', 'lvlText', 'lvlRestart', 'lvlJc', 'lvlOverride', 'startOverride',
+        'nsid', 'multiLevelType', 'numStyleLink', 'styleLink', 'isLgl', 'numIdMacAtCleanup',
+        # w:pPr 中排在 w:numPr 之前的元素
+        'keepNext', 'keepLines', 'pageBreakBefore', 'framePr', 'widowControl',
+        # 样式
+        'styles', 'style', 'name', 'basedOn', 'link', 'next', 'docDefaults',
+        'rPrDefault', 'pPrDefault',
+    ],
+    'w15': ['commentsEx', 'commentEx'],
+    'mc': ['AlternateContent', 'Choice', 'Fallback'],
+}
+
+ATTRIBUTES = {
+    'w': ['val', 'id', 'ascii', 'hAnsi', 'eastAsia', 'hint', 'author', 'date', 'initials',
+          'type', 'styleId', 'default', 'left', 'hanging', 'asciiTheme', 'hAnsiTheme', 'eastAsiaTheme'],
+    'w14': ['paraId', 'textId'],
+    'w15': ['paraId', 'paraIdParent', 'done'],
+    'xml': ['space'],
+    'r': ['id', 'embed'],
+    'mc': ['Ignorable'],
+}
+
+# 多级查找路径，以 ``前缀:本地名`` 书写
+PATHS = {
+    'PATH_PSTYLE': 'w:pPr/w:pStyle',
+    'PATH_RSTYLE': 'w:rPr/w:rStyle',
+    'PATH_NUM_PR': 'w:pPr/w:numPr',
+}
+
+_WORD_RE = re.compile(r'^[a-z]+|[A-Z][a-z]*|\d+')
+
+
+def constant_name(prefix: str, local: str) -> str:
+    words = _WORD_RE.findall(local)
+    if len(words) > 1 and len(words[0]) == 1 and words[0].islower():
+        words[:2] = [words[0] + words[1]]
+    return '%s_%s' % (prefix.upper(), '_'.join(words).upper())
+
+
+def clark(prefixed: str, namespaces: dict) -> str:
+    prefix, local = prefixed.split(':')
+    return '{%s}%s' % (namespaces[prefix], local)
+
+
+def render() -> str:
+    namespaces = dict(NAMESPACES, **EXTRA_NAMESPACES)
+    lines = [
+        '# 由 tools/gen_tags.py 生成，请勿手工修改。',
+        '# Clark 形式（{命名空间}本地名）的元素名、属性名常量和预编译的查找路径。',
+        '',
+    ]
+    for prefix in sorted(set(ELEMENTS) | set(ATTRIBUTES)):
+        lines.append('%s_NS = %r' % (prefix.upper(), namespaces[prefix]))
+    seen: dict[str, str] = {}
+    for title, table in (('元素', ELEMENTS), ('属性', ATTRIBUTES)):
+        lines.extend(['', '# ' + title])
+        for prefix, names in table.items():
+            for local in names:
+                name = constant_name(prefix, local)
+                value = '{%s}%s' % (namespaces[prefix], local)
+                if name in seen:
+                    if seen[name] != value:
+                        raise ValueError('constant %s is ambiguous' % name)
+                    continue
+                seen[name] = value
+                lines.append('%s = %r' % (name, value))
+    lines.extend(['', '# 查找路径'])
+    for name, path in PATHS.items():
+        lines.append('%s = %r' % (name, '/'.join(clark(step, namespaces) for step in path.split('/'))))
+    lines.append('')
+    return '\n'.join(lines)
+
+
+def main() -> int:
+    with open(OUTPUT, 'w', encoding='utf-8', newline='\n') as fh:
+        fh.write(render())
+    print('wrote %s' % os.path.relpath(OUTPUT, ROOT))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())